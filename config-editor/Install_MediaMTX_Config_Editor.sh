@@ -62,13 +62,15 @@ echo "Step 1: Installing Python Dependencies"
 echo "=========================================="
 
 apt-get update -qq > /dev/null 2>&1
-apt-get install -y python3 python3-pip python3-psutil > /dev/null 2>&1 || apt-get install -y python3 python3-pip python3-psutil
+apt-get install -y python3 python3-pip python3-psutil python3-yaml > /dev/null 2>&1 || apt-get install -y python3 python3-pip python3-psutil python3-yaml
 echo "✓ Python3 and pip installed"
 
 # Install required Python packages
 echo "Installing Flask and dependencies..."
 pip3 install Flask ruamel.yaml requests psutil 2>&1 | grep -v "already satisfied" || true
 echo "✓ Python packages installed (Flask, ruamel.yaml, requests, psutil)"
+# Optional speedups - the editor falls back to the standard library without them
+pip3 install orjson waitress brotli 2>&1 | grep -v "already satisfied" || true
 
 echo ""
 echo "=========================================="
@@ -5,8 +5,11 @@ Drone Video Streaming Infrastructure for Emergency Services
 https://github.com/takwerx/mediamtx-installer
 """
 
-from flask import Flask, render_template_string, request, jsonify, redirect, url_for, session, send_file, Response
-from functools import wraps
+from flask import Flask, render_template, make_response, request, jsonify, redirect, url_for, session, send_file, Response, stream_with_context
+from functools import wraps, lru_cache
+from werkzeug.security import generate_password_hash, check_password_hash
+from markupsafe import Markup
+from jinja2 import FileSystemBytecodeCache
 from ruamel.yaml import YAML
 from ruamel.yaml.scalarstring import DoubleQuotedScalarString
 import os
@@ -14,23 +17,173 @@ import subprocess
 import time
 from datetime import datetime, timedelta
 import secrets
+import hmac
 import json
 import re
 import socket
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
 from urllib.parse import urlparse
-import psutil  # For system metrics
+try:
+    # libyaml-backed loader for read-only lookups; ruamel stays for round-trip saves
+    from yaml import load as _fast_yaml_load, CSafeLoader as _FastYAMLLoader
+except ImportError:
+    _fast_yaml_load = None
+try:
+    import orjson  # Optional: faster JSON for API responses and state files
+except ImportError:
+    orjson = None
+try:
+    import brotli  # Optional: smaller compressed pages than gzip
+except ImportError:
+    brotli = None
+from flask.json.provider import DefaultJSONProvider
+
+class OrjsonProvider(DefaultJSONProvider):
+    """jsonify()/get_json() through orjson when installed, stdlib json otherwise"""
+
+    def _orjson_bytes(self, obj, indent=False):
+        """UTF-8 JSON from orjson, or None to fall back to the stdlib encoder"""
+        if orjson is None:
+            return None
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            return None  # something orjson can't handle - let the stdlib encoder try
+
+    def dumps(self, obj, **kwargs):
+        data = self._orjson_bytes(obj, kwargs.get('indent'))
+        if data is not None:
+            return data.decode('utf-8')
+        return super().dumps(obj, **kwargs)
+
+    def response(self, *args, **kwargs):
+        # orjson already gives bytes - hand them to the response as-is rather
+        # than decoding to str for Flask to encode straight back
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        data = self._orjson_bytes(obj, indent)
+        if data is None:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(data + b'\n', mimetype=self.mimetype)
+
+    def loads(self, s, **kwargs):
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
 
 app = Flask(__name__)
-app.secret_key = secrets.token_hex(32)  # Generate secure secret key
+app.json = OrjsonProvider(app)
+
+# Compiled templates are also kept on disk, so the first page load after a
+# restart reads bytecode instead of parsing ~10k lines of template source.
+# Entries are checked against the template source, so upgrades invalidate them.
+TEMPLATE_CACHE_DIR = '/opt/mediamtx-webeditor/cache/jinja'
+# The templates are strings in this file, so nothing ever needs re-checking;
+# set before the first app.jinja_env access, which is when Flask reads it
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(TEMPLATE_CACHE_DIR)
+
+SECRET_KEY_FILE = '/opt/mediamtx-webeditor/.secret_key'
+
+def _load_or_create_secret(path):
+    """Read the session signing key, generating and persisting it on first run"""
+    try:
+        with open(path, 'r') as f:
+            key = f.read().strip()
+        if key:
+            return key
+    except OSError:
+        pass
+    key = secrets.token_hex(32)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(key)
+    except FileExistsError:
+        # Another worker created it first - use theirs so sessions are shared
+        with open(path, 'r') as f:
+            return f.read().strip() or key
+    except OSError as e:
+        print(f"Warning: could not save session key to {path}: {e} - logins reset on restart", flush=True)
+    return key
+
+# Stable across restarts and workers; MEDIAMTX_WEBEDITOR_SECRET_KEY overrides the key file
+app.secret_key = os.environ.get('MEDIAMTX_WEBEDITOR_SECRET_KEY') or _load_or_create_secret(SECRET_KEY_FILE)
 
 @app.after_request
 def add_no_cache_headers(response):
-    if 'text/html' in response.content_type:
+    # Pages that carry an ETag set their own revalidation headers
+    if 'text/html' in (response.content_type or '') and 'ETag' not in response.headers:
         response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
         response.headers['Pragma'] = 'no-cache'
         response.headers['Expires'] = '0'
     return response
 
+# Text responses above this size are sent compressed when the browser accepts it
+COMPRESS_MIN_SIZE = 1024
+COMPRESSIBLE_TYPES = ('text/html', 'text/plain', 'text/css', 'application/json', 'application/javascript')
+_compressed_bodies = OrderedDict()
+_compressed_bodies_lock = threading.Lock()
+
+def compress_body(data, encoding, reused=False):
+    """Compress bytes for Content-Encoding; bodies that will be reused get the slower, smaller setting"""
+    if encoding == 'br':
+        # quality 11 saves another ~10% on the main page but takes over a second
+        return brotli.compress(data, quality=9 if reused else 5)
+    import gzip
+    return gzip.compress(data, compresslevel=9 if reused else 6)
+
+@app.after_request
+def compress_response(response):
+    """gzip (brotli when installed) HTML/JSON/text bodies for browsers that accept it"""
+    # Pages rendered from a query string (?message=... after a save) go out uncompressed:
+    # they echo request text next to secrets such as the SRT passphrases, and compressing
+    # the two together lets the response size leak the secret (BREACH)
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_TYPES
+            or (response.mimetype == 'text/html' and request.args)):
+        return response
+    response.vary.add('Accept-Encoding')
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        encoding = 'br'
+    elif accepted['gzip']:
+        encoding = 'gzip'
+    else:
+        return response
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+    
+    # Bodies with an ETag (the main page) come back identical - compress those once
+    etag = response.get_etag()[0]
+    if etag is None:
+        compressed = compress_body(data, encoding)
+    else:
+        key = (etag, encoding)
+        with _compressed_bodies_lock:
+            compressed = _compressed_bodies.get(key)
+            if compressed is not None:
+                _compressed_bodies.move_to_end(key)
+        if compressed is None:
+            compressed = compress_body(data, encoding, reused=True)
+            with _compressed_bodies_lock:
+                _compressed_bodies[key] = compressed
+                while len(_compressed_bodies) > 2 * PAGE_CACHE_SIZE:  # br + gzip per cached page
+                    _compressed_bodies.popitem(last=False)
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    return response
+
 # Version - used by auto-update checker
 CURRENT_VERSION = "v2.0.8"
 GITHUB_REPO = "takwerx/mediamtx-installer"
@@ -57,9 +210,31 @@ THEME_CONFIG_FILE = '/opt/mediamtx-webeditor/theme_config.json'
 LOGO_FILE = '/opt/mediamtx-webeditor/agency_logo'
 SHARE_LINKS_FILE = '/opt/mediamtx-webeditor/share_links.json'
 SHARE_MODE_FILE = '/opt/mediamtx-webeditor/share_mode.json'
+USERS_FILE = '/opt/mediamtx-webeditor/users.json'
+# Worker threads when served by waitress (each open Live Logs tab holds one, and
+# each open dashboard one more, up to DASHBOARD_STREAM_MAX_CLIENTS)
+WEB_SERVER_THREADS = int(os.environ.get('MEDIAMTX_WEBEDITOR_THREADS', '16'))
 # Ku-band simulator scripts (run on receiver to impair incoming stream traffic)
 SIMULATOR_DIR = os.environ.get('MEDIAMTX_SIMULATOR_DIR', '/opt/mediamtx-webeditor/ku-band-simulator')
 
+# Caddy-issued cert paths look like .../<domain>/<domain>.crt
+_CERT_DOMAIN_RE = re.compile(r'/([a-z0-9.-]+\.[a-z]{2,})/\1\.crt')
+_HLS_ENC_RE = re.compile(r'\s*hlsEncryption:(.*)')
+_HLS_CERT_RE = re.compile(r'hlsServerCert:(.*)')
+_HEX_COLOR_RE = re.compile(r'^#[0-9a-fA-F]{6}$')
+_SOURCE_NAME_RE = re.compile(r'^[a-z0-9_]+$')
+_VERSION_RE = re.compile(r'v?(\d+\.\d+\.\d+)')
+_UNKNOWN_FIELD_RE = re.compile(r'unknown field "([^"]+)"')
+_PORT_RE = re.compile(r':(\d+)')
+_ROUTE_DEV_RE = re.compile(r'\bdev\s+(\S+)')
+_LINK_NAME_RE = re.compile(r'^\d+:\s+(\S+):')
+_SOURCE_IP_LINE_RE = re.compile(r'^SOURCE_IP=.*', re.MULTILINE)
+_INTERFACE_LINE_RE = re.compile(r'^INTERFACE=.*', re.MULTILINE)
+
+def _path_entry_re(name):
+    """Regex for the "  name:" line that opens a path block under paths:"""
+    return re.compile(r'^  ' + re.escape(name) + r':\s*$')
+
 # Default theme colors
 DEFAULT_THEME = {
     'headerColor': '#1e3a8a',
@@ -69,88 +244,221 @@ DEFAULT_THEME = {
     'subtitle': 'Brought to you by TAKWERX'
 }
 
-def load_theme():
-    """Load theme settings from JSON file"""
-    if os.path.exists(THEME_CONFIG_FILE):
+# Styling tab quick presets - colors are (headerColor, headerColorEnd, accentColor)
+THEME_PRESETS = (
+    {'name': 'Default Blue', 'colors': (DEFAULT_THEME['headerColor'], DEFAULT_THEME['headerColorEnd'], DEFAULT_THEME['accentColor'])},
+    {'name': 'Fire Red', 'colors': ('#7f1d1d', '#451a1a', '#ef4444')},
+    {'name': 'Tactical Green', 'colors': ('#14532d', '#1a2e1a', '#22c55e')},
+    {'name': 'Alert Orange', 'colors': ('#78350f', '#451a03', '#f59e0b')},
+    {'name': 'Purple', 'colors': ('#581c87', '#2e1065', '#a855f7')},
+    {'name': 'Stealth Gray', 'colors': ('#1e293b', '#0f172a', '#64748b')},
+    {'name': 'Desert Tan', 'colors': ('#5c4a32', '#3b2f1e', '#c2a66b')},
+    {'name': 'Blackout', 'colors': ('#0a0a0a', '#000000', '#888888'), 'outlined': True},
+)
+
+@lru_cache(maxsize=8)
+def _load_json_cached(path, mtime_ns, size):
+    """Parse a JSON file once per (mtime, size) - the result is shared, copy before mutating"""
+    return read_json_file(path)
+
+def _load_json_file(path):
+    """Return the cached parse of a JSON file, re-read only when it changes on disk"""
+    st = os.stat(path)
+    return _load_json_cached(path, st.st_mtime_ns, st.st_size)
+
+def read_json_file(path):
+    """Parse a JSON state file (orjson when installed)"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def write_json_file(path, obj, mode=0o644):
+    """Atomically write a JSON state file, indented (orjson when installed)"""
+    data = None
+    if orjson is not None:
         try:
-            with open(THEME_CONFIG_FILE, 'r') as f:
-                theme = json.load(f)
-                # Merge with defaults for any missing keys
-                merged = dict(DEFAULT_THEME)
-                merged.update(theme)
-                return merged
-        except:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
             pass
-    return dict(DEFAULT_THEME)
+    if data is None:
+        data = json.dumps(obj, indent=2).encode('utf-8')
+    # Write a sibling temp file and rename it over the target, so readers never see half a file
+    import tempfile
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.tmp_')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+_DEFAULT_THEME_VIEW = MappingProxyType(dict(DEFAULT_THEME))
+
+@lru_cache(maxsize=4)
+def _merged_theme(mtime_ns, size):
+    """Theme file merged over the defaults, built once per file version"""
+    # Merge with defaults for any missing keys
+    return MappingProxyType({**DEFAULT_THEME, **read_json_file(THEME_CONFIG_FILE)})
+
+def load_theme():
+    """Load theme settings from JSON file (read-only mapping - dict() it to modify)"""
+    try:
+        st = os.stat(THEME_CONFIG_FILE)
+    except OSError:
+        return _DEFAULT_THEME_VIEW
+    try:
+        return _merged_theme(st.st_mtime_ns, st.st_size)
+    except (OSError, ValueError, TypeError) as e:
+        print(f"Warning: could not read {THEME_CONFIG_FILE}: {e}", flush=True)
+    return _DEFAULT_THEME_VIEW
 
 def save_theme(theme):
     """Save theme settings to JSON file"""
     os.makedirs(os.path.dirname(THEME_CONFIG_FILE), exist_ok=True)
-    with open(THEME_CONFIG_FILE, 'w') as f:
-        json.dump(theme, f, indent=2)
-
-# Ensure backup directory exists
-os.makedirs(BACKUP_DIR, exist_ok=True)
+    write_json_file(THEME_CONFIG_FILE, theme)
+    _merged_theme.cache_clear()
+
+_runtime_dirs_ready = False
+
+@app.before_request
+def ensure_runtime_dirs():
+    """Create backup/test-video directories on the first request instead of at import"""
+    global _runtime_dirs_ready
+    if _runtime_dirs_ready:
+        return
+    for d in (BACKUP_DIR, TEST_VIDEO_DIR):
+        try:
+            os.makedirs(d, exist_ok=True)
+        except OSError as e:
+            print(f"Warning: could not create {d}: {e}", flush=True)
+    _runtime_dirs_ready = True
 
 def load_group_metadata():
     """Load group names for MediaMTX users - maps username to group name"""
     if os.path.exists(GROUP_METADATA_FILE):
         try:
-            with open(GROUP_METADATA_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            pass
+            return dict(_load_json_file(GROUP_METADATA_FILE))
+        except (OSError, ValueError, TypeError) as e:
+            print(f"Warning: could not read {GROUP_METADATA_FILE}: {e}", flush=True)
     return {}
 
 def save_group_metadata(metadata):
     """Save group names for MediaMTX users"""
     os.makedirs(os.path.dirname(GROUP_METADATA_FILE), exist_ok=True)
-    with open(GROUP_METADATA_FILE, 'w') as f:
-        json.dump(metadata, f, indent=2)
-    os.chmod(GROUP_METADATA_FILE, 0o600)
+    write_json_file(GROUP_METADATA_FILE, metadata, mode=0o600)
+    _load_json_cached.cache_clear()
 
 def load_srt_passphrase_backup():
     """Load backed up SRT passphrases"""
     if os.path.exists(SRT_PASSPHRASE_BACKUP_FILE):
         try:
-            with open(SRT_PASSPHRASE_BACKUP_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            pass
+            return read_json_file(SRT_PASSPHRASE_BACKUP_FILE)
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not read {SRT_PASSPHRASE_BACKUP_FILE}: {e}", flush=True)
     return None
 
 def save_srt_passphrase_backup(publish_pass, read_pass):
     """Save SRT passphrases to backup file"""
     os.makedirs(os.path.dirname(SRT_PASSPHRASE_BACKUP_FILE), exist_ok=True)
-    with open(SRT_PASSPHRASE_BACKUP_FILE, 'w') as f:
-        json.dump({'publishPassphrase': publish_pass, 'readPassphrase': read_pass}, f, indent=2)
-    os.chmod(SRT_PASSPHRASE_BACKUP_FILE, 0o600)
+    write_json_file(SRT_PASSPHRASE_BACKUP_FILE, {'publishPassphrase': publish_pass, 'readPassphrase': read_pass}, mode=0o600)
 
 def clear_srt_passphrase_backup():
     """Delete the backup file"""
     if os.path.exists(SRT_PASSPHRASE_BACKUP_FILE):
         os.remove(SRT_PASSPHRASE_BACKUP_FILE)
 
+# Read-only view of mediamtx.yml, re-read only when the file changes on disk
+_yaml_cache = {}
+
+def _fast_load_yaml(text):
+    """Parse YAML for read-only use: PyYAML's C loader if available, else ruamel"""
+    if _fast_yaml_load is not None:
+        return _fast_yaml_load(text, Loader=_FastYAMLLoader)
+    return yaml.load(text)
+
+def _load_config_cached():
+    """Return (lines, parsed) for CONFIG_FILE, cached on (mtime_ns, size).
+    The result is shared between callers and must not be modified —
+    use load_config() for anything that is going to be saved back."""
+    st = os.stat(CONFIG_FILE)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _yaml_cache.get(CONFIG_FILE)
+    if cached and cached[0] == key:
+        return cached[1], cached[2]
+    with open(CONFIG_FILE, 'r') as f:
+        text = f.read()
+    lines = text.splitlines(keepends=True)
+    try:
+        parsed = _fast_load_yaml(text)
+    except Exception as e:
+        print(f"Warning: could not parse {CONFIG_FILE}: {e}", flush=True)
+        parsed = None
+    _yaml_cache[CONFIG_FILE] = (key, lines, parsed)
+    return lines, parsed
+
+def _scan_hlsviewer_password(lines):
+    """Line-scan fallback for the hlsviewer password (raw text, unparsed).
+    Single pass over the lines, stopping at the hlsviewer entry."""
+    from itertools import islice
+    it = iter(lines)
+    for line in it:
+        if 'user: hlsviewer' in line:
+            # Look for password in next few lines
+            for pass_line in islice(it, 9):
+                if 'pass:' in pass_line:
+                    return pass_line.split(':', 1)[1].strip()
+            break
+    return None
+
+def _mtime_cached(path):
+    """Cache a no-argument reader of path until the file's mtime/size changes"""
+    def deco(fn):
+        cache = {}
+        @wraps(fn)
+        def wrap():
+            try:
+                st = os.stat(path)
+            except OSError:
+                return fn()
+            key = (st.st_mtime_ns, st.st_size)
+            hit = cache.get('entry')
+            if hit is None or hit[0] != key:
+                hit = (key, fn())
+                cache['entry'] = hit
+            return hit[1]
+        wrap.cache_clear = cache.clear
+        return wrap
+    return deco
+
+@_mtime_cached(CONFIG_FILE)
 def get_hlsviewer_credential():
-    """Get hlsviewer credential by reading directly from config file"""
+    """Get hlsviewer credential from the parsed config file"""
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            lines = f.readlines()
-        
-        # Find hlsviewer user and password
-        for i, line in enumerate(lines):
-            if 'user: hlsviewer' in line:
-                # Look for password in next few lines
-                for j in range(i+1, min(i+10, len(lines))):
-                    if 'pass:' in lines[j]:
-                        pass_line = lines[j].strip()
-                        if ':' in pass_line:
-                            password = pass_line.split(':', 1)[1].strip()
-                            if password:
-                                # Ensure it's in group metadata
-                                ensure_hlsviewer_in_metadata()
-                                return {'username': 'hlsviewer', 'password': password}
-                break
+        lines, parsed = _load_config_cached()
+
+        if isinstance(parsed, dict):
+            password = None
+            for user in parsed.get('authInternalUsers') or []:
+                if isinstance(user, dict) and user.get('user') == 'hlsviewer':
+                    password = user.get('pass')
+                    break
+            # Unquoted numeric/yes-no passwords parse as non-strings - take the raw text instead
+            if password is not None and not isinstance(password, str):
+                password = _scan_hlsviewer_password(lines)
+        else:
+            password = _scan_hlsviewer_password(lines)
+
+        if password:
+            # Ensure it's in group metadata
+            ensure_hlsviewer_in_metadata()
+            return {'username': 'hlsviewer', 'password': str(password)}
         return None
     except Exception as e:
         print(f"Error reading hlsviewer credential: {e}")
@@ -167,46 +475,60 @@ def ensure_hlsviewer_in_metadata():
     except Exception as e:
         print(f"Error ensuring hlsviewer in metadata: {e}")
 
+def _scan_streaming_domain(lines):
+    """Line-scan fallback for get_streaming_domain when the YAML can't be parsed"""
+    hls_encryption_on = False
+    domain_from_cert = None
+
+    # Walk with a one-line lookahead so a wrapped cert path can be peeked at
+    it = iter(lines)
+    line = next(it, None)
+    while line is not None:
+        next_line = next(it, None)
+        match = _HLS_ENC_RE.match(line)
+        if match and match.group(1).strip().lower() in ['yes', 'true']:
+            hls_encryption_on = True
+
+        match = _HLS_CERT_RE.search(line)
+        if match:
+            cert_path = match.group(1).strip()
+
+            if not cert_path and next_line is not None:
+                peeked = next_line.strip()
+                if peeked and not peeked.startswith('#'):
+                    cert_path = peeked
+
+            if cert_path:
+                match = _CERT_DOMAIN_RE.search(cert_path)
+                if match:
+                    domain_from_cert = match.group(1)
+        line = next_line
+
+    return hls_encryption_on, domain_from_cert
+
+@_mtime_cached(CONFIG_FILE)
 def get_streaming_domain():
     """Get HLS streaming domain and protocol (works with or without certs)"""
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            lines = f.readlines()
-        
-        # First check if HLS encryption is actually enabled
-        hls_encryption_on = False
-        domain_from_cert = None
-        
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped.startswith('hlsEncryption:'):
-                value = stripped.split(':', 1)[1].strip()
-                if value.lower() in ['yes', 'true']:
-                    hls_encryption_on = True
-            
-            if 'hlsServerCert:' in line:
-                cert_path = line.split(':', 1)[1].strip() if ':' in line else ''
-                
-                if not cert_path and i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
-                    if next_line and not next_line.startswith('#'):
-                        cert_path = next_line
-                
-                if cert_path and cert_path != '':
-                    import re
-                    match = re.search(r'/([a-z0-9.-]+\.[a-z]{2,})/\1\.crt', cert_path)
-                    if match:
-                        domain_from_cert = match.group(1)
-        
+        lines, parsed = _load_config_cached()
+
+        if isinstance(parsed, dict):
+            # YAML 1.1 (libyaml) gives a bool for yes/true, ruamel keeps 'yes' as a string
+            hls_encryption_on = str(parsed.get('hlsEncryption')).lower() in ['yes', 'true']
+            match = _CERT_DOMAIN_RE.search(str(parsed.get('hlsServerCert') or ''))
+            domain_from_cert = match.group(1) if match else None
+        else:
+            hls_encryption_on, domain_from_cert = _scan_streaming_domain(lines)
+
         if domain_from_cert:
             return {
                 'domain': domain_from_cert,
                 'protocol': 'https' if hls_encryption_on else 'http'
             }
-                
+
     except Exception as e:
         print(f"Error reading streaming domain: {e}")
-    
+
     # No cert found - use HTTP (will use IP from request.host)
     return {
         'domain': None,
@@ -218,12 +540,12 @@ def is_hls_localhost_bound():
     When True, HLS URLs should use the /hls-proxy/ path so Caddy routes them
     internally to MediaMTX — port 8888 is firewalled externally in this setup."""
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            for line in f:
-                stripped = line.strip()
-                if stripped.startswith('hlsAddress:'):
-                    addr = stripped.split(':', 1)[1].strip().strip('"\'')
-                    return addr.startswith('127.0.0.1') or addr.startswith('localhost')
+        lines, _ = _load_config_cached()
+        for line in lines:
+            stripped = line.strip()
+            if stripped.startswith('hlsAddress:'):
+                addr = stripped.split(':', 1)[1].strip().strip('"\'')
+                return addr.startswith('127.0.0.1') or addr.startswith('localhost')
     except Exception:
         pass
     return False
@@ -233,8 +555,7 @@ def load_share_links():
     """Load share links from JSON file."""
     if os.path.exists(SHARE_LINKS_FILE):
         try:
-            with open(SHARE_LINKS_FILE, 'r') as f:
-                return json.load(f)
+            return read_json_file(SHARE_LINKS_FILE)
         except (json.JSONDecodeError, IOError):
             pass
     return {}
@@ -242,24 +563,21 @@ def load_share_links():
 def save_share_links(data):
     """Save share links to JSON file."""
     os.makedirs(os.path.dirname(SHARE_LINKS_FILE), exist_ok=True)
-    with open(SHARE_LINKS_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json_file(SHARE_LINKS_FILE, data)
 
 def load_share_mode():
     """Load per-stream share mode: public = static link, private = token link. Default private."""
     if os.path.exists(SHARE_MODE_FILE):
         try:
-            with open(SHARE_MODE_FILE, 'r') as f:
-                return json.load(f)
-        except Exception:
-            pass
+            return read_json_file(SHARE_MODE_FILE)
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not read {SHARE_MODE_FILE}: {e}", flush=True)
     return {}
 
 def save_share_mode(data):
     """Save per-stream share mode."""
     try:
-        with open(SHARE_MODE_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_json_file(SHARE_MODE_FILE, data)
     except Exception:
         pass
 
@@ -340,13 +658,14 @@ def admin_required(f):
 
 def load_users():
     """Load all users from JSON file"""
-    users_file = '/opt/mediamtx-webeditor/users.json'
-    if os.path.exists(users_file):
+    if os.path.exists(USERS_FILE):
         try:
-            with open(users_file, 'r') as f:
-                return json.load(f)
-        except:
-            pass
+            # Callers edit user dicts in place before save_users(), so hand out copies
+            return [dict(u) for u in _load_json_file(USERS_FILE)]
+        except (OSError, ValueError, TypeError) as e:
+            # Don't overwrite an unreadable users file with the default admin
+            print(f"Warning: could not read {USERS_FILE}: {e}", flush=True)
+            return []
     # Default admin user
     default_users = [
         {'username': 'admin', 'password': 'admin', 'role': 'admin'}
@@ -354,13 +673,30 @@ def load_users():
     save_users(default_users)
     return default_users
 
+def is_password_hash(value):
+    """True if value is a werkzeug password hash rather than a plaintext password"""
+    return isinstance(value, str) and value.startswith(('scrypt:', 'pbkdf2:')) and value.count('$') == 2
+
+def verify_password(stored, password):
+    """Check a password against a stored hash (or legacy plaintext) in constant time"""
+    if not stored or password is None:
+        return False
+    if is_password_hash(stored):
+        return check_password_hash(stored, password)
+    return hmac.compare_digest(stored.encode('utf-8'), password.encode('utf-8'))
+
+def _hash_passwords(records):
+    """Replace any plaintext 'password' values with hashes, in place"""
+    for record in records:
+        if record.get('password') and not is_password_hash(record['password']):
+            record['password'] = generate_password_hash(record['password'])
+
 def save_users(users):
-    """Save users to JSON file"""
-    users_file = '/opt/mediamtx-webeditor/users.json'
-    os.makedirs(os.path.dirname(users_file), exist_ok=True)
-    with open(users_file, 'w') as f:
-        json.dump(users, f, indent=2)
-    os.chmod(users_file, 0o600)
+    """Save users to JSON file (passwords are stored hashed)"""
+    _hash_passwords(users)
+    os.makedirs(os.path.dirname(USERS_FILE), exist_ok=True)
+    write_json_file(USERS_FILE, users, mode=0o600)
+    _load_json_cached.cache_clear()
 
 PENDING_REG_FILE = '/opt/mediamtx-webeditor/pending_registrations.json'
 
@@ -368,18 +704,16 @@ def load_pending_registrations():
     """Load pending registrations"""
     if os.path.exists(PENDING_REG_FILE):
         try:
-            with open(PENDING_REG_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            pass
+            return read_json_file(PENDING_REG_FILE)
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not read {PENDING_REG_FILE}: {e}", flush=True)
     return []
 
 def save_pending_registrations(pending):
-    """Save pending registrations"""
+    """Save pending registrations (passwords are stored hashed)"""
+    _hash_passwords(pending)
     os.makedirs(os.path.dirname(PENDING_REG_FILE), exist_ok=True)
-    with open(PENDING_REG_FILE, 'w') as f:
-        json.dump(pending, f, indent=2)
-    os.chmod(PENDING_REG_FILE, 0o600)
+    write_json_file(PENDING_REG_FILE, pending, mode=0o600)
 
 EMAIL_CONFIG_FILE = '/opt/mediamtx-webeditor/email_config.json'
 
@@ -387,18 +721,15 @@ def load_email_config():
     """Load email configuration"""
     if os.path.exists(EMAIL_CONFIG_FILE):
         try:
-            with open(EMAIL_CONFIG_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            pass
+            return read_json_file(EMAIL_CONFIG_FILE)
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not read {EMAIL_CONFIG_FILE}: {e}", flush=True)
     return {'method': 'disabled'}
 
 def save_email_config(config):
     """Save email configuration"""
     os.makedirs(os.path.dirname(EMAIL_CONFIG_FILE), exist_ok=True)
-    with open(EMAIL_CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
-    os.chmod(EMAIL_CONFIG_FILE, 0o600)
+    write_json_file(EMAIL_CONFIG_FILE, config, mode=0o600)
 
 def send_email(subject, body, to_email=None):
     """Send email using configured method. Returns (success, error_message)"""
@@ -470,13 +801,107 @@ def send_email(subject, body, to_email=None):
         print(f"✗ Email failed: {subject} → {error_msg}", flush=True)
         return False, error_msg
 
+_users_index_cache = {}
+
+def _users_index():
+    """Map username -> (password, role), rebuilt only when users.json changes"""
+    try:
+        st = os.stat(USERS_FILE)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _users_index_cache.get('entry')
+        if cached and cached[0] == key:
+            return cached[1]
+    except OSError:
+        key = None
+    idx = {}
+    for user in load_users():
+        # First entry wins, same as the old linear scan
+        idx.setdefault(user['username'], (user['password'], user['role']))
+    if key is not None:
+        _users_index_cache['entry'] = (key, idx)
+    return idx
+
 def authenticate_user(username, password):
     """Authenticate user and return role"""
-    users = load_users()
-    for user in users:
-        if user['username'] == username and user['password'] == password:
-            return user['role']
-    return None
+    stored_password, role = _users_index().get(username, (None, None))
+    if not verify_password(stored_password, password):
+        return None
+    if not is_password_hash(stored_password):
+        # Legacy plaintext users.json - hash everything now that we know this one is good
+        try:
+            save_users(load_users())
+            print(f"Migrated web editor passwords to hashed storage (login: {username})", flush=True)
+        except Exception as e:
+            print(f"Warning: could not migrate plaintext passwords: {e}", flush=True)
+    return role
+
+def default_admin_active():
+    """True while the built-in admin/admin login still works (cached per users.json version)"""
+    idx = _users_index()
+    cached = _users_index_cache.get('default_admin')
+    if cached and cached[0] is idx:
+        return cached[1]
+    active = verify_password(idx.get('admin', (None, None))[0], 'admin')
+    _users_index_cache['default_admin'] = (idx, active)
+    return active
+
+@lru_cache(maxsize=None)
+def compiled_template(source):
+    """Compile a template string once; renders reuse the parsed template.
+    Keyed on the source itself, so a replaced template string gets recompiled."""
+    env = app.jinja_env
+    if env.bytecode_cache is None:
+        return env.from_string(source)
+    # from_string() bypasses the bytecode cache (that's only wired into loaders),
+    # so look the bucket up here the same way a loader would
+    name = f'inline-{template_digest(source)}'
+    bucket = env.bytecode_cache.get_bucket(env, name, None, source)
+    code = bucket.code
+    if code is None:
+        code = env.compile(source, name)
+        bucket.code = code
+        try:
+            os.makedirs(TEMPLATE_CACHE_DIR, mode=0o700, exist_ok=True)
+            env.bytecode_cache.set_bucket(bucket)
+        except OSError as e:
+            print(f"Warning: could not write template cache: {e}", flush=True)
+    return env.template_class.from_code(env, code, env.make_globals(None))
+
+@lru_cache(maxsize=None)
+def template_digest(source):
+    """Short content hash of a template string (part of page ETags)"""
+    import hashlib
+    return hashlib.blake2b(source.encode('utf-8'), digest_size=8).hexdigest()
+
+def file_stamp(path):
+    """(mtime_ns, size) of a file, or None if it doesn't exist"""
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+def page_etag(*inputs):
+    """ETag for a rendered page, from everything it's rendered from"""
+    import hashlib
+    return hashlib.blake2b(repr(inputs).encode('utf-8'), digest_size=12).hexdigest()
+
+def not_modified(etag, weak=False):
+    """Empty 304 response carrying the given ETag"""
+    response = Response(status=304)
+    del response.headers['Content-Type']
+    response.set_etag(etag, weak=weak)
+    return response
+
+_page_css_cache = {}
+
+def render_page_css():
+    """Main page <style> block - the same for every theme, rendered once"""
+    css = _page_css_cache.get(HTML_STYLE_TEMPLATE)
+    if css is None:
+        css = Markup(compiled_template(HTML_STYLE_TEMPLATE).render())
+        _page_css_cache[HTML_STYLE_TEMPLATE] = css
+    return css
 
 # Login Page Template
 LOGIN_TEMPLATE = '''
@@ -827,18 +1252,9 @@ REGISTER_TEMPLATE = '''
 </html>
 '''
 
-# HTML Template
-HTML_TEMPLATE = '''
-<!DOCTYPE html>
-<html>
-<head>
-    <title>{{ theme.headerTitle }}</title>
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="description" content="{{ theme.subtitle }}">
-    <meta property="og:title" content="{{ theme.headerTitle }}">
-    <meta property="og:description" content="{{ theme.subtitle }}">
-    <meta property="og:type" content="website">
-    <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Material+Symbols+Outlined:opsz,wght,FILL,GRAD@24,400,1,0" />
+# Main page stylesheet - theme colors come from the --header-color, --header-color-end
+# and --accent-color custom properties set in the page head, see render_page_css()
+HTML_STYLE_TEMPLATE = '''
     <style>
         * {
             margin: 0;
@@ -863,7 +1279,7 @@ HTML_TEMPLATE = '''
         }
         
         .header {
-            background: linear-gradient(135deg, {{ theme.headerColor }} 0%, {{ theme.headerColorEnd }} 100%);
+            background: linear-gradient(135deg, var(--header-color) 0%, var(--header-color-end) 100%);
             color: white;
             padding: 30px;
             text-align: center;
@@ -1036,12 +1452,12 @@ HTML_TEMPLATE = '''
         
         /* Group label when its group is expanded */
         .sidebar-group:not(.collapsed) > .sidebar-group-label {
-            color: {{ theme.accentColor }};
+            color: var(--accent-color);
             font-weight: 700;
         }
         
         .sidebar-group:not(.collapsed) > .sidebar-group-label .sidebar-icon .material-symbols-outlined {
-            color: {{ theme.accentColor }};
+            color: var(--accent-color);
         }
         
         .sidebar-item .sidebar-label {
@@ -1055,8 +1471,8 @@ HTML_TEMPLATE = '''
         
         .sidebar-item.active {
             background: #252525;
-            color: {{ theme.accentColor }};
-            border-left-color: {{ theme.accentColor }};
+            color: var(--accent-color);
+            border-left-color: var(--accent-color);
         }
         
         .sidebar-badge {
@@ -1104,6 +1520,133 @@ HTML_TEMPLATE = '''
             display: block;
         }
         
+        /* Inactive tabs are display:none already; in the open tab, skip rendering sections scrolled out of view */
+        .tab-content > form,
+        .tab-content > div {
+            content-visibility: auto;
+            contain-intrinsic-size: auto 500px;
+        }
+        
+        /* Dashboard widgets update every few seconds - keep each one's layout/paint to itself */
+        #dashboard .card {
+            contain: content;
+        }
+        
+        .stat-tile {
+            contain: layout paint style;
+            padding: 25px;
+            border-radius: 12px;
+            color: white;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+        }
+        
+        .stat-tile--streams { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
+        .stat-tile--viewers { background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); }
+        .stat-tile--recordings { background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); }
+        .stat-tile--uptime { background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%); }
+        
+        .stat-tile-label {
+            font-size: 14px;
+            opacity: 0.9;
+            margin-bottom: 8px;
+        }
+        
+        .stat-tile-value {
+            font-size: 48px;
+            font-weight: bold;
+        }
+        
+        .stat-tile-value--small {
+            font-size: 32px;
+        }
+        
+        .gauge-wrap {
+            contain: strict;
+            position: relative;
+            width: 200px;
+            height: 200px;
+            margin: 0 auto;
+        }
+        
+        /* CPU/RAM dial: a 20px SVG ring filled clockwise from 12 o'clock; the browser animates
+           between readings, so no script runs in between ticks */
+        .gauge {
+            display: block;
+            width: 200px;
+            height: 200px;
+            transform: rotate(-90deg);
+        }
+        
+        .gauge circle {
+            fill: none;
+            stroke-width: 20;
+        }
+        
+        .gauge-track {
+            stroke: #2a2a2a;
+        }
+        
+        .gauge-fill {
+            stroke: #4CAF50;
+            stroke-linecap: round;
+            stroke-dasharray: 100;
+            stroke-dashoffset: 100;
+            transition: stroke-dashoffset 0.5s ease-out, stroke 0.5s;
+        }
+        
+        .gauge-value {
+            position: absolute;
+            top: 50%;
+            left: 50%;
+            transform: translate(-50%, -50%);
+            font-size: 36px;
+            font-weight: bold;
+        }
+        
+        /* Version badges and update banners at the top of the dashboard (shown/hidden from JS) */
+        .dashboard-banner {
+            contain: layout style;
+            margin-bottom: 10px;
+            padding: 10px 15px;
+            border-radius: 6px;
+            background: rgba(255,255,255,0.05);
+            border: 1px solid #333;
+            font-size: 13px;
+            color: #888;
+        }
+        
+        .dashboard-banner--last {
+            margin-bottom: 20px;
+        }
+        
+        .dashboard-banner--update {
+            border-color: #2d5a2d;
+            cursor: pointer;
+        }
+        
+        .dashboard-banner--mediamtx-update {
+            margin-bottom: 20px;
+            border-color: #2d4a6d;
+            cursor: pointer;
+        }
+        
+        /* Release notes scroll box on the Versions tab. Not contain: strict - it only has a
+           max-height, so size containment would collapse it; content containment is enough */
+        .release-notes {
+            font-size: 13px;
+            color: #ccc;
+            white-space: pre-wrap;
+            max-height: 150px;
+            overflow-y: auto;
+            padding: 10px;
+            background: rgba(0,0,0,0.2);
+            border-radius: 6px;
+            margin-bottom: 12px;
+            contain: content;
+            content-visibility: auto;
+            contain-intrinsic-size: auto 150px;
+        }
+        
         .form-group {
             margin-bottom: 25px;
         }
@@ -1132,7 +1675,7 @@ HTML_TEMPLATE = '''
         .form-group select:focus,
         .form-group textarea:focus {
             outline: none;
-            border-color: {{ theme.accentColor }};
+            border-color: var(--accent-color);
         }
         
         .form-row {
@@ -1208,6 +1751,111 @@ HTML_TEMPLATE = '''
             border: 1px solid #2d6930;
         }
         
+        /* Styling tab quick-preset buttons and their color dot */
+        .preset-btn {
+            padding: 8px 16px;
+            font-size: 14px;
+        }
+        
+        .preset-swatch {
+            display: inline-block;
+            width: 12px;
+            height: 12px;
+            border-radius: 50%;
+            margin-right: 6px;
+            vertical-align: middle;
+        }
+        
+        .preset-swatch--outlined {
+            border: 1px solid #555;
+        }
+        
+        /* External source form: only the selected protocol's fields are shown */
+        .source-fields {
+            display: none;
+        }
+        
+        .source-fields.active {
+            display: block;
+        }
+        
+        /* Styling tab: Header Text / Custom Colors cards and their inputs */
+        .theme-card {
+            background: #1a1a1a;
+            padding: 15px;
+            border-radius: 8px;
+            border: 1px solid #404040;
+        }
+        
+        .theme-card .help-text {
+            margin-bottom: 10px;
+        }
+        
+        .theme-card-label {
+            display: block;
+            margin-bottom: 8px;
+            font-weight: 600;
+            color: #e5e5e5;
+        }
+        
+        .theme-text-input {
+            width: 100%;
+            padding: 10px;
+            background: #2d2d2d;
+            border: 1px solid #404040;
+            color: #e5e5e5;
+            border-radius: 4px;
+            font-size: 15px;
+            box-sizing: border-box;
+        }
+        
+        .theme-color-picker {
+            width: 50px;
+            height: 40px;
+            border: none;
+            cursor: pointer;
+            background: none;
+            padding: 0;
+        }
+        
+        .theme-hex-input {
+            flex: 1;
+            padding: 8px;
+            background: #2d2d2d;
+            border: 1px solid #404040;
+            color: #e5e5e5;
+            border-radius: 4px;
+            font-family: monospace;
+        }
+        
+        /* Show/Hide button for a password field; --inset sits inside the input's right edge */
+        .pw-toggle {
+            padding: 8px 12px;
+            background: #555;
+            color: #fff;
+            border: none;
+            border-radius: 4px;
+            cursor: pointer;
+        }
+        
+        .pw-toggle--inset {
+            position: absolute;
+            right: 8px;
+            top: 50%;
+            transform: translateY(-50%);
+            border-radius: 3px;
+            padding: 4px 10px;
+            font-size: 12px;
+        }
+        
+        /* Long certificate paths are cut with an ellipsis (full path on hover) instead of scrolling */
+        .cert-path {
+            display: block;
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
+        }
+        
         .alert-danger {
             background: #4a1c1c;
             color: #ff7d7d;
@@ -1256,6 +1904,14 @@ HTML_TEMPLATE = '''
             border: 1px solid #404040;
         }
         
+        /* Wraps the YAML editor so it can't be submitted before its content has loaded */
+        .yaml-fieldset {
+            border: 0;
+            padding: 0;
+            margin: 0;
+            min-width: 0;
+        }
+        
         textarea {
             width: 100%;
             min-height: 400px;
@@ -1276,7 +1932,7 @@ HTML_TEMPLATE = '''
         
         .section-title {
             font-size: 1.3rem;
-            color: {{ theme.accentColor }};
+            color: var(--accent-color);
             margin-bottom: 20px;
             padding-bottom: 10px;
             border-bottom: 2px solid #404040;
@@ -1324,7 +1980,7 @@ HTML_TEMPLATE = '''
                 bottom: 20px;
                 left: 20px;
                 z-index: 9999;
-                background: {{ theme.accentColor }};
+                background: var(--accent-color);
                 color: white;
                 border: none;
                 border-radius: 50%;
@@ -1349,6 +2005,22 @@ HTML_TEMPLATE = '''
             .header h1 { font-size: 1rem; }
         }
     </style>
+'''
+
+# HTML Template
+HTML_TEMPLATE = '''
+<!DOCTYPE html>
+<html>
+<head>
+    <title>{{ theme.headerTitle }}</title>
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <meta name="description" content="{{ theme.subtitle }}">
+    <meta property="og:title" content="{{ theme.headerTitle }}">
+    <meta property="og:description" content="{{ theme.subtitle }}">
+    <meta property="og:type" content="website">
+    <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Material+Symbols+Outlined:opsz,wght,FILL,GRAD@24,400,1,0" />
+    <style>:root { --header-color: {{ theme.headerColor }}; --header-color-end: {{ theme.headerColorEnd }}; --accent-color: {{ theme.accentColor }}; }</style>
+    {{ page_css }}
 </head>
 <body>
     <div class="container">
@@ -1419,47 +2091,47 @@ HTML_TEMPLATE = '''
                 <div class="sidebar-group collapsed" id="group-status">
                     <div class="sidebar-group-label" onclick="toggleGroup('group-status')"><span class="sidebar-icon"><span class="material-symbols-outlined">monitoring</span></span><span class="sidebar-label">Status</span><span class="group-arrow">▶</span></div>
                     <div class="sidebar-group-items">
-                        <button class="sidebar-item {% if tab == 'dashboard' %}active{% endif %}" onclick="showTab('dashboard', event)"><span class="sidebar-label">Dashboard</span></button>
-                        <button class="sidebar-item {% if tab == 'logs' %}active{% endif %}" onclick="showTab('logs', event)"><span class="sidebar-label">Live Logs</span></button>
+                        <button class="sidebar-item {% if tab == 'dashboard' %}active{% endif %}" data-tab="dashboard"><span class="sidebar-label">Dashboard</span></button>
+                        <button class="sidebar-item {% if tab == 'logs' %}active{% endif %}" data-tab="logs"><span class="sidebar-label">Live Logs</span></button>
                     </div>
                 </div>
                 
                 <div class="sidebar-group collapsed" id="group-streaming">
                     <div class="sidebar-group-label" onclick="toggleGroup('group-streaming')"><span class="sidebar-icon"><span class="material-symbols-outlined">videocam</span></span><span class="sidebar-label">Streaming</span><span class="group-arrow">▶</span></div>
                     <div class="sidebar-group-items">
-                        <button class="sidebar-item {% if tab == 'streams' %}active{% endif %}" onclick="showTab('streams', event)"><span class="sidebar-label">Active Streams</span></button>
-                        <button class="sidebar-item {% if tab == 'test' %}active{% endif %}" onclick="showTab('test', event)"><span class="sidebar-label">Test Streams</span></button>
-                        <button class="sidebar-item {% if tab == 'recordings' %}active{% endif %}" onclick="showTab('recordings', event)"><span class="sidebar-label">Recordings</span></button>
-                        <button class="sidebar-item {% if tab == 'sources' %}active{% endif %}" onclick="showTab('sources', event)"><span class="sidebar-label">External Sources</span></button>
+                        <button class="sidebar-item {% if tab == 'streams' %}active{% endif %}" data-tab="streams"><span class="sidebar-label">Active Streams</span></button>
+                        <button class="sidebar-item {% if tab == 'test' %}active{% endif %}" data-tab="test"><span class="sidebar-label">Test Streams</span></button>
+                        <button class="sidebar-item {% if tab == 'recordings' %}active{% endif %}" data-tab="recordings"><span class="sidebar-label">Recordings</span></button>
+                        <button class="sidebar-item {% if tab == 'sources' %}active{% endif %}" data-tab="sources"><span class="sidebar-label">External Sources</span></button>
                     </div>
                 </div>
                 
                 <div class="sidebar-group collapsed" id="group-config">
                     <div class="sidebar-group-label" onclick="toggleGroup('group-config')"><span class="sidebar-icon"><span class="material-symbols-outlined">settings</span></span><span class="sidebar-label">Configuration</span><span class="group-arrow">▶</span></div>
                     <div class="sidebar-group-items">
-                        <button class="sidebar-item {% if tab == 'basic' %}active{% endif %}" onclick="showTab('basic', event)"><span class="sidebar-label">Basic Settings</span></button>
-                        <button class="sidebar-item {% if tab == 'users' %}active{% endif %}" onclick="showTab('users', event)"><span class="sidebar-label">Users & Auth</span></button>
-                        <button class="sidebar-item {% if tab == 'protocols' %}active{% endif %}" onclick="showTab('protocols', event)"><span class="sidebar-label">Protocols</span></button>
-                        <button class="sidebar-item {% if tab == 'hls' %}active{% endif %}" onclick="showTab('hls', event)"><span class="sidebar-label">HLS Tuning</span></button>
-                        <button class="sidebar-item {% if tab == 'advanced' %}active{% endif %}" onclick="showTab('advanced', event)"><span class="sidebar-label">Advanced YAML</span></button>
+                        <button class="sidebar-item {% if tab == 'basic' %}active{% endif %}" data-tab="basic"><span class="sidebar-label">Basic Settings</span></button>
+                        <button class="sidebar-item {% if tab == 'users' %}active{% endif %}" data-tab="users"><span class="sidebar-label">Users & Auth</span></button>
+                        <button class="sidebar-item {% if tab == 'protocols' %}active{% endif %}" data-tab="protocols"><span class="sidebar-label">Protocols</span></button>
+                        <button class="sidebar-item {% if tab == 'hls' %}active{% endif %}" data-tab="hls"><span class="sidebar-label">HLS Tuning</span></button>
+                        <button class="sidebar-item {% if tab == 'advanced' %}active{% endif %}" data-tab="advanced"><span class="sidebar-label">Advanced YAML</span></button>
                     </div>
                 </div>
                 
                 <div class="sidebar-group collapsed" id="group-system">
                     <div class="sidebar-group-label" onclick="toggleGroup('group-system')"><span class="sidebar-icon"><span class="material-symbols-outlined">build</span></span><span class="sidebar-label">System</span><span class="group-arrow">▶</span></div>
                     <div class="sidebar-group-items">
-                        <button class="sidebar-item {% if tab == 'service' %}active{% endif %}" onclick="showTab('service', event)"><span class="sidebar-label">Service Control</span></button>
-                        <button class="sidebar-item {% if tab == 'firewall' %}active{% endif %}" onclick="showTab('firewall', event)"><span class="sidebar-label">Firewall</span></button>
-                        <button class="sidebar-item {% if tab == 'versions' %}active{% endif %}" onclick="showTab('versions', event)"><span class="sidebar-label">Versions</span></button>
+                        <button class="sidebar-item {% if tab == 'service' %}active{% endif %}" data-tab="service"><span class="sidebar-label">Service Control</span></button>
+                        <button class="sidebar-item {% if tab == 'firewall' %}active{% endif %}" data-tab="firewall"><span class="sidebar-label">Firewall</span></button>
+                        <button class="sidebar-item {% if tab == 'versions' %}active{% endif %}" data-tab="versions"><span class="sidebar-label">Versions</span></button>
                     </div>
                 </div>
                 
                 <div class="sidebar-group collapsed" id="group-admin">
                     <div class="sidebar-group-label" onclick="toggleGroup('group-admin')"><span class="sidebar-icon"><span class="material-symbols-outlined">admin_panel_settings</span></span><span class="sidebar-label">Admin</span><span class="group-arrow">▶</span></div>
                     <div class="sidebar-group-items">
-                        <button class="sidebar-item {% if tab == 'webusers' %}active{% endif %}" onclick="showTab('webusers', event)"><span class="sidebar-label">Web Users{% if pending_count > 0 %} <span class="sidebar-badge">{{ pending_count }}</span>{% endif %}</span></button>
-                        <button class="sidebar-item {% if tab == 'account' %}active{% endif %}" onclick="showTab('account', event)"><span class="sidebar-label">Account</span></button>
-                        <button class="sidebar-item {% if tab == 'styling' %}active{% endif %}" onclick="showTab('styling', event)"><span class="sidebar-label">Styling</span></button>
+                        <button class="sidebar-item {% if tab == 'webusers' %}active{% endif %}" data-tab="webusers"><span class="sidebar-label">Web Users{% if pending_count > 0 %} <span class="sidebar-badge">{{ pending_count }}</span>{% endif %}</span></button>
+                        <button class="sidebar-item {% if tab == 'account' %}active{% endif %}" data-tab="account"><span class="sidebar-label">Account</span></button>
+                        <button class="sidebar-item {% if tab == 'styling' %}active{% endif %}" data-tab="styling"><span class="sidebar-label">Styling</span></button>
                     </div>
                 </div>
             </nav>
@@ -1468,7 +2140,7 @@ HTML_TEMPLATE = '''
             {% if role == 'viewer' %}
             <nav class="sidebar" id="sidebar">
                 <div class="sidebar-group">
-                    <button class="sidebar-item active" onclick="showTab('streams', event)"><span class="sidebar-label">Active Streams</span></button>
+                    <button class="sidebar-item active" data-tab="streams"><span class="sidebar-label">Active Streams</span></button>
                 </div>
             </nav>
             {% endif %}
@@ -1479,97 +2151,73 @@ HTML_TEMPLATE = '''
             <div class="alert alert-{{ message_type }}" id="flash-message">
                 {{ message }}
             </div>
-            <script>
-                // Auto-dismiss flash messages after 3 seconds
-                setTimeout(function() {
-                    const msg = document.getElementById('flash-message');
-                    if (msg) {
-                        msg.style.transition = 'opacity 0.5s';
-                        msg.style.opacity = '0';
-                        setTimeout(function() {
-                            msg.remove();
-                            // Clean URL (remove message params)
-                            const url = new URL(window.location);
-                            url.searchParams.delete('message');
-                            url.searchParams.delete('message_type');
-                            window.history.replaceState({}, '', url);
-                        }, 500);
-                    }
-                }, 3000);
-            </script>
             {% endif %}
             
             {% if role == 'admin' %}
             <!-- Dashboard Tab -->
+            {% macro dashboard_gauge(name, label) %}
+                    <div class="card">
+                        <h3 style="margin: 0 0 20px 0; color: #4CAF50;">{{ label }}</h3>
+                        <div class="gauge-wrap">
+                            <svg id="{{ name }}-gauge" class="gauge" viewBox="0 0 200 200" aria-hidden="true"><circle class="gauge-track" cx="100" cy="100" r="80"/><circle class="gauge-fill" cx="100" cy="100" r="80" pathLength="100"/></svg>
+                            <div id="{{ name }}-percent" class="gauge-value">-</div>
+                        </div>
+                    </div>
+            {% endmacro %}
             <div id="dashboard" class="tab-content {% if tab == 'dashboard' %}active{% endif %}">
                 <h2 class="section-title">Server Health Dashboard</h2>
                 
                 <!-- Update Banner (hidden by default, shown when update available) -->
-                <div id="update-banner" style="display: none; margin-bottom: 10px; padding: 10px 15px; border-radius: 6px; background: rgba(255,255,255,0.05); border: 1px solid #2d5a2d; font-size: 13px; color: #888; cursor: pointer;" onclick="showTab('versions', event)">
+                <div id="update-banner" class="dashboard-banner dashboard-banner--update" style="display: none;" onclick="showTab('versions', event)">
                     🆕 Web Editor update available: <span id="update-remote-version" style="color: #4ade80; font-weight: bold;"></span> — <span style="color: #4ade80;">Go to Versions tab to update →</span>
                 </div>
                 
                 <!-- Version Info (shown when up to date) -->
-                <div id="version-badge" style="display: none; margin-bottom: 10px; padding: 10px 15px; border-radius: 6px; background: rgba(255,255,255,0.05); border: 1px solid #333; font-size: 13px; color: #888;">
+                <div id="version-badge" class="dashboard-banner" style="display: none;">
                     ✅ Web Editor <span id="version-current"></span> — up to date
                 </div>
                 
                 <!-- MediaMTX Version Info (shown when up to date) -->
-                <div id="mediamtx-version-badge" style="display: none; margin-bottom: 20px; padding: 10px 15px; border-radius: 6px; background: rgba(255,255,255,0.05); border: 1px solid #333; font-size: 13px; color: #888;">
+                <div id="mediamtx-version-badge" class="dashboard-banner dashboard-banner--last" style="display: none;">
                     ✅ MediaMTX <span id="mediamtx-version-current"></span> — up to date
                 </div>
                 
                 <!-- MediaMTX Update Banner (hidden by default) -->
-                <div id="mediamtx-update-banner" style="display: none; margin-bottom: 20px; padding: 10px 15px; border-radius: 6px; background: rgba(255,255,255,0.05); border: 1px solid #2d4a6d; font-size: 13px; color: #888; cursor: pointer;" onclick="showTab('versions', event)">
+                <div id="mediamtx-update-banner" class="dashboard-banner dashboard-banner--mediamtx-update" style="display: none;" onclick="showTab('versions', event)">
                     🆕 MediaMTX update available: <span id="mediamtx-update-remote-version" style="color: #60a5fa; font-weight: bold;"></span> — <span style="color: #60a5fa;">Go to Versions tab to update →</span>
                 </div>
                 
                 <!-- Top Stats Row -->
                 <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin-bottom: 30px;">
                     <!-- Active Streams -->
-                    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 25px; border-radius: 12px; color: white; box-shadow: 0 4px 15px rgba(0,0,0,0.2);">
-                        <div style="font-size: 14px; opacity: 0.9; margin-bottom: 8px;">Active Streams</div>
-                        <div id="active-streams-count" style="font-size: 48px; font-weight: bold;">-</div>
+                    <div class="stat-tile stat-tile--streams">
+                        <div class="stat-tile-label">Active Streams</div>
+                        <div id="active-streams-count" class="stat-tile-value">-</div>
                     </div>
                     
                     <!-- Total Viewers -->
-                    <div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); padding: 25px; border-radius: 12px; color: white; box-shadow: 0 4px 15px rgba(0,0,0,0.2);">
-                        <div style="font-size: 14px; opacity: 0.9; margin-bottom: 8px;">Total Viewers</div>
-                        <div id="total-viewers-count" style="font-size: 48px; font-weight: bold;">-</div>
+                    <div class="stat-tile stat-tile--viewers">
+                        <div class="stat-tile-label">Total Viewers</div>
+                        <div id="total-viewers-count" class="stat-tile-value">-</div>
                     </div>
                     
                     <!-- Recordings Size -->
-                    <div style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); padding: 25px; border-radius: 12px; color: white; box-shadow: 0 4px 15px rgba(0,0,0,0.2);">
-                        <div style="font-size: 14px; opacity: 0.9; margin-bottom: 8px;">Recordings</div>
-                        <div id="recordings-size" style="font-size: 48px; font-weight: bold;">-</div>
+                    <div class="stat-tile stat-tile--recordings">
+                        <div class="stat-tile-label">Recordings</div>
+                        <div id="recordings-size" class="stat-tile-value">-</div>
                     </div>
                     
                     <!-- Server Uptime -->
-                    <div style="background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%); padding: 25px; border-radius: 12px; color: white; box-shadow: 0 4px 15px rgba(0,0,0,0.2);">
-                        <div style="font-size: 14px; opacity: 0.9; margin-bottom: 8px;">Uptime</div>
-                        <div id="server-uptime" style="font-size: 32px; font-weight: bold;">-</div>
+                    <div class="stat-tile stat-tile--uptime">
+                        <div class="stat-tile-label">Uptime</div>
+                        <div id="server-uptime" class="stat-tile-value stat-tile-value--small">-</div>
                     </div>
                 </div>
                 
-                <!-- System Resources Row -->
-                <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin-bottom: 30px;">
-                    <!-- CPU Gauge -->
-                    <div class="card">
-                        <h3 style="margin: 0 0 20px 0; color: #4CAF50;">CPU Usage</h3>
-                        <div style="position: relative; width: 200px; height: 200px; margin: 0 auto;">
-                            <canvas id="cpu-gauge" width="200" height="200"></canvas>
-                            <div id="cpu-percent" style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); font-size: 36px; font-weight: bold;">-</div>
-                        </div>
-                    </div>
-                    
-                    <!-- RAM Gauge -->
-                    <div class="card">
-                        <h3 style="margin: 0 0 20px 0; color: #4CAF50;">RAM Usage</h3>
-                        <div style="position: relative; width: 200px; height: 200px; margin: 0 auto;">
-                            <canvas id="ram-gauge" width="200" height="200"></canvas>
-                            <div id="ram-percent" style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); font-size: 36px; font-weight: bold;">-</div>
-                        </div>
-                    </div>
+                <!-- System Resources Row -->
+                <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin-bottom: 30px;">
+                    {{ dashboard_gauge('cpu', 'CPU Usage') }}
+                    {{ dashboard_gauge('ram', 'RAM Usage') }}
                     
                     <!-- Disk Usage -->
                     <div class="card">
@@ -1771,7 +2419,7 @@ HTML_TEMPLATE = '''
                         
                         <div class="form-group">
                             <label>Transport Protocol</label>
-                            <select name="rtspTransports" onchange="this.form.submit()">
+                            <select name="rtspTransports" class="protocol-autosave">
                                 <option value="tcp" {% if rtsp_transport_mode == 'tcp' %}selected{% endif %}>TCP only (recommended)</option>
                                 <option value="udp,tcp" {% if rtsp_transport_mode == 'udp_tcp' %}selected{% endif %}>UDP + TCP</option>
                                 <option value="udp,multicast,tcp" {% if rtsp_transport_mode == 'all' %}selected{% endif %}>All (UDP + Multicast + TCP)</option>
@@ -1785,7 +2433,7 @@ HTML_TEMPLATE = '''
                         
                         <div class="form-group">
                             <label>Encryption</label>
-                            <select name="rtspEncryption" onchange="this.form.submit()">
+                            <select name="rtspEncryption" class="protocol-autosave">
                                 <option value="no" {% if config.rtspEncryption == 'no' %}selected{% endif %}>No</option>
                                 <option value="optional" {% if config.rtspEncryption == 'optional' %}selected{% endif %}>Optional</option>
                                 <option value="strict" {% if config.rtspEncryption == 'strict' %}selected{% endif %}>Strict</option>
@@ -1819,24 +2467,27 @@ HTML_TEMPLATE = '''
                         <div class="form-group">
                             <label>Encryption Mode</label>
                             <div style="background: #383838; padding: 12px; border-radius: 6px; border: 1px solid #4a4a4a;">
-                                {% if config.rtspEncryption == 'no' %}
+                                <!-- All three states are rendered; saving the Encryption select just flips which one shows -->
+                                <div data-rtsp-encryption="no"{% if config.rtspEncryption != 'no' %} hidden{% endif %}>
                                 <strong style="color: #ff9800;">⚠️ Disabled (RTSPS not available)</strong>
                                 <p class="help-text" style="margin-top: 8px; margin-bottom: 0;">
                                     Port 8322 is closed. Set RTSP Encryption to "Optional" or "Strict" above to enable RTSPS.
                                 </p>
-                                {% elif config.rtspEncryption == 'optional' %}
+                                </div>
+                                <div data-rtsp-encryption="optional"{% if config.rtspEncryption != 'optional' %} hidden{% endif %}>
                                 <strong style="color: #4CAF50;">✓ Optional (Both RTSP & RTSPS work)</strong>
                                 <p class="help-text" style="margin-top: 8px; margin-bottom: 0;">
                                     Port 8554: Unencrypted (rtsp://)<br>
                                     Port 8322: SSL Encrypted (rtsps://)
                                 </p>
-                                {% elif config.rtspEncryption == 'strict' %}
+                                </div>
+                                <div data-rtsp-encryption="strict"{% if config.rtspEncryption != 'strict' %} hidden{% endif %}>
                                 <strong style="color: #2196F3;">🔒 Strict (RTSPS only)</strong>
                                 <p class="help-text" style="margin-top: 8px; margin-bottom: 0;">
                                     Port 8554: Disabled<br>
                                     Port 8322: SSL Encrypted (rtsps://)
                                 </p>
-                                {% endif %}
+                                </div>
                             </div>
                             <p class="help-text" style="margin-top: 8px;">
                                 <em>Status reflects RTSP Encryption setting above. Change it there to modify this.</em>
@@ -1845,9 +2496,9 @@ HTML_TEMPLATE = '''
                     </div>
                     
                     {% if config.rtspServerCert and config.rtspServerCert.strip() %}
-                    <div class="alert alert-success" style="padding-left: 15px; white-space: nowrap; overflow-x: auto;">
-                        <strong>✓ Certificates Configured:</strong><br>
-                        <small>Cert: {{ config.rtspServerCert }}</small>
+                    <div class="alert alert-success" style="padding-left: 15px;">
+                        <strong>✓ Certificates Configured:</strong>
+                        <small class="cert-path" title="{{ config.rtspServerCert }}">Cert: {{ config.rtspServerCert }}</small>
                     </div>
                     {% else %}
                     <div class="alert alert-warning">
@@ -1867,9 +2518,9 @@ HTML_TEMPLATE = '''
                     {% if config.hlsServerCert and config.hlsServerCert.strip() %}
                     <!-- Certificates configured - show cert box, force encryption on -->
                     <input type="hidden" name="hlsEncryption" value="yes">
-                    <div class="alert alert-success" style="padding-left: 15px; white-space: nowrap; overflow-x: auto;">
-                        <strong>✓ Certificates Configured:</strong><br>
-                        <small>Cert: {{ config.hlsServerCert }}</small>
+                    <div class="alert alert-success" style="padding-left: 15px;">
+                        <strong>✓ Certificates Configured:</strong>
+                        <small class="cert-path" title="{{ config.hlsServerCert }}">Cert: {{ config.hlsServerCert }}</small>
                     </div>
                     {% else %}
                     <!-- No certificates - show warning, disable encryption -->
@@ -1949,9 +2600,9 @@ HTML_TEMPLATE = '''
                     </div>
                     
                     {% if config.get('rtmpServerCert') and config.get('rtmpServerCert', '').strip() %}
-                    <div class="alert alert-success" style="padding-left: 15px; white-space: nowrap; overflow-x: auto;">
-                        <strong>✓ Certificates Configured:</strong><br>
-                        <small>Cert: {{ config.rtmpServerCert }}</small>
+                    <div class="alert alert-success" style="padding-left: 15px;">
+                        <strong>✓ Certificates Configured:</strong>
+                        <small class="cert-path" title="{{ config.rtmpServerCert }}">Cert: {{ config.rtmpServerCert }}</small>
                     </div>
                     {% else %}
                     <div class="alert alert-warning">
@@ -2127,7 +2778,7 @@ HTML_TEMPLATE = '''
                                 <option value="hls">HLS (HTTP streams)</option>
                             </select>
                         </div>
-                        <div id="srt-source-fields">
+                        <div id="srt-source-fields" class="source-fields active">
                             <div class="form-row">
                                 <div class="form-group">
                                     <label>SRT Server Address</label>
@@ -2157,7 +2808,7 @@ HTML_TEMPLATE = '''
                                 <label>Passphrase (optional)</label>
                                 <div style="position: relative;">
                                     <input type="password" id="source-srt-passphrase" placeholder="Leave empty if not required" style="padding-right: 60px;">
-                                    <button type="button" onclick="const f=document.getElementById('source-srt-passphrase'); const b=this; if(f.type==='password'){f.type='text';b.textContent='Hide';}else{f.type='password';b.textContent='Show';}" style="position: absolute; right: 8px; top: 50%; transform: translateY(-50%); background: #555; color: #fff; border: none; border-radius: 3px; padding: 4px 10px; cursor: pointer; font-size: 12px;">Show</button>
+                                    <button type="button" class="pw-toggle pw-toggle--inset" data-target="source-srt-passphrase">Show</button>
                                 </div>
                                 <p class="help-text">SRT encryption passphrase if their server requires one</p>
                             </div>
@@ -2219,7 +2870,7 @@ HTML_TEMPLATE = '''
                                 </div>
                             </div>
                         </div>
-                        <div id="rtsp-source-fields" style="display: none;">
+                        <div id="rtsp-source-fields" class="source-fields">
                             <div class="form-group">
                                 <label>Encryption</label>
                                 <select id="source-rtsp-secure">
@@ -2253,12 +2904,12 @@ HTML_TEMPLATE = '''
                                     <label>Password (optional)</label>
                                     <div style="position: relative;">
                                         <input type="password" id="source-rtsp-pass" placeholder="Leave empty if not required" style="padding-right: 60px;">
-                                        <button type="button" onclick="const f=document.getElementById('source-rtsp-pass'); const b=this; if(f.type==='password'){f.type='text';b.textContent='Hide';}else{f.type='password';b.textContent='Show';}" style="position: absolute; right: 8px; top: 50%; transform: translateY(-50%); background: #555; color: #fff; border: none; border-radius: 3px; padding: 4px 10px; cursor: pointer; font-size: 12px;">Show</button>
+                                        <button type="button" class="pw-toggle pw-toggle--inset" data-target="source-rtsp-pass">Show</button>
                                     </div>
                                 </div>
                             </div>
                         </div>
-                        <div id="udp-source-fields" style="display: none;">
+                        <div id="udp-source-fields" class="source-fields">
                             <div class="form-group">
                                 <label>Listen Port</label>
                                 <input type="number" id="source-udp-port" placeholder="5004" value="5004">
@@ -2270,7 +2921,7 @@ HTML_TEMPLATE = '''
                                 <p class="help-text">Only accept packets from this IP address. Recommended for security. Leave empty to accept from any source.</p>
                             </div>
                         </div>
-                        <div id="rtmp-source-fields" style="display: none;">
+                        <div id="rtmp-source-fields" class="source-fields">
                             <div class="form-group">
                                 <label>Encryption</label>
                                 <select id="source-rtmp-secure">
@@ -2296,7 +2947,7 @@ HTML_TEMPLATE = '''
                                 <p class="help-text">Stream path or key on their server (no leading slash)</p>
                             </div>
                         </div>
-                        <div id="hls-source-fields" style="display: none;">
+                        <div id="hls-source-fields" class="source-fields">
                             <div class="form-group">
                                 <label>HLS Playlist URL</label>
                                 <input type="text" id="source-hls-url" placeholder="e.g., https://their.server.com/stream/index.m3u8">
@@ -2321,36 +2972,6 @@ HTML_TEMPLATE = '''
                         </div>
                     </div>
                 </div>
-                <script>
-                (function(){
-                    var offState = document.getElementById('simulator-off-state');
-                    var onState = document.getElementById('simulator-on-state');
-                    var offBtn = document.getElementById('simulator-off-btn');
-                    var msgEl = document.getElementById('simulator-msg');
-                    function showSimulatorOn() { if (offState) offState.style.display = 'none'; if (onState) onState.style.display = 'block'; }
-                    function showSimulatorOff() { if (offState) offState.style.display = 'block'; if (onState) onState.style.display = 'none'; if (msgEl) msgEl.textContent = ''; }
-                    if (offBtn) {
-                        offBtn.addEventListener('click', function() {
-                            if (msgEl) msgEl.textContent = 'Turning off...';
-                            if (msgEl) msgEl.style.color = '#888';
-                            offBtn.disabled = true;
-                            fetch('/api/ku-band-simulator/off', { method: 'POST' })
-                                .then(function(r) { return r.json(); })
-                                .then(function(d) {
-                                    if (msgEl) msgEl.textContent = d.ok ? (d.msg || 'Simulator off') : (d.error || 'Failed');
-                                    if (msgEl) msgEl.style.color = d.ok ? '#16a34a' : '#dc2626';
-                                    offBtn.disabled = false;
-                                    if (d.ok) showSimulatorOff();
-                                })
-                                .catch(function() {
-                                    if (msgEl) { msgEl.textContent = 'Request failed'; msgEl.style.color = '#dc2626'; }
-                                    offBtn.disabled = false;
-                                });
-                        });
-                    }
-                    window.showSimulatorOn = showSimulatorOn;
-                })();
-                </script>
                 
                 <h3 style="margin-top: 30px;">Configured External Sources</h3>
                 <div id="external-sources-list" style="margin-top: 10px;">
@@ -2391,14 +3012,16 @@ HTML_TEMPLATE = '''
                 
                 <form method="POST" action="/save_yaml" id="yaml-form">
                     <input type="hidden" name="current_tab" class="tab-tracker" value="advanced">
-                    <div class="form-group">
-                        <textarea name="yaml_content" id="yaml-textarea">{{ yaml_content }}</textarea>
-                    </div>
-                    
-                    <div class="btn-group">
-                        <button type="submit" class="btn btn-primary">Save YAML</button>
-                        <button type="submit" formaction="/validate_yaml" class="btn btn-success">Validate Only</button>
-                    </div>
+                    <fieldset id="yaml-fieldset" class="yaml-fieldset" disabled>
+                        <div class="form-group">
+                            <textarea name="yaml_content" id="yaml-textarea" placeholder="Loading mediamtx.yml..."></textarea>
+                        </div>
+                        
+                        <div class="btn-group">
+                            <button type="submit" class="btn btn-primary">Save YAML</button>
+                            <button type="submit" formaction="/validate_yaml" class="btn btn-success">Validate Only</button>
+                        </div>
+                    </fieldset>
                 </form>
             </div>
             
@@ -2451,10 +3074,9 @@ HTML_TEMPLATE = '''
                                 <button type="submit" class="btn btn-primary" onclick="return confirm('Restore this backup? This will restart the service.')">Restore</button>
                             </form>
                         </div>
-                        {% endfor %}
-                        {% if not backups %}
+                        {% else %}
                         <p class="help-text">No backups found</p>
-                        {% endif %}
+                        {% endfor %}
                     </div>
                 </div>
             </div>
@@ -2473,7 +3095,7 @@ HTML_TEMPLATE = '''
                         <div style="font-size: 15px; font-weight: bold; color: #4ade80; margin-bottom: 8px;">
                             Update Available: <span id="ve-remote-version"></span>
                         </div>
-                        <div id="ve-release-notes" style="font-size: 13px; color: #ccc; white-space: pre-wrap; max-height: 150px; overflow-y: auto; padding: 10px; background: rgba(0,0,0,0.2); border-radius: 6px; margin-bottom: 12px;"></div>
+                        <div id="ve-release-notes" class="release-notes"></div>
                         <div style="display: flex; gap: 10px; align-items: center;">
                             <button class="btn btn-success" onclick="applyUpdate()" id="ve-update-btn" style="padding: 8px 20px;">⬆️ Update Web Editor</button>
                             <a id="ve-github-link" href="#" target="_blank" style="color: #999; font-size: 13px; text-decoration: none;">View on GitHub →</a>
@@ -2501,7 +3123,7 @@ HTML_TEMPLATE = '''
                         <div style="font-size: 13px; color: #999; margin-bottom: 8px;">
                             Current: <span id="mtx-current-version"></span> · Published <span id="mtx-published"></span>
                         </div>
-                        <div id="mtx-release-notes" style="font-size: 13px; color: #ccc; white-space: pre-wrap; max-height: 150px; overflow-y: auto; padding: 10px; background: rgba(0,0,0,0.2); border-radius: 6px; margin-bottom: 12px;"></div>
+                        <div id="mtx-release-notes" class="release-notes"></div>
                         <div style="display: flex; gap: 10px; align-items: center; flex-wrap: wrap;">
                             <button class="btn" onclick="applyMediaMTXUpdate()" id="mtx-update-btn" style="padding: 8px 20px; background: #2563eb; color: white; border: none; border-radius: 6px; cursor: pointer;">⬆️ Upgrade MediaMTX</button>
                             <button onclick="skipMediaMTXUpdate()" id="mtx-skip-btn" style="background: none; border: 1px solid #555; color: #aaa; cursor: pointer; font-size: 12px; padding: 6px 12px; border-radius: 4px;">Skip this version</button>
@@ -2614,17 +3236,17 @@ HTML_TEMPLATE = '''
                 <div style="margin-top: 20px; margin-bottom: 25px;">
                     <h3 style="margin-bottom: 10px;">Live Preview</h3>
                     <div id="theme-preview" style="border-radius: 8px; overflow: hidden; border: 2px solid #404040;">
-                        <div id="preview-header" style="background: linear-gradient(135deg, {{ theme.headerColor }} 0%, {{ theme.headerColorEnd }} 100%); color: white; padding: 20px; text-align: center;">
+                        <div id="preview-header" style="background: linear-gradient(135deg, var(--header-color) 0%, var(--header-color-end) 100%); color: white; padding: 20px; text-align: center;">
                             <div id="preview-title" style="font-size: 1.3rem; font-weight: bold;">{{ theme.headerTitle }}</div>
                             <div id="preview-subtitle" style="opacity: 0.9; font-size: 0.9rem; margin-top: 4px;">{{ theme.subtitle }}</div>
                         </div>
                         <div style="background: #1a1a1a; display: flex; gap: 0; border-bottom: 2px solid #404040;">
                             <div style="padding: 10px 18px; color: #999; font-size: 14px;">Dashboard</div>
-                            <div id="preview-active-tab" style="padding: 10px 18px; color: {{ theme.accentColor }}; font-size: 14px; border-bottom: 3px solid {{ theme.accentColor }};">Active Tab</div>
+                            <div id="preview-active-tab" style="padding: 10px 18px; color: var(--accent-color); font-size: 14px; border-bottom: 3px solid var(--accent-color);">Active Tab</div>
                             <div style="padding: 10px 18px; color: #999; font-size: 14px;">Settings</div>
                         </div>
                         <div style="background: #2d2d2d; padding: 15px;">
-                            <div id="preview-section-title" style="font-size: 1.1rem; color: {{ theme.accentColor }}; margin-bottom: 8px; padding-bottom: 8px; border-bottom: 2px solid #404040;">Section Title</div>
+                            <div id="preview-section-title" style="font-size: 1.1rem; color: var(--accent-color); margin-bottom: 8px; padding-bottom: 8px; border-bottom: 2px solid #404040;">Section Title</div>
                             <div style="color: #999; font-size: 0.9rem;">This is how your themed interface will look.</div>
                         </div>
                     </div>
@@ -2634,30 +3256,11 @@ HTML_TEMPLATE = '''
                 <div style="margin-bottom: 25px;">
                     <h3 style="margin-bottom: 10px;">Quick Presets</h3>
                     <div style="display: flex; flex-wrap: wrap; gap: 10px;">
-                        <button class="btn btn-secondary" style="padding: 8px 16px; font-size: 14px;" onclick="applyPreset('#1e3a8a', '#1e293b', '#3b82f6')">
-                            <span style="display:inline-block; width:12px; height:12px; border-radius:50%; background:#1e3a8a; margin-right:6px; vertical-align:middle;"></span>Default Blue
-                        </button>
-                        <button class="btn btn-secondary" style="padding: 8px 16px; font-size: 14px;" onclick="applyPreset('#7f1d1d', '#451a1a', '#ef4444')">
-                            <span style="display:inline-block; width:12px; height:12px; border-radius:50%; background:#7f1d1d; margin-right:6px; vertical-align:middle;"></span>Fire Red
-                        </button>
-                        <button class="btn btn-secondary" style="padding: 8px 16px; font-size: 14px;" onclick="applyPreset('#14532d', '#1a2e1a', '#22c55e')">
-                            <span style="display:inline-block; width:12px; height:12px; border-radius:50%; background:#14532d; margin-right:6px; vertical-align:middle;"></span>Tactical Green
-                        </button>
-                        <button class="btn btn-secondary" style="padding: 8px 16px; font-size: 14px;" onclick="applyPreset('#78350f', '#451a03', '#f59e0b')">
-                            <span style="display:inline-block; width:12px; height:12px; border-radius:50%; background:#78350f; margin-right:6px; vertical-align:middle;"></span>Alert Orange
-                        </button>
-                        <button class="btn btn-secondary" style="padding: 8px 16px; font-size: 14px;" onclick="applyPreset('#581c87', '#2e1065', '#a855f7')">
-                            <span style="display:inline-block; width:12px; height:12px; border-radius:50%; background:#581c87; margin-right:6px; vertical-align:middle;"></span>Purple
-                        </button>
-                        <button class="btn btn-secondary" style="padding: 8px 16px; font-size: 14px;" onclick="applyPreset('#1e293b', '#0f172a', '#64748b')">
-                            <span style="display:inline-block; width:12px; height:12px; border-radius:50%; background:#1e293b; margin-right:6px; vertical-align:middle;"></span>Stealth Gray
-                        </button>
-                        <button class="btn btn-secondary" style="padding: 8px 16px; font-size: 14px;" onclick="applyPreset('#5c4a32', '#3b2f1e', '#c2a66b')">
-                            <span style="display:inline-block; width:12px; height:12px; border-radius:50%; background:#5c4a32; margin-right:6px; vertical-align:middle;"></span>Desert Tan
-                        </button>
-                        <button class="btn btn-secondary" style="padding: 8px 16px; font-size: 14px;" onclick="applyPreset('#0a0a0a', '#000000', '#888888')">
-                            <span style="display:inline-block; width:12px; height:12px; border-radius:50%; background:#000000; margin-right:6px; vertical-align:middle; border: 1px solid #555;"></span>Blackout
+                        {% for preset in theme_presets %}
+                        <button class="btn btn-secondary preset-btn" data-preset="{{ loop.index0 }}">
+                            <span class="preset-swatch{% if preset.outlined %} preset-swatch--outlined{% endif %}" style="background: {{ preset.colors[0] }};"></span>{{ preset.name }}
                         </button>
+                        {% endfor %}
                     </div>
                 </div>
                 
@@ -2689,19 +3292,17 @@ HTML_TEMPLATE = '''
                 <div style="margin-bottom: 25px;">
                     <h3 style="margin-bottom: 15px;">Header Text</h3>
                     <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px;">
-                        <div style="background: #1a1a1a; padding: 15px; border-radius: 8px; border: 1px solid #404040;">
-                            <label style="display: block; margin-bottom: 8px; font-weight: 600; color: #e5e5e5;">Title</label>
-                            <p class="help-text" style="margin-bottom: 10px;">Main heading shown in the top bar and login page</p>
+                        <div class="theme-card">
+                            <label class="theme-card-label">Title</label>
+                            <p class="help-text">Main heading shown in the top bar and login page</p>
                             <input type="text" id="theme-headerTitle" value="{{ theme.headerTitle }}" maxlength="100"
-                                oninput="updateTextPreview()"
-                                style="width: 100%; padding: 10px; background: #2d2d2d; border: 1px solid #404040; color: #e5e5e5; border-radius: 4px; font-size: 15px; box-sizing: border-box;">
+                                oninput="scheduleTextPreview()" class="theme-text-input">
                         </div>
-                        <div style="background: #1a1a1a; padding: 15px; border-radius: 8px; border: 1px solid #404040;">
-                            <label style="display: block; margin-bottom: 8px; font-weight: 600; color: #e5e5e5;">Subtitle</label>
-                            <p class="help-text" style="margin-bottom: 10px;">Smaller text below the title (e.g. agency name, tagline)</p>
+                        <div class="theme-card">
+                            <label class="theme-card-label">Subtitle</label>
+                            <p class="help-text">Smaller text below the title (e.g. agency name, tagline)</p>
                             <input type="text" id="theme-subtitle" value="{{ theme.subtitle }}" maxlength="100"
-                                oninput="updateTextPreview()"
-                                style="width: 100%; padding: 10px; background: #2d2d2d; border: 1px solid #404040; color: #e5e5e5; border-radius: 4px; font-size: 15px; box-sizing: border-box;">
+                                oninput="scheduleTextPreview()" class="theme-text-input">
                         </div>
                     </div>
                 </div>
@@ -2709,47 +3310,35 @@ HTML_TEMPLATE = '''
                 <!-- Custom Colors -->
                 <div style="margin-bottom: 25px;">
                     <h3 style="margin-bottom: 15px;">Custom Colors</h3>
-                    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px;">
+                    <div id="color-grid" style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px;">
                         
                         <!-- Header Start Color -->
-                        <div style="background: #1a1a1a; padding: 15px; border-radius: 8px; border: 1px solid #404040;">
-                            <label style="display: block; margin-bottom: 8px; font-weight: 600; color: #e5e5e5;">Header Color (Left)</label>
-                            <p class="help-text" style="margin-bottom: 10px;">Primary gradient color for the top bar</p>
+                        <div class="theme-card">
+                            <label class="theme-card-label">Header Color (Left)</label>
+                            <p class="help-text">Primary gradient color for the top bar</p>
                             <div style="display: flex; align-items: center; gap: 10px;">
-                                <input type="color" id="theme-headerColor" value="{{ theme.headerColor }}" 
-                                    onchange="updatePreview()" 
-                                    style="width: 50px; height: 40px; border: none; cursor: pointer; background: none; padding: 0;">
-                                <input type="text" id="theme-headerColor-text" value="{{ theme.headerColor }}" 
-                                    onchange="document.getElementById('theme-headerColor').value = this.value; updatePreview();"
-                                    style="flex: 1; padding: 8px; background: #2d2d2d; border: 1px solid #404040; color: #e5e5e5; border-radius: 4px; font-family: monospace;">
+                                <input type="color" id="theme-headerColor" value="{{ theme.headerColor }}" class="theme-color-picker">
+                                <input type="text" id="theme-headerColor-text" value="{{ theme.headerColor }}" data-sync="theme-headerColor" class="theme-hex-input">
                             </div>
                         </div>
                         
                         <!-- Header End Color -->
-                        <div style="background: #1a1a1a; padding: 15px; border-radius: 8px; border: 1px solid #404040;">
-                            <label style="display: block; margin-bottom: 8px; font-weight: 600; color: #e5e5e5;">Header Color (Right)</label>
-                            <p class="help-text" style="margin-bottom: 10px;">Secondary gradient color for the top bar</p>
+                        <div class="theme-card">
+                            <label class="theme-card-label">Header Color (Right)</label>
+                            <p class="help-text">Secondary gradient color for the top bar</p>
                             <div style="display: flex; align-items: center; gap: 10px;">
-                                <input type="color" id="theme-headerColorEnd" value="{{ theme.headerColorEnd }}" 
-                                    onchange="updatePreview()" 
-                                    style="width: 50px; height: 40px; border: none; cursor: pointer; background: none; padding: 0;">
-                                <input type="text" id="theme-headerColorEnd-text" value="{{ theme.headerColorEnd }}" 
-                                    onchange="document.getElementById('theme-headerColorEnd').value = this.value; updatePreview();"
-                                    style="flex: 1; padding: 8px; background: #2d2d2d; border: 1px solid #404040; color: #e5e5e5; border-radius: 4px; font-family: monospace;">
+                                <input type="color" id="theme-headerColorEnd" value="{{ theme.headerColorEnd }}" class="theme-color-picker">
+                                <input type="text" id="theme-headerColorEnd-text" value="{{ theme.headerColorEnd }}" data-sync="theme-headerColorEnd" class="theme-hex-input">
                             </div>
                         </div>
                         
                         <!-- Accent Color -->
-                        <div style="background: #1a1a1a; padding: 15px; border-radius: 8px; border: 1px solid #404040;">
-                            <label style="display: block; margin-bottom: 8px; font-weight: 600; color: #e5e5e5;">Accent Color</label>
-                            <p class="help-text" style="margin-bottom: 10px;">Active tabs, section titles, and focus highlights</p>
+                        <div class="theme-card">
+                            <label class="theme-card-label">Accent Color</label>
+                            <p class="help-text">Active tabs, section titles, and focus highlights</p>
                             <div style="display: flex; align-items: center; gap: 10px;">
-                                <input type="color" id="theme-accentColor" value="{{ theme.accentColor }}" 
-                                    onchange="updatePreview()" 
-                                    style="width: 50px; height: 40px; border: none; cursor: pointer; background: none; padding: 0;">
-                                <input type="text" id="theme-accentColor-text" value="{{ theme.accentColor }}" 
-                                    onchange="document.getElementById('theme-accentColor').value = this.value; updatePreview();"
-                                    style="flex: 1; padding: 8px; background: #2d2d2d; border: 1px solid #404040; color: #e5e5e5; border-radius: 4px; font-family: monospace;">
+                                <input type="color" id="theme-accentColor" value="{{ theme.accentColor }}" class="theme-color-picker">
+                                <input type="text" id="theme-accentColor-text" value="{{ theme.accentColor }}" data-sync="theme-accentColor" class="theme-hex-input">
                             </div>
                         </div>
                     </div>
@@ -2758,7 +3347,7 @@ HTML_TEMPLATE = '''
                 <!-- Save / Reset Buttons -->
                 <div style="display: flex; gap: 15px; margin-top: 25px;">
                     <button class="btn btn-primary" onclick="saveTheme()">Save Theme</button>
-                    <button class="btn btn-secondary" onclick="applyPreset('#1e3a8a', '#1e293b', '#3b82f6'); document.getElementById('theme-headerTitle').value='MediaMTX Configuration Editor'; document.getElementById('theme-subtitle').value='Brought to you by TAKWERX'; updateTextPreview();">↩️ Reset to Default</button>
+                    <button class="btn btn-secondary" onclick="resetTheme()">↩️ Reset to Default</button>
                 </div>
                 
                 <div id="theme-status" style="margin-top: 15px; display: none;"></div>
@@ -3008,7 +3597,7 @@ HTML_TEMPLATE = '''
                             <label>App Password</label>
                             <div style="display: flex; gap: 8px;">
                                 <input type="password" id="gmail-app-password" placeholder="16-character app password" style="flex: 1;">
-                                <button type="button" onclick="togglePasswordVisibility('gmail-app-password', this)" style="padding: 8px 12px; background: #555; color: white; border: none; border-radius: 4px; cursor: pointer;">Show</button>
+                                <button type="button" class="pw-toggle" data-target="gmail-app-password">Show</button>
                             </div>
                             <p class="help-text" style="margin-top: 5px;">Requires 2-Step Verification enabled. <a href="https://myaccount.google.com/apppasswords" target="_blank" style="color: #3b82f6;">Create App Password →</a></p>
                         </div>
@@ -3042,7 +3631,7 @@ HTML_TEMPLATE = '''
                             <label>Password</label>
                             <div style="display: flex; gap: 8px;">
                                 <input type="password" id="smtp-password" placeholder="SMTP password" style="flex: 1;">
-                                <button type="button" onclick="togglePasswordVisibility('smtp-password', this)" style="padding: 8px 12px; background: #555; color: white; border: none; border-radius: 4px; cursor: pointer;">Show</button>
+                                <button type="button" class="pw-toggle" data-target="smtp-password">Show</button>
                             </div>
                         </div>
                         <div class="form-group">
@@ -3106,9 +3695,90 @@ HTML_TEMPLATE = '''
         </div><!-- end app-layout -->
     </div><!-- end container -->
     
-    <script>
+    <!-- Per-page values for the editor script, which is the same for every page -->
+    <script id="editor-page-data" type="application/json">{{ {'username': username, 'pendingCount': pending_count|int, 'logoExists': logo_exists, 'themePresets': theme_presets|map(attribute='colors')|list}|tojson }}</script>
+    <script src="/js/editor.{{ editor_script_digest }}.js"></script>
+    <div id="share-link-modal-bg" style="display:none;position:fixed;inset:0;background:rgba(0,0,0,.7);z-index:9999;align-items:center;justify-content:center;">
+        <div style="background:#1e1e1e;border:1px solid #333;border-radius:12px;padding:24px;width:420px;max-width:90vw;">
+            <h3 style="font-size:16px;font-weight:600;margin-bottom:8px;display:flex;align-items:center;gap:8px;"><span style="font-size:20px;">&#128279;</span> Generate Share Link</h3>
+            <p style="font-size:13px;color:#888;margin-bottom:16px;"><span id="share-link-modal-stream-name"></span> – Private Stream</p>
+            <input type="hidden" id="share-link-modal-stream" value="">
+            <label style="display:block;font-size:12px;font-weight:600;color:#888;margin-bottom:6px;text-transform:uppercase;">Link expires in</label>
+            <select id="share-link-modal-ttl" style="width:100%;background:#0e0e0e;border:1px solid #333;border-radius:6px;padding:10px 12px;color:#e0e0e0;font-size:13px;margin-bottom:20px;">
+                <option value="3600">1 hour</option>
+                <option value="14400" selected>4 hours</option>
+                <option value="86400">24 hours</option>
+                <option value="0">Until revoked</option>
+            </select>
+            <div style="display:flex;gap:10px;justify-content:flex-end;">
+                <button type="button" onclick="closeShareLinkModal()" style="padding:8px 18px;border-radius:6px;font-size:13px;background:#2a2a2a;color:#888;border:none;cursor:pointer;">Close</button>
+                <button type="button" id="share-link-modal-generate-btn" onclick="generateShareLinkFromModal()" style="padding:8px 18px;border-radius:6px;font-size:13px;background:#2196F3;color:#fff;border:none;cursor:pointer;">Generate Link</button>
+            </div>
+        </div>
+    </div>
+</body>
+</html>
+'''
+
+# Main page JavaScript - served on its own from /js/editor.<digest>.js (see
+# editor_script()) so browsers cache it instead of re-downloading ~200 KB with
+# every page; per-page values come in through EDITOR_PAGE in the page itself
+EDITOR_SCRIPT = '''
+        const EDITOR_PAGE = JSON.parse(document.getElementById('editor-page-data').textContent);
+        
+        // Auto-dismiss flash messages after 3 seconds
+        setTimeout(function() {
+            const msg = document.getElementById('flash-message');
+            if (msg) {
+                msg.style.transition = 'opacity 0.5s';
+                msg.style.opacity = '0';
+                setTimeout(function() {
+                    msg.remove();
+                    // Clean URL (remove message params)
+                    const url = new URL(window.location);
+                    url.searchParams.delete('message');
+                    url.searchParams.delete('message_type');
+                    window.history.replaceState({}, '', url);
+                }, 500);
+            }
+        }, 3000);
+        
+        // KU-band simulator on/off controls (Sources tab)
+        (function(){
+            var offState = document.getElementById('simulator-off-state');
+            var onState = document.getElementById('simulator-on-state');
+            var offBtn = document.getElementById('simulator-off-btn');
+            var msgEl = document.getElementById('simulator-msg');
+            function showSimulatorOn() { if (offState) offState.style.display = 'none'; if (onState) onState.style.display = 'block'; }
+            function showSimulatorOff() { if (offState) offState.style.display = 'block'; if (onState) onState.style.display = 'none'; if (msgEl) msgEl.textContent = ''; }
+            if (offBtn) {
+                offBtn.addEventListener('click', function() {
+                    if (msgEl) msgEl.textContent = 'Turning off...';
+                    if (msgEl) msgEl.style.color = '#888';
+                    offBtn.disabled = true;
+                    fetch('/api/ku-band-simulator/off', { method: 'POST' })
+                        .then(function(r) { return r.json(); })
+                        .then(function(d) {
+                            if (msgEl) msgEl.textContent = d.ok ? (d.msg || 'Simulator off') : (d.error || 'Failed');
+                            if (msgEl) msgEl.style.color = d.ok ? '#16a34a' : '#dc2626';
+                            offBtn.disabled = false;
+                            if (d.ok) showSimulatorOff();
+                        })
+                        .catch(function() {
+                            if (msgEl) { msgEl.textContent = 'Request failed'; msgEl.style.color = '#dc2626'; }
+                            offBtn.disabled = false;
+                        });
+                });
+            }
+            window.showSimulatorOn = showSimulatorOn;
+        })();
+        
         let autoScroll = true;
         let logEventSource = null;
+        let logReconnectTimer = null;
+        const LOG_MAX_LINES = 500;
+        let pendingLogLines = [];
+        let logFlushScheduled = false;
         
         function scrollToWebUsers() {
             showTab('webusers');
@@ -3160,35 +3830,45 @@ HTML_TEMPLATE = '''
             document.getElementById('sidebar-overlay').classList.remove('open');
         }
         
-        function showTab(tabName, event) {
-            // Hide all tab contents
-            const contents = document.querySelectorAll('.tab-content');
-            contents.forEach(content => content.classList.remove('active'));
-            
-            // Update sidebar active state
-            document.querySelectorAll('.sidebar-item').forEach(item => {
-                item.classList.remove('active');
+        // Tab navigation elements are all rendered with the page - look them up once
+        const tabContents = document.querySelectorAll('.tab-content');
+        const sidebarItems = document.querySelectorAll('.sidebar-item');
+        const tabTrackers = document.querySelectorAll('.tab-tracker');
+        // Only one tab and one sidebar item are active at a time - remember which
+        let activeTabContent = document.querySelector('.tab-content.active');
+        let activeSidebarItem = document.querySelector('.sidebar-item.active');
+        
+        // Sidebar navigation - one listener for every item (class="sidebar-item" data-tab="<tab id>")
+        const sidebarNav = document.getElementById('sidebar');
+        if (sidebarNav) {
+            sidebarNav.addEventListener('click', (e) => {
+                const item = e.target.closest('.sidebar-item[data-tab]');
+                if (item) showTab(item.dataset.tab, e);
             });
-            if (event && event.target && event.target.classList.contains('sidebar-item')) {
-                event.target.classList.add('active');
-            } else {
+        }
+        
+        function showTab(tabName, event) {
+            // Work out the new active pair first...
+            const content = document.getElementById(tabName);
+            let item = event && event.target && event.target.closest ? event.target.closest('.sidebar-item') : null;
+            if (!item) {
                 // Fallback: find correct sidebar item
-                document.querySelectorAll('.sidebar-item').forEach(item => {
-                    const onclick = item.getAttribute('onclick') || '';
-                    if (onclick.includes(`'${tabName}'`)) {
-                        item.classList.add('active');
-                    }
-                });
+                item = Array.from(sidebarItems).find(i => i.dataset.tab === tabName) || null;
             }
             
-            // Show selected tab content
-            document.getElementById(tabName).classList.add('active');
+            // ...then swap the classes in one pass of writes
+            if (activeTabContent) activeTabContent.classList.remove('active');
+            if (activeSidebarItem) activeSidebarItem.classList.remove('active');
+            content.classList.add('active');
+            if (item) item.classList.add('active');
+            activeTabContent = content;
+            activeSidebarItem = item;
             
             // Close mobile sidebar
             closeSidebar();
             
             // Update all hidden tab tracker fields
-            document.querySelectorAll('.tab-tracker').forEach(tracker => {
+            tabTrackers.forEach(tracker => {
                 tracker.value = tabName;
             });
             
@@ -3196,12 +3876,20 @@ HTML_TEMPLATE = '''
             if (tabName === 'dashboard') {
                 startDashboardRefresh();
             } else {
-                stopDashboardRefresh();
+                refreshTicks();  // back to polling the header badges
             }
             
-            // Start log streaming when Logs tab is opened
-            if (tabName === 'logs' && !logEventSource) {
-                startLogStream();
+            // Fill the YAML editor the first time Advanced is opened
+            if (tabName === 'advanced') {
+                loadYAMLEditor();
+            }
+            
+            // Stream logs only while the Logs tab is open - each stream holds a
+            // server thread and a journalctl process
+            if (tabName === 'logs') {
+                if (!logEventSource) startLogStream();
+            } else {
+                stopLogStream();
             }
             
             // Load users when Users & Auth tab is opened
@@ -3210,37 +3898,14 @@ HTML_TEMPLATE = '''
             }
             
             // Load external sources when External Sources tab is opened
+            // (refreshActiveTab keeps sources, streams and recordings current while open)
             if (tabName === 'sources' && typeof loadExternalSources === 'function') {
                 loadExternalSources();
-                // Start auto-refresh
-                if (!sourcesRefreshInterval) {
-                    sourcesRefreshInterval = setInterval(() => {
-                        const sourcesTab = document.getElementById('sources');
-                        if (sourcesTab && sourcesTab.classList.contains('active')) {
-                            loadExternalSources();
-                        }
-                    }, 5000);
-                }
-            } else {
-                // Stop auto-refresh when leaving sources tab
-                if (sourcesRefreshInterval) {
-                    clearInterval(sourcesRefreshInterval);
-                    sourcesRefreshInterval = null;
-                }
             }
             
-            // Load streams when Active Streams tab is opened and start auto-refresh
+            // Load streams when Active Streams tab is opened
             if (tabName === 'streams' && typeof loadStreams === 'function') {
                 loadStreams();
-                // Start auto-refresh if not already running
-                if (!streamsRefreshInterval) {
-                    streamsRefreshInterval = setInterval(() => {
-                        const streamsTab = document.getElementById('streams');
-                        if (streamsTab && streamsTab.classList.contains('active')) {
-                            loadStreams();
-                        }
-                    }, 5000);
-                }
             }
             
             // Reload web users data when tab is opened
@@ -3266,72 +3931,156 @@ HTML_TEMPLATE = '''
                 loadRecordingSettings();
                 loadDiskUsage();
                 loadRecordings();
-                
-                // Auto-refresh recordings every 5 seconds to show recording progress
-                if (!window.recordingsRefreshInterval) {
-                    window.recordingsRefreshInterval = setInterval(() => {
-                        const recordingsTab = document.getElementById('recordings');
-                        if (recordingsTab && recordingsTab.classList.contains('active')) {
-                            loadRecordings();
-                            loadDiskUsage();
-                        }
-                    }, 5000);
+            }
+        }
+        
+        // One 5 s auto-refresh for whichever data tab is open, instead of a timer per tab
+        const TAB_REFRESH_INTERVAL = 5000;
+        const TAB_REFRESHERS = {
+            sources: () => loadExternalSources(),
+            streams: () => loadStreams(),  // resolves false when /api/streams fails
+            // Recordings also shows recording progress and the disk it's filling
+            recordings: () => { loadRecordings(); loadDiskUsage(); }
+        };
+        
+        // A refresher that reports failure (resolves to false) is given fewer ticks:
+        // every 2nd after one failure, then every 4th, 8th and at most every 12th (60 s)
+        let tabRefreshFailures = 0;
+        let tabRefreshSkips = 0;
+        
+        function refreshActiveTab() {
+            if (document.hidden) return;
+            if (tabRefreshSkips > 0) {
+                tabRefreshSkips--;
+                return;
+            }
+            // showTab() keeps activeTabContent current, so there's nothing to look up per tick
+            const refresh = activeTabContent && TAB_REFRESHERS[activeTabContent.id];
+            if (!refresh) return;
+            Promise.resolve(refresh()).then(ok => {
+                if (ok === false) {
+                    tabRefreshFailures++;
+                    tabRefreshSkips = Math.min(2 ** tabRefreshFailures, 12) - 1;
+                } else {
+                    tabRefreshFailures = 0;
                 }
+            });
+        }
+        setInterval(refreshActiveTab, TAB_REFRESH_INTERVAL);
+        
+        // Nothing refreshes while the page is hidden - drop the streams request still
+        // in flight, and catch up as soon as the page is back
+        document.addEventListener('visibilitychange', () => {
+            if (document.hidden) {
+                if (streamsController) streamsController.abort();
             } else {
-                // Stop auto-refresh when leaving recordings tab
-                if (window.recordingsRefreshInterval) {
-                    clearInterval(window.recordingsRefreshInterval);
-                    window.recordingsRefreshInterval = null;
-                }
+                refreshActiveTab();
             }
-        }
+        });
         
         function startLogStream() {
+            stopLogStream();
             const logContent = document.getElementById('logContent');
             logContent.innerHTML = '';
             
             logEventSource = new EventSource('/stream_logs');
             
+            // Lines arrive in bursts - queue them and touch the DOM once per frame
             logEventSource.onmessage = function(event) {
-                const logContainer = document.getElementById('logContainer');
-                const logContent = document.getElementById('logContent');
-                
-                // Add new log line
-                const logLine = document.createElement('div');
-                logLine.textContent = event.data;
-                logContent.appendChild(logLine);
-                
-                // Auto-scroll to bottom if enabled
-                if (autoScroll) {
-                    logContainer.scrollTop = logContainer.scrollHeight;
-                }
-                
-                // Keep only last 500 lines
-                const lines = logContent.children;
-                if (lines.length > 500) {
-                    logContent.removeChild(lines[0]);
+                pendingLogLines.push(event.data);
+                if (!logFlushScheduled) {
+                    logFlushScheduled = true;
+                    requestAnimationFrame(flushLogLines);
                 }
             };
             
+            // The browser reconnects by itself (after the server's retry: delay, without
+            // the backlog) - only a stream it has given up on needs a fresh start
+            let connectionLost = false;
+            logEventSource.onopen = function() {
+                connectionLost = false;
+            };
             logEventSource.onerror = function(error) {
-                console.error('Log stream error:', error);
-                logContent.innerHTML += '<div style="color: #f44336;">Connection lost. Reconnecting...</div>';
+                if (!connectionLost) {
+                    connectionLost = true;
+                    console.error('Log stream error:', error);
+                    const lostLine = document.createElement('div');
+                    lostLine.style.color = '#f44336';
+                    lostLine.textContent = 'Connection lost. Reconnecting...';
+                    logContent.appendChild(lostLine);
+                }
+                if (logEventSource.readyState === EventSource.CLOSED) {
+                    logEventSource = null;
+                    logReconnectTimer = setTimeout(startLogStream, 3000);
+                }
+            };
+        }
+        
+        function flushLogLines() {
+            logFlushScheduled = false;
+            const logContainer = document.getElementById('logContainer');
+            const logContent = document.getElementById('logContent');
+            const lines = pendingLogLines.slice(-LOG_MAX_LINES);
+            pendingLogLines = [];
+            if (!lines.length) return;
+            
+            // All writes first. Once the log is full, the oldest lines are moved
+            // to the end and reused rather than dropped and rebuilt
+            let recycle = logContent.childElementCount + lines.length - LOG_MAX_LINES;
+            const fragment = document.createDocumentFragment();
+            for (const text of lines) {
+                let logLine;
+                if (recycle-- > 0) {
+                    logLine = logContent.firstElementChild;
+                    logLine.removeAttribute('style');
+                } else {
+                    logLine = document.createElement('div');
+                }
+                logLine.textContent = text;
+                fragment.appendChild(logLine);
+            }
+            // Older lines than this batch can replace - drop them in one go
+            if (recycle > 0) {
+                const range = document.createRange();
+                range.setStartBefore(logContent.firstElementChild);
+                range.setEndAfter(logContent.children[recycle - 1]);
+                range.deleteContents();
+            }
+            logContent.appendChild(fragment);
+            
+            // ...then a single layout read to auto-scroll
+            if (autoScroll) {
+                logContainer.scrollTop = logContainer.scrollHeight;
+            }
+        }
+        
+        function stopLogStream() {
+            clearTimeout(logReconnectTimer);
+            logReconnectTimer = null;
+            pendingLogLines = [];
+            if (logEventSource) {
                 logEventSource.close();
                 logEventSource = null;
-                setTimeout(startLogStream, 3000);
-            };
+            }
         }
         
+        // No live logs for a hidden page; reconnect (with the last 50 lines) when it's shown again
+        document.addEventListener('visibilitychange', () => {
+            if (document.hidden) {
+                stopLogStream();
+            } else if (activeTabContent && activeTabContent.id === 'logs' && !logEventSource) {
+                startLogStream();
+            }
+        });
+        
         function clearLogs() {
+            pendingLogLines = [];
             document.getElementById('logContent').innerHTML = '';
         }
         
         function restartLogs() {
             // Close existing connection
-            if (logEventSource) {
-                logEventSource.close();
-                logEventSource = null;
-            }
+            stopLogStream();
             // Clear and restart
             document.getElementById('logContent').innerHTML = 'Reconnecting to log stream...';
             startLogStream();
@@ -3350,295 +4099,418 @@ HTML_TEMPLATE = '''
             const tabParam = urlParams.get('tab');
             console.log("Tab parameter from URL:", tabParam);
             
-            if (tabParam) {
-                // Find the tab button for this tab
-                const tabButtons = document.querySelectorAll('.tab');
-                tabButtons.forEach(button => {
-                    const onclick = button.getAttribute('onclick');
-                    if (!onclick) return;
-                    console.log("Checking button:", onclick);
-                    const match = onclick.match(/showTab\('(.+?)'(?:,\s*event)?\)/);
-                    if (!match) return;
-                    const tabName = match[1];
-                    console.log("Found matching tab:", tabName);
-                    if (tabName === tabParam) {
-                        // Hide all tabs first
-                        const tabs = document.querySelectorAll('.tab');
-                        const contents = document.querySelectorAll('.tab-content');
-                        
-                        tabs.forEach(tab => tab.classList.remove('active'));
-                        contents.forEach(content => content.classList.remove('active'));
-                        
-                        // Show the requested tab
-                        button.classList.add('active');
-                        document.getElementById(tabParam).classList.add('active');
-                        
-                        // Update all tab trackers
-                        console.log("ACTIVATED TAB:", tabParam);
-                        document.querySelectorAll('.tab-tracker').forEach(tracker => {
-                            tracker.value = tabParam;
-                        });
-            console.log("All active tab IDs:", Array.from(document.querySelectorAll('.tab-content.active')).map(t => t.id));
-            console.log("Active tabs count:", document.querySelectorAll('.tab-content.active').length);
-            console.log("Final active tab:", document.querySelector('.tab-content.active')?.id);
-                        
-                        // Start logs if needed
-                        if (tabParam === 'logs' && !logEventSource) {
-                            startLogStream();
-                        }
-                    }
-                });
+            if (!tabParam) return;
+            
+            // Sidebar items name their tab in data-tab
+            const item = Array.from(sidebarItems).find(i => i.dataset.tab === tabParam);
+            const content = document.getElementById(tabParam);
+            if (!item || !content) return;
+            
+            // Show the requested tab
+            if (activeTabContent) activeTabContent.classList.remove('active');
+            if (activeSidebarItem) activeSidebarItem.classList.remove('active');
+            content.classList.add('active');
+            item.classList.add('active');
+            activeTabContent = content;
+            activeSidebarItem = item;
+            
+            // Update all tab trackers
+            console.log("ACTIVATED TAB:", tabParam);
+            tabTrackers.forEach(tracker => {
+                tracker.value = tabParam;
+            });
+            
+            // Start logs if needed
+            if (tabParam === 'logs' && !logEventSource) {
+                startLogStream();
             }
         });
         
         // Status Badge Auto-Refresh
-        function updateStatus() {
-            fetch('/api/status')
-                .then(response => response.json())
-                .then(data => {
-                    const badge = document.getElementById('status-badge');
-                    const text = document.getElementById('status-text');
-                    
-                    if (data.status === 'running') {
-                        text.textContent = '🟢 MediaMTX Running';
-                        badge.style.background = 'rgba(76, 175, 80, 0.3)';
-                    } else if (data.status === 'starting') {
-                        text.textContent = '🟠 MediaMTX Starting';
-                        badge.style.background = 'rgba(255, 152, 0, 0.3)';
-                    } else {
-                        text.textContent = '🔴 MediaMTX Stopped';
-                        badge.style.background = 'rgba(244, 67, 54, 0.3)';
-                    }
-                })
-                .catch(() => {
-                    document.getElementById('status-text').textContent = '⚪ Status Unknown';
-                });
+        // Header badge elements, looked up once - every tick repaints them
+        const headerEls = {
+            statusBadge: document.getElementById('status-badge'),
+            statusText: document.getElementById('status-text'),
+            streamBadge: document.getElementById('stream-badge'),
+            streamCount: document.getElementById('stream-count'),
+            streamPlural: document.getElementById('stream-plural')
+        };
+        
+        function renderStatusBadge(service) {
+            const badge = headerEls.statusBadge;
+            const text = headerEls.statusText;
+            
+            if (service.status === 'running') {
+                text.textContent = '🟢 MediaMTX Running';
+                badge.style.background = 'rgba(76, 175, 80, 0.3)';
+            } else if (service.status === 'starting') {
+                text.textContent = '🟠 MediaMTX Starting';
+                badge.style.background = 'rgba(255, 152, 0, 0.3)';
+            } else if (service.status === 'stopped') {
+                text.textContent = '🔴 MediaMTX Stopped';
+                badge.style.background = 'rgba(244, 67, 54, 0.3)';
+            } else {
+                text.textContent = '⚪ Status Unknown';
+            }
         }
         
-        function updateStreamCount() {
-            fetch('/api/streams')
-                .then(response => response.json())
+        function renderStreamBadge(count) {
+            const streamBadge = headerEls.streamBadge;
+            const streamCount = headerEls.streamCount;
+            const streamPlural = headerEls.streamPlural;
+            
+            if (count > 0) {
+                streamCount.textContent = count;
+                streamPlural.textContent = count === 1 ? '' : 's';
+                streamBadge.style.display = 'inline-block';
+                streamBadge.style.background = 'rgba(76, 175, 80, 0.3)';
+            } else {
+                streamBadge.style.display = 'none';
+            }
+        }
+        
+        // Header badges and dashboard widgets share one feed of ticks, painted in a single
+        // animation frame. They're polled from /api/dashboard/tick: unchanged results come
+        // back as an empty 304 and skip the repaint, and after 5 of those in a row the poll
+        // slows down until something changes again. Failed polls back off exponentially
+        // (10s, 20s, 40s, then every 60s) until one succeeds. While the dashboard tab is
+        // open the server pushes ticks over an EventSource instead and the poll stands down
+        // (it takes over again if the server turns the stream away or it gives up).
+        const TICK_INTERVAL = 5000;
+        const TICK_IDLE_INTERVAL = 10000;
+        const TICK_MAX_BACKOFF = 60000;
+        let lastTick = null;
+        let lastTickEtag = null;
+        let unchangedTicks = 0;
+        let failedTicks = 0;
+        let tickController = null;
+        let tickTimer = null;
+        let tickFrame = null;
+        let tickInFlight = false;
+        let tickAgain = false;
+        let tickStream = null;
+        
+        function scheduleTick() {
+            clearTimeout(tickTimer);
+            let delay = unchangedTicks >= 5 ? TICK_IDLE_INTERVAL : TICK_INTERVAL;
+            if (failedTicks > 0) delay = Math.min(TICK_MAX_BACKOFF, TICK_INTERVAL * 2 ** failedTicks);
+            tickTimer = setTimeout(pollTick, delay);
+        }
+        
+        function renderTick() {
+            tickFrame = null;
+            const data = lastTick;
+            if (!data) return;
+            renderStatusBadge(data.service || {});
+            renderStreamBadge(data.stream_count || 0);
+            if ('cpu_percent' in data && typeof renderDashboardMetrics === 'function') {
+                renderDashboardMetrics(data);
+            }
+        }
+        
+        function queueTickRender(data) {
+            lastTick = data;
+            if (tickFrame === null) {
+                tickFrame = requestAnimationFrame(renderTick);
+            }
+        }
+        
+        function dashboardTabActive() {
+            return !!activeTabContent && activeTabContent.id === 'dashboard';
+        }
+        
+        // Open the dashboard's tick stream; false when ticks have to be polled instead
+        function openTickStream() {
+            if (tickStream || document.hidden || !window.EventSource) return !!tickStream;
+            clearTimeout(tickTimer);
+            tickTimer = null;
+            tickStream = new EventSource('/api/dashboard/stream');
+            tickStream.onmessage = (e) => {
+                const data = JSON.parse(e.data);
+                lastTickEtag = null;
+                unchangedTicks = 0;
+                queueTickRender(data);
+            };
+            tickStream.onerror = () => {
+                // EventSource retries on its own after the server ends the stream; only
+                // fall back to polling once it has given up (or was refused - e.g. 503)
+                if (tickStream && tickStream.readyState === EventSource.CLOSED) {
+                    closeTickStream();
+                    pollTick();
+                }
+            };
+            return true;
+        }
+        
+        function closeTickStream() {
+            if (!tickStream) return;
+            tickStream.close();
+            tickStream = null;
+        }
+        
+        // Ticks for the tab now open - pushed on the dashboard where possible, polled otherwise
+        function refreshTicks() {
+            if (dashboardTabActive() && openTickStream()) return;
+            closeTickStream();
+            pollTick();
+        }
+        
+        function pollTick() {
+            if (document.hidden) return;  // visibilitychange restarts polling
+            if (tickStream) return;  // the tick stream is delivering ticks
+            if (tickInFlight) {
+                // e.g. the dashboard was opened mid-request - poll again once this one lands
+                tickAgain = true;
+                return;
+            }
+            tickInFlight = true;
+            const withSystem = dashboardTabActive();
+            const headers = lastTickEtag ? {'If-None-Match': lastTickEtag} : {};
+            tickController = new AbortController();
+            fetch('/api/dashboard/tick' + (withSystem ? '?system=1' : ''), {headers: headers, cache: 'no-store', signal: tickController.signal})
+                .then(response => {
+                    failedTicks = 0;
+                    if (response.status === 304) return null;
+                    lastTickEtag = response.headers.get('ETag');
+                    return response.json();
+                })
                 .then(data => {
-                    const streamBadge = document.getElementById('stream-badge');
-                    const streamCount = document.getElementById('stream-count');
-                    const streamPlural = document.getElementById('stream-plural');
-                    
-                    if (data.streams && data.streams.length > 0) {
-                        streamCount.textContent = data.streams.length;
-                        streamPlural.textContent = data.streams.length === 1 ? '' : 's';
-                        streamBadge.style.display = 'inline-block';
-                        streamBadge.style.background = 'rgba(76, 175, 80, 0.3)';
-                    } else {
-                        streamBadge.style.display = 'none';
+                    if (data === null) {
+                        unchangedTicks++;
+                        return;
                     }
+                    if (data.error) throw new Error(data.error);
+                    unchangedTicks = 0;
+                    queueTickRender(data);
                 })
-                .catch(() => {
-                    document.getElementById('stream-badge').style.display = 'none';
+                .catch(err => {
+                    if (err.name === 'AbortError') return;  // page hidden mid-request
+                    failedTicks++;
+                    lastTickEtag = null;
+                    unchangedTicks = 0;
+                    headerEls.statusText.textContent = '⚪ Status Unknown';
+                    headerEls.streamBadge.style.display = 'none';
+                })
+                .finally(() => {
+                    tickInFlight = false;
+                    tickController = null;
+                    if (tickAgain) {
+                        tickAgain = false;
+                        pollTick();
+                    } else if (!document.hidden) {
+                        scheduleTick();
+                    }
                 });
         }
         
-        // Load status and stream count on page load and refresh every 5 seconds
-        updateStatus();
-        updateStreamCount();
-        setInterval(updateStatus, 5000);
-        setInterval(updateStreamCount, 5000);
+        // Nothing to show in a background tab: close the stream, stop polling and drop any
+        // queued repaint, then catch up immediately when the tab comes back
+        document.addEventListener('visibilitychange', () => {
+            if (document.hidden) {
+                closeTickStream();
+                if (tickController) tickController.abort();
+                clearTimeout(tickTimer);
+                tickTimer = null;
+                if (tickFrame !== null) {
+                    cancelAnimationFrame(tickFrame);
+                    tickFrame = null;
+                }
+            } else {
+                refreshTicks();
+            }
+        });
+        
+        // Load status and stream count on page load, then keep them current
+        refreshTicks();
         
         // Active Streams Loading
+        // What the streams list was last rendered from - an unchanged refresh leaves it alone
+        let streamsRenderKey = null;
+        // The /api/streams request in flight - a newer load or hiding the page aborts it
+        let streamsController = null;
+        
         function loadStreams() {
-            fetch('/api/streams')
+            if (streamsController) streamsController.abort();
+            const controller = streamsController = new AbortController();
+            return fetch('/api/streams', {signal: controller.signal})
                 .then(response => response.json())
                 .then(data => {
                     const container = document.getElementById('streams-container');
+                    const isMobile = window.innerWidth <= 768;
+                    const renderKey = JSON.stringify([isMobile, data.streams, data.error]);
+                    if (renderKey === streamsRenderKey) return !data.error;
+                    streamsRenderKey = renderKey;
                     
                     if (data.streams && data.streams.length > 0) {
-                        const isMobile = window.innerWidth <= 768;
-                        let html = '';
+                        const html = [];
                         
                         if (isMobile) {
                             // Card layout for mobile
-                            html = '<div style="display: flex; flex-direction: column; gap: 12px; margin-top: 15px;">';
+                            html.push('<div style="display: flex; flex-direction: column; gap: 12px; margin-top: 15px;">');
                             data.streams.forEach(stream => {
                                 let groupDisplay = stream.publisher_group || '';
                                 const shareMode = stream.share_mode || 'private';
                                 const watchUrl = window.location.origin + '/watch/' + stream.name;
-                                html += `<div style="background: #383838; border-radius: 8px; padding: 15px; border: 1px solid #4a4a4a;">`;
-                                html += `<div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;">`;
-                                html += `<strong style="font-size: 16px;">${stream.name}</strong>`;
-                                html += `<span style="color: #4caf50; font-weight: bold;">${stream.readers} viewer${stream.readers !== 1 ? 's' : ''}</span>`;
-                                html += `</div>`;
+                                html.push(`<div style="background: #383838; border-radius: 8px; padding: 15px; border: 1px solid #4a4a4a;">`);
+                                html.push(`<div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;">`);
+                                html.push(`<strong style="font-size: 16px;">${stream.name}</strong>`);
+                                html.push(`<span style="color: #4caf50; font-weight: bold;">${stream.readers} viewer${stream.readers !== 1 ? 's' : ''}</span>`);
+                                html.push(`</div>`);
                                 if (groupDisplay) {
-                                    html += `<div style="color: #4a9eff; font-size: 13px; margin-bottom: 10px;">${groupDisplay}</div>`;
+                                    html.push(`<div style="color: #4a9eff; font-size: 13px; margin-bottom: 10px;">${groupDisplay}</div>`);
                                 }
-                                html += `<div style="display: flex; gap: 10px; align-items: center; flex-wrap: wrap;">`;
-                                html += `<button class="share-mode-badge" data-stream-name="${escapeHtml(stream.name).replace(/'/g, "\\'")}" data-mode="${shareMode}" style="padding: 4px 10px; font-size: 12px; font-weight: bold; border-radius: 4px; border: none; cursor: pointer; background: ${shareMode === 'public' ? '#16a34a' : '#dc2626'}; color: #fff;" title="Link sharing: ${shareMode === 'public' ? 'Static link' : 'Token link'}. Click to toggle (admin).">${shareMode === 'public' ? 'Public' : 'Private'}</button>`;
-                                html += `<button class="watch-stream-btn" data-url="${stream.hls_url}" data-name="${escapeHtml(stream.name)}" data-stream-name="${stream.name}" style="flex: 1; padding: 12px; font-size: 15px; background: #4CAF50; color: white; border: none; border-radius: 6px; cursor: pointer;">▶️ Watch</button>`;
-                                html += `<button class="share-link-btn" data-stream-name="${escapeHtml(stream.name).replace(/'/g, "\\'")}" data-share-mode="${shareMode}" style="padding: 12px 16px; font-size: 15px; background: #2196F3; color: white; border: none; border-radius: 6px; cursor: pointer; min-width: 100px;">🔗 Share</button>`;
-                                html += `</div>`;
-                                html += `</div>`;
+                                html.push(`<div style="display: flex; gap: 10px; align-items: center; flex-wrap: wrap;">`);
+                                html.push(`<button class="share-mode-badge" data-stream-name="${escapeHtml(stream.name).replace(/'/g, "\\'")}" data-mode="${shareMode}" style="padding: 4px 10px; font-size: 12px; font-weight: bold; border-radius: 4px; border: none; cursor: pointer; background: ${shareMode === 'public' ? '#16a34a' : '#dc2626'}; color: #fff;" title="Link sharing: ${shareMode === 'public' ? 'Static link' : 'Token link'}. Click to toggle (admin).">${shareMode === 'public' ? 'Public' : 'Private'}</button>`);
+                                html.push(`<button class="watch-stream-btn" data-url="${stream.hls_url}" data-name="${escapeHtml(stream.name)}" data-stream-name="${stream.name}" style="flex: 1; padding: 12px; font-size: 15px; background: #4CAF50; color: white; border: none; border-radius: 6px; cursor: pointer;">▶️ Watch</button>`);
+                                html.push(`<button class="share-link-btn" data-stream-name="${escapeHtml(stream.name).replace(/'/g, "\\'")}" data-share-mode="${shareMode}" style="padding: 12px 16px; font-size: 15px; background: #2196F3; color: white; border: none; border-radius: 6px; cursor: pointer; min-width: 100px;">🔗 Share</button>`);
+                                html.push(`</div>`);
+                                html.push(`</div>`);
                             });
-                            html += '</div>';
+                            html.push('</div>');
                         } else {
                             // Table layout for desktop
-                            html = '<table style="width: 100%; border-collapse: collapse; margin-top: 20px;">';
-                        html += '<thead><tr style="background: #383838; border-bottom: 2px solid #4a4a4a;">';
-                        html += '<th style="padding: 12px; text-align: left;">Group</th>';
-                        html += '<th style="padding: 12px; text-align: left;">User</th>';
-                        html += '<th style="padding: 12px; text-align: left;">Stream Name</th>';
-                        html += '<th style="padding: 12px; text-align: center;">Viewers</th>';
-                        html += '<th style="padding: 12px; text-align: center;">Actions</th>';
-                        html += '</tr></thead><tbody>';
+                            html.push('<table style="width: 100%; border-collapse: collapse; margin-top: 20px;">');
+                        html.push('<thead><tr style="background: #383838; border-bottom: 2px solid #4a4a4a;">');
+                        html.push('<th style="padding: 12px; text-align: left;">Group</th>');
+                        html.push('<th style="padding: 12px; text-align: left;">User</th>');
+                        html.push('<th style="padding: 12px; text-align: left;">Stream Name</th>');
+                        html.push('<th style="padding: 12px; text-align: center;">Viewers</th>');
+                        html.push('<th style="padding: 12px; text-align: center;">Actions</th>');
+                        html.push('</tr></thead><tbody>');
                         
                         data.streams.forEach(stream => {
                             const shareMode = stream.share_mode || 'private';
-                            html += '<tr style="border-bottom: 1px solid #4a4a4a;">';
+                            html.push('<tr style="border-bottom: 1px solid #4a4a4a;">');
                             
                             // Group column
                             let groupDisplay = stream.publisher_group || '<span style="color: #666;">-</span>';
-                            html += `<td style="padding: 12px;"><span style="color: #4a9eff; font-weight: bold;">${groupDisplay}</span></td>`;
+                            html.push(`<td style="padding: 12px;"><span style="color: #4a9eff; font-weight: bold;">${groupDisplay}</span></td>`);
                             
                             // User column
                             let userDisplay = stream.publisher_username ? `@${stream.publisher_username}` : '<span style="color: #666;">-</span>';
-                            html += `<td style="padding: 12px;"><span style="color: #999;">${userDisplay}</span></td>`;
+                            html.push(`<td style="padding: 12px;"><span style="color: #999;">${userDisplay}</span></td>`);
                             
                             // Stream name column + share mode badge
-                            html += `<td style="padding: 12px;"><strong>${stream.name}</strong> <button class="share-mode-badge" data-stream-name="${escapeHtml(stream.name).replace(/'/g, "\\'")}" data-mode="${shareMode}" style="margin-left:8px;padding:2px 8px;font-size:11px;font-weight:bold;border-radius:4px;border:none;cursor:pointer;background:${shareMode === 'public' ? '#16a34a' : '#dc2626'};color:#fff;" title="Link sharing: ${shareMode === 'public' ? 'Static link' : 'Token link'}. Click to toggle (admin).">${shareMode === 'public' ? 'Public' : 'Private'}</button></td>`;
+                            html.push(`<td style="padding: 12px;"><strong>${stream.name}</strong> <button class="share-mode-badge" data-stream-name="${escapeHtml(stream.name).replace(/'/g, "\\'")}" data-mode="${shareMode}" style="margin-left:8px;padding:2px 8px;font-size:11px;font-weight:bold;border-radius:4px;border:none;cursor:pointer;background:${shareMode === 'public' ? '#16a34a' : '#dc2626'};color:#fff;" title="Link sharing: ${shareMode === 'public' ? 'Static link' : 'Token link'}. Click to toggle (admin).">${shareMode === 'public' ? 'Public' : 'Private'}</button></td>`);
                             
                             // Show viewer count with breakdown
                             let viewerDisplay = `<strong style="color: #4caf50;">${stream.readers}</strong>`;
-                            if (stream.reader_breakdown && Object.keys(stream.reader_breakdown).length > 0) {
-                                viewerDisplay += `<div style="font-size: 11px; color: #999; margin-top: 4px;">`;
-                                const breakdown = Object.entries(stream.reader_breakdown)
-                                    .map(([type, count]) => `${type}: ${count}`)
-                                    .join(' | ');
-                                viewerDisplay += breakdown;
-                                viewerDisplay += `</div>`;
+                            let breakdown = '';
+                            for (const type in stream.reader_breakdown) {
+                                if (breakdown) breakdown += ' | ';
+                                breakdown += type + ': ' + stream.reader_breakdown[type];
                             }
-                            html += `<td style="padding: 12px; text-align: center;">${viewerDisplay}</td>`;
-                            html += `<td style="padding: 12px; text-align: center;">`;
-                            html += `<button class="watch-stream-btn" data-url="${stream.hls_url}" data-name="${escapeHtml(stream.name)}" data-stream-name="${stream.name}" style="padding: 8px 16px; font-size: 14px; display: inline-flex; align-items: center; gap: 6px; background: #4CAF50; color: white; border: none; border-radius: 4px; cursor: pointer;">`;
-                            html += `<span style="font-size: 16px;">▶️</span> Watch</button>`;
-                            html += ` <button class="share-link-btn" data-stream-name="${escapeHtml(stream.name).replace(/'/g, "\\'")}" data-share-mode="${shareMode}" style="padding: 8px 16px; font-size: 14px; background: #2196F3; color: white; border: none; border-radius: 4px; cursor: pointer;">🔗 Share</button>`;
-                            html += `</td>`;
-                            html += '</tr>';
+                            if (breakdown) {
+                                viewerDisplay += `<div style="font-size: 11px; color: #999; margin-top: 4px;">${breakdown}</div>`;
+                            }
+                            html.push(`<td style="padding: 12px; text-align: center;">${viewerDisplay}</td>`);
+                            html.push(`<td style="padding: 12px; text-align: center;">`);
+                            html.push(`<button class="watch-stream-btn" data-url="${stream.hls_url}" data-name="${escapeHtml(stream.name)}" data-stream-name="${stream.name}" style="padding: 8px 16px; font-size: 14px; display: inline-flex; align-items: center; gap: 6px; background: #4CAF50; color: white; border: none; border-radius: 4px; cursor: pointer;">`);
+                            html.push(`<span style="font-size: 16px;">▶️</span> Watch</button>`);
+                            html.push(` <button class="share-link-btn" data-stream-name="${escapeHtml(stream.name).replace(/'/g, "\\'")}" data-share-mode="${shareMode}" style="padding: 8px 16px; font-size: 14px; background: #2196F3; color: white; border: none; border-radius: 4px; cursor: pointer;">🔗 Share</button>`);
+                            html.push(`</td>`);
+                            html.push('</tr>');
                         });
                         
-                        html += '</tbody></table>';
+                        html.push('</tbody></table>');
                         } // end desktop else
                         
-                        container.innerHTML = html;
+                        container.innerHTML = html.join('');
                         
-                        // Add click handlers for all Watch buttons
-                        document.querySelectorAll('.watch-stream-btn').forEach(btn => {
-                            btn.addEventListener('click', function() {
-                                const isMobile = window.innerWidth <= 768;
-                                const streamName = this.getAttribute('data-stream-name');
-                                if (isMobile && streamName) {
-                                    // Navigate directly to watch page on mobile
-                                    window.location.href = '/watch/' + streamName;
-                                } else {
-                                    watchStream(this.getAttribute('data-url'));
-                                }
-                            });
-                        });
-                        // Share link (Active Streams): always generate a 4-hour token and copy (no modal)
-                        document.querySelectorAll('.share-link-btn').forEach(btn => {
-                            btn.addEventListener('click', function() {
-                                const streamName = this.getAttribute('data-stream-name');
-                                if (!streamName) return;
-                                const el = this;
-                                el.disabled = true;
-                                el.textContent = '…';
-                                fetch('/api/share-links/generate', { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify({ stream: streamName, ttl: 14400 }) })
-                                    .then(function(r) { return r.json(); })
-                                    .then(function(d) {
-                                        if (d.ok && d.url) {
-                                            navigator.clipboard.writeText(d.url).catch(function() {
-                                                var inp = document.createElement('input'); inp.value = d.url; document.body.appendChild(inp); inp.select(); document.execCommand('copy'); document.body.removeChild(inp);
-                                            });
-                                            el.textContent = '✅ Link copied (4h)';
-                                            el.style.background = '#16a34a';
-                                        } else {
-                                            el.textContent = '🔗 Share';
-                                            if (d.error) alert('Error: ' + d.error);
-                                        }
-                                        el.disabled = false;
-                                        setTimeout(function() { el.textContent = '🔗 Share'; el.style.background = '#2196F3'; }, 3000);
-                                    })
-                                    .catch(function() {
-                                        el.textContent = '🔗 Share';
-                                        el.disabled = false;
-                                        alert('Request failed');
-                                    });
-                            });
-                        });
-                        // Share mode toggle (Public/Private): admin only, only affects link sharing
-                        document.querySelectorAll('.share-mode-badge').forEach(btn => {
-                            btn.addEventListener('click', function() {
-                                const streamName = this.getAttribute('data-stream-name');
-                                const cur = this.getAttribute('data-mode') || 'private';
-                                const next = cur === 'public' ? 'private' : 'public';
-                                const row = this.closest('tr');
-                                const card = this.closest('div[style*="border-radius: 8px"]');
-                                const shareBtn = (row || card) ? (row || card).querySelector('.share-link-btn') : null;
-                                this.disabled = true;
-                                fetch('/api/share-mode', { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify({ stream: streamName, mode: next }) })
-                                    .then(r => r.json()).then(d => {
-                                        if (d.ok) {
-                                            this.setAttribute('data-mode', next);
-                                            this.textContent = next === 'public' ? 'Public' : 'Private';
-                                            this.style.background = next === 'public' ? '#16a34a' : '#dc2626';
-                                            this.title = 'Link sharing: ' + (next === 'public' ? 'Static link' : 'Token link') + '. Click to toggle (admin).';
-                                            if (shareBtn) shareBtn.setAttribute('data-share-mode', next);
-                                        }
-                                    }).finally(() => { this.disabled = false; });
-                            });
-                        });
                     } else {
                         container.innerHTML = '<p style="color: #999; margin-top: 20px;">No active streams. Publish a stream via RTSP, SRT, or RTMP to see it here.</p>';
                     }
+                    return !data.error;  // MediaMTX not answering counts as a failed refresh
                 })
                 .catch(err => {
+                    if (err.name === 'AbortError') return;  // superseded, or the page was hidden
+                    streamsRenderKey = null;
                     document.getElementById('streams-container').innerHTML = '<p style="color: #f44336;">Error loading streams: ' + err.message + '</p>';
+                    return false;
+                })
+                .finally(() => {
+                    if (streamsController === controller) streamsController = null;
                 });
         }
         
-        // View stream in popup
-        function viewStream(url, name) {
-            const popup = window.open('', 'Stream: ' + name, 'width=800,height=600');
-            if (!popup) return;
-            popup.document.open();
-            popup.document.write(`
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <title>Stream: ${name}</title>
-                    <script src="https://cdn.jsdelivr.net/npm/hls.js@latest"><\/script>
-                </head>
-                <body style="margin: 0; background: #000;">
-                    <video id="video" controls style="width: 100%; height: 100%;"></video>
-                    <script>
-                        const video = document.getElementById('video');
-                        const url = '${url}';
-                        
-                        if (Hls.isSupported()) {
-                            const hls = new Hls({
-                                enableWorker: true,
-                                lowLatencyMode: false,
-                                maxBufferLength: 30,
-                                maxMaxBufferLength: 60,
-                                liveSyncDurationCount: 5,
-                                liveMaxLatencyDurationCount: 7,
-                                liveBackBufferLength: -1
-                            });
-                            hls.loadSource(url);
-                            hls.attachMedia(video);
-                        } else if (video.canPlayType('application/vnd.apple.mpegurl')) {
-                            video.src = url;
-                        }
-                    <\/script>
-                </body>
-                </html>
-            `);
+        // Watch / Share / Public-Private buttons in the streams list - bound once here
+        // rather than on every row each time the list is rebuilt
+        const streamsContainer = document.getElementById('streams-container');
+        if (streamsContainer) {
+            streamsContainer.addEventListener('click', (e) => {
+                const btn = e.target.closest('.watch-stream-btn, .share-link-btn, .share-mode-badge');
+                if (!btn) return;
+                if (btn.classList.contains('watch-stream-btn')) {
+                    watchStreamClicked(btn);
+                } else if (btn.classList.contains('share-link-btn')) {
+                    shareLinkClicked(btn);
+                } else {
+                    shareModeClicked(btn);
+                }
+            });
+        }
+        
+        // Watch: player popup, or the watch page on mobile
+        function watchStreamClicked(btn) {
+            const isMobile = window.innerWidth <= 768;
+            const streamName = btn.getAttribute('data-stream-name');
+            if (isMobile && streamName) {
+                // Navigate directly to watch page on mobile
+                window.location.href = '/watch/' + streamName;
+            } else {
+                watchStream(btn.getAttribute('data-url'));
+            }
+        }
+        
+        // Share link (Active Streams): always generate a 4-hour token and copy (no modal)
+        function shareLinkClicked(btn) {
+            const streamName = btn.getAttribute('data-stream-name');
+            if (!streamName) return;
+            const el = btn;
+            el.disabled = true;
+            el.textContent = '…';
+            fetch('/api/share-links/generate', { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify({ stream: streamName, ttl: 14400 }) })
+                .then(function(r) { return r.json(); })
+                .then(function(d) {
+                    if (d.ok && d.url) {
+                        navigator.clipboard.writeText(d.url).catch(function() {
+                            var inp = document.createElement('input'); inp.value = d.url; document.body.appendChild(inp); inp.select(); document.execCommand('copy'); document.body.removeChild(inp);
+                        });
+                        el.textContent = '✅ Link copied (4h)';
+                        el.style.background = '#16a34a';
+                    } else {
+                        el.textContent = '🔗 Share';
+                        if (d.error) alert('Error: ' + d.error);
+                    }
+                    el.disabled = false;
+                    setTimeout(function() { el.textContent = '🔗 Share'; el.style.background = '#2196F3'; }, 3000);
+                })
+                .catch(function() {
+                    el.textContent = '🔗 Share';
+                    el.disabled = false;
+                    alert('Request failed');
+                });
+        }
+        
+        // Share mode toggle (Public/Private): admin only, only affects link sharing
+        function shareModeClicked(btn) {
+            const streamName = btn.getAttribute('data-stream-name');
+            const cur = btn.getAttribute('data-mode') || 'private';
+            const next = cur === 'public' ? 'private' : 'public';
+            const row = btn.closest('tr');
+            const card = btn.closest('div[style*="border-radius: 8px"]');
+            const shareBtn = (row || card) ? (row || card).querySelector('.share-link-btn') : null;
+            btn.disabled = true;
+            fetch('/api/share-mode', { method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify({ stream: streamName, mode: next }) })
+                .then(r => r.json()).then(d => {
+                    if (d.ok) {
+                        btn.setAttribute('data-mode', next);
+                        btn.textContent = next === 'public' ? 'Public' : 'Private';
+                        btn.style.background = next === 'public' ? '#16a34a' : '#dc2626';
+                        btn.title = 'Link sharing: ' + (next === 'public' ? 'Static link' : 'Token link') + '. Click to toggle (admin).';
+                        if (shareBtn) shareBtn.setAttribute('data-share-mode', next);
+                    }
+                }).finally(() => { btn.disabled = false; });
         }
         
         // HLS Tuning presets
@@ -3654,23 +4526,11 @@ HTML_TEMPLATE = '''
             Object.keys(p).forEach(k => setVal(k, p[k]));
         }
 
-        // Active Streams auto-refresh
-        let streamsRefreshInterval = null;
-        
-        // Load streams when streams tab is shown
+        // Load streams when the page opens on the streams tab
         document.addEventListener('DOMContentLoaded', () => {
             const streamsTab = document.getElementById('streams');
             if (streamsTab && streamsTab.classList.contains('active')) {
                 loadStreams();
-                // Start auto-refresh
-                if (!streamsRefreshInterval) {
-                    streamsRefreshInterval = setInterval(() => {
-                        const streamsTab = document.getElementById('streams');
-                        if (streamsTab && streamsTab.classList.contains('active')) {
-                            loadStreams();
-                        }
-                    }, 5000); // Refresh every 5 seconds
-                }
             }
         });
         
@@ -3777,33 +4637,33 @@ HTML_TEMPLATE = '''
                         return 0;
                     });
                     
-                    var html = '<table style="width:100%;border-collapse:collapse;margin-top:20px">';
-                    html += '<thead><tr style="background:#383838;border-bottom:2px solid #4a4a4a">';
-                    html += makeSortHeader('username', 'Username');
-                    html += makeSortHeader('agency', 'Agency');
-                    html += makeSortHeader('email', 'Email');
-                    html += makeSortHeader('role', 'Role');
-                    html += '<th style="padding:12px;text-align:left">Actions</th>';
-                    html += '</tr></thead><tbody>';
+                    var html = ['<table style="width:100%;border-collapse:collapse;margin-top:20px">'];
+                    html.push('<thead><tr style="background:#383838;border-bottom:2px solid #4a4a4a">');
+                    html.push(makeSortHeader('username', 'Username'));
+                    html.push(makeSortHeader('agency', 'Agency'));
+                    html.push(makeSortHeader('email', 'Email'));
+                    html.push(makeSortHeader('role', 'Role'));
+                    html.push('<th style="padding:12px;text-align:left">Actions</th>');
+                    html.push('</tr></thead><tbody>');
                     
                     data.users.forEach(user => {
-                        html += `<tr id="user-row-${user.username}" style="border-bottom: 1px solid #4a4a4a;">`;
-                        html += `<td style="padding: 12px;"><strong>${user.username}</strong></td>`;
-                        html += `<td style="padding: 12px; color: #4a9eff; font-size: 13px;">${user.agency || '<span style="color:#666;">—</span>'}</td>`;
-                        html += `<td style="padding: 12px; color: #999; font-size: 13px;">${user.email || '<span style="color:#666;">—</span>'}</td>`;
-                        html += `<td style="padding: 12px;">${user.role}</td>`;
-                        html += `<td style="padding: 12px; white-space: nowrap;">`;
-                        html += `<button class="btn" style="padding: 6px 12px; font-size: 13px; background: #2196F3; color: white; border: none; border-radius: 4px; cursor: pointer; margin-right: 6px;" onclick="editUser('${user.username}', '${user.email || ''}', '${user.agency || ''}', '${user.role}')">✏️ Edit</button>`;
-                        if (user.username !== '{{ username }}') {
-                            html += `<button class="btn btn-danger" style="padding: 6px 12px; font-size: 13px;" onclick="deleteUser('${user.username}')">🗑 Delete</button>`;
+                        html.push(`<tr id="user-row-${user.username}" style="border-bottom: 1px solid #4a4a4a;">`);
+                        html.push(`<td style="padding: 12px;"><strong>${user.username}</strong></td>`);
+                        html.push(`<td style="padding: 12px; color: #4a9eff; font-size: 13px;">${user.agency || '<span style="color:#666;">—</span>'}</td>`);
+                        html.push(`<td style="padding: 12px; color: #999; font-size: 13px;">${user.email || '<span style="color:#666;">—</span>'}</td>`);
+                        html.push(`<td style="padding: 12px;">${user.role}</td>`);
+                        html.push(`<td style="padding: 12px; white-space: nowrap;">`);
+                        html.push(`<button class="btn" style="padding: 6px 12px; font-size: 13px; background: #2196F3; color: white; border: none; border-radius: 4px; cursor: pointer; margin-right: 6px;" onclick="editUser('${user.username}', '${user.email || ''}', '${user.agency || ''}', '${user.role}')">✏️ Edit</button>`);
+                        if (user.username !== EDITOR_PAGE.username) {
+                            html.push(`<button class="btn btn-danger" style="padding: 6px 12px; font-size: 13px;" onclick="deleteUser('${user.username}')">🗑 Delete</button>`);
                         } else {
-                            html += '<span style="color: #999; font-size: 12px;">(you)</span>';
+                            html.push('<span style="color: #999; font-size: 12px;">(you)</span>');
                         }
-                        html += '</td></tr>';
+                        html.push('</td></tr>');
                     });
                     
-                    html += '</tbody></table>';
-                    container.innerHTML = html;
+                    html.push('</tbody></table>');
+                    container.innerHTML = html.join('');
                 });
         }
         
@@ -3981,9 +4841,14 @@ HTML_TEMPLATE = '''
                 })
                 .catch(() => {});
         }
-        setInterval(pollPendingCount, 30000);
+        setInterval(() => {
+            if (!document.hidden) pollPendingCount();
+        }, 30000);
+        document.addEventListener('visibilitychange', () => {
+            if (!document.hidden) pollPendingCount();
+        });
         // Set badge immediately from server-side count
-        updatePendingDisplay({{ pending_count }});
+        updatePendingDisplay(EDITOR_PAGE.pendingCount);
         
         function approveRegistration(username, index) {
             const role = document.getElementById('approve-role-' + index).value;
@@ -4029,8 +4894,11 @@ HTML_TEMPLATE = '''
             document.getElementById('email-notify-fields').style.display = method !== 'disabled' ? 'block' : 'none';
         }
         
-        function togglePasswordVisibility(fieldId, btn) {
-            const field = document.getElementById(fieldId);
+        // Show/Hide buttons next to password fields (class="pw-toggle" data-target="<input id>")
+        document.addEventListener('click', (e) => {
+            const btn = e.target.closest('.pw-toggle');
+            if (!btn) return;
+            const field = document.getElementById(btn.dataset.target);
             if (field.type === 'password') {
                 field.type = 'text';
                 btn.textContent = 'Hide';
@@ -4038,7 +4906,7 @@ HTML_TEMPLATE = '''
                 field.type = 'password';
                 btn.textContent = 'Show';
             }
-        }
+        });
         
         function toggleEmailSection() {
             const form = document.getElementById('email-config-form');
@@ -4207,6 +5075,14 @@ HTML_TEMPLATE = '''
             }
         }
         
+        // Characters MediaMTX accepts in credentials (no spaces, commas, apostrophes, slashes)
+        const MTX_ALLOWED = /^[A-Za-z0-9!$()*.+;<=>\[\]^_\-"@#&]+$/;
+        
+        function validateMtxField(value, label) {
+            if (MTX_ALLOWED.test(value)) return null;
+            return label + ' contains invalid characters!\\n\\nAllowed: A-Z, 0-9, !$()*.@#& etc.\\nNOT allowed: spaces, commas, apostrophes, slashes';
+        }
+        
         document.getElementById('mediamtx-user-form')?.addEventListener('submit', function(e) {
             e.preventDefault();
             
@@ -4239,16 +5115,10 @@ HTML_TEMPLATE = '''
                 return;
             }
             
-            // Validate MediaMTX allowed characters (no spaces, commas, apostrophes, slashes)
-            const allowedChars = /^[A-Za-z0-9!$()*.+;<=>\[\]^_\-"@#&]+$/;
-            
-            if (!allowedChars.test(username)) {
-                alert('Username contains invalid characters!\\n\\nAllowed: A-Z, 0-9, !$()*.@#& etc.\\nNOT allowed: spaces, commas, apostrophes, slashes');
-                return;
-            }
-            
-            if (password && !allowedChars.test(password)) {
-                alert('Password contains invalid characters!\\n\\nAllowed: A-Z, 0-9, !$()*.@#& etc.\\nNOT allowed: spaces, commas, apostrophes, slashes');
+            const credentialError = validateMtxField(username, 'Username') ||
+                (password ? validateMtxField(password, 'Password') : null);
+            if (credentialError) {
+                alert(credentialError);
                 return;
             }
             
@@ -4297,11 +5167,35 @@ HTML_TEMPLATE = '''
                         alert('Error adding user: ' + data.error);
                     }
                 });
-            }
-        });
+            }
+        });
+        
+
+        // The YAML editor isn't embedded in the page; it's fetched when the Advanced tab
+        // is first opened, and Save stays disabled until it has arrived
+        let yamlEditorLoaded = false;
+        
+        function loadYAMLEditor() {
+            if (yamlEditorLoaded) return;
+            yamlEditorLoaded = true;
+            const textarea = document.getElementById('yaml-textarea');
+            fetch('/api/yaml/content')
+                .then(response => {
+                    if (!response.ok) throw new Error('HTTP ' + response.status);
+                    return response.text();
+                })
+                .then(yamlText => {
+                    textarea.value = yamlText;
+                    document.getElementById('yaml-fieldset').disabled = false;
+                })
+                .catch(err => {
+                    yamlEditorLoaded = false;  // try again next time the tab is opened
+                    textarea.placeholder = 'Could not load mediamtx.yml: ' + err.message;
+                });
+        }
         
-
         function reloadYAMLContent() {
+            if (!yamlEditorLoaded) return;  // loaded fresh when the Advanced tab is opened
             // Fetch fresh YAML content
             fetch('/api/yaml/content')
                 .then(response => response.text())
@@ -4315,7 +5209,8 @@ HTML_TEMPLATE = '''
         }
         
         // === EXTERNAL SOURCES ===
-        let sourcesRefreshInterval = null;
+        
+        const STREAM_NAME_RE = /^[a-z0-9_]+$/;
         
         const SRT_PROFILES = {
             'default': {latency: 120, peerlatency: 120, rcvlatency: 120, payloadsize: 1316, lossmaxttl: 0, tlpktdrop: true, nakreport: true,
@@ -4405,11 +5300,8 @@ HTML_TEMPLATE = '''
         
         function updateSourceFormFields() {
             const protocol = document.getElementById('source-protocol').value;
-            document.getElementById('srt-source-fields').style.display = protocol === 'srt' ? 'block' : 'none';
-            document.getElementById('rtsp-source-fields').style.display = protocol === 'rtsp' ? 'block' : 'none';
-            document.getElementById('udp-source-fields').style.display = protocol === 'udp' ? 'block' : 'none';
-            document.getElementById('rtmp-source-fields').style.display = protocol === 'rtmp' ? 'block' : 'none';
-            document.getElementById('hls-source-fields').style.display = protocol === 'hls' ? 'block' : 'none';
+            document.querySelectorAll('.source-fields.active').forEach(el => el.classList.remove('active'));
+            document.getElementById(protocol + '-source-fields')?.classList.add('active');
         }
         
         // Use delegation so submit is handled even if form was not in DOM when script ran (e.g. tab loaded later)
@@ -4429,7 +5321,7 @@ HTML_TEMPLATE = '''
             }
             
             // Validate name: lowercase, numbers, underscores only
-            if (!/^[a-z0-9_]+$/.test(name)) {
+            if (!STREAM_NAME_RE.test(name)) {
                 alert('Stream name must be lowercase letters, numbers, and underscores only');
                 return;
             }
@@ -5046,6 +5938,15 @@ HTML_TEMPLATE = '''
             });
         }
         
+        // Last markup written to #mediamtx-users-list, so a reload with no changes leaves the DOM alone
+        let renderedMediaMTXUsersHtml = null;
+        
+        function setMediaMTXUsersHtml(container, html) {
+            if (html === renderedMediaMTXUsersHtml) return;
+            renderedMediaMTXUsersHtml = html;
+            container.innerHTML = html;
+        }
+        
         function loadMediaMTXUsers(retryCount) {
             retryCount = retryCount || 0;
             fetch('/api/mediamtx/users')
@@ -5060,7 +5961,7 @@ HTML_TEMPLATE = '''
                     }
                     
                     if (!data.users || data.users.length === 0) {
-                        container.innerHTML = '<p style="color: #999;">No users configured. Click "Add Authorized User" to create one.</p>';
+                        setMediaMTXUsersHtml(container, '<p style="color: #999;">No users configured. Click "Add Authorized User" to create one.</p>');
                         return;
                     }
                     
@@ -5148,7 +6049,8 @@ HTML_TEMPLATE = '''
                         html += '</div></div>';
                     });
                     
-                    container.innerHTML = html;
+                    // One write for the whole list (rows are built as a string, nothing reads layout in between)
+                    setMediaMTXUsersHtml(container, html);
                     
                     // Also populate the group dropdown with unique groups
                     populateGroupDropdown(data.users);
@@ -5167,13 +6069,14 @@ HTML_TEMPLATE = '''
                 }
             });
             
-            // Populate datalist
-            datalist.innerHTML = '';
+            // Populate datalist - build the options off-document and swap them in at once
+            const frag = document.createDocumentFragment();
             groups.forEach(groupName => {
                 const option = document.createElement('option');
                 option.value = groupName;
-                datalist.appendChild(option);
+                frag.appendChild(option);
             });
+            datalist.replaceChildren(frag);
         }
         
         // Load MediaMTX users if on users tab
@@ -5217,13 +6120,20 @@ HTML_TEMPLATE = '''
                 progressBar.style.width = '0%';
                 progressBar.style.background = '#4CAF50';
                 statusText.textContent = 'Uploading...';
-                currentUploadXHR = new XMLHttpRequest();
-                currentUploadXHR.upload.addEventListener('progress', function(e) {
-                    if (e.lengthComputable) {
-                        var percent = (e.loaded / e.total) * 100;
-                        progressBar.style.width = percent + '%';
-                        statusText.textContent = 'Uploading: ' + Math.round(percent) + '%';
-                    }
+                var xhr = currentUploadXHR = new XMLHttpRequest();
+                // Progress events can outpace the screen - paint the latest one once per frame
+                var uploadPercent = 0;
+                var progressFrame = null;
+                xhr.upload.addEventListener('progress', function(e) {
+                    if (!e.lengthComputable) return;
+                    uploadPercent = (e.loaded / e.total) * 100;
+                    if (progressFrame) return;
+                    progressFrame = requestAnimationFrame(function() {
+                        progressFrame = null;
+                        if (currentUploadXHR !== xhr) return;  // finished/cancelled meanwhile
+                        progressBar.style.width = uploadPercent + '%';
+                        statusText.textContent = 'Uploading: ' + Math.round(uploadPercent) + '%';
+                    });
                 });
                 currentUploadXHR.addEventListener('load', function() {
                     cancelBtn.style.display = 'none';
@@ -5512,9 +6422,17 @@ HTML_TEMPLATE = '''
             });
         }
         
+        // URLs currently shown in the Stream URLs box - starting another file on the
+        // same server gives the same URLs, so the box is left as it is
+        var streamUrlsKey = null;
+        
         function updateStreamURLs() {
             // Get server info for URLs
             fetch('/api/stream-urls').then(function(r) { return r.json(); }).then(function(data) {
+                var key = data.rtsp + '|' + data.srt + '|' + data.hls;
+                if (key === streamUrlsKey) return;
+                streamUrlsKey = key;
+                
                 var html = '<div style="line-height: 2.2;">';
                 
                 // Add warning at the top
@@ -5588,6 +6506,7 @@ HTML_TEMPLATE = '''
             if (!confirm('Stop streaming?')) return;
             fetch('/api/test/stream/stop', {method: 'POST'}).then(function(r) { return r.json(); }).then(function(data) {
                 if (data.success) {
+                    streamUrlsKey = null;
                     document.getElementById('stream-urls-content').innerHTML = '<p style="color: #999; font-style: italic;">Start streaming to see URLs...</p>';
                     loadTestFiles();
                 } else {
@@ -5661,10 +6580,14 @@ HTML_TEMPLATE = '''
             }).replace(/(\d+)\/(\d+)\/(\d+),/, '$3-$1-$2'); // Format as YYYY-MM-DD HH:MM:SS
         }
         
+        // Arrow keys through the list fire a change per step - reload once it settles
+        const reloadRecordingsForTimezone = debounce(loadRecordings, 300);
+        
         function saveTimezone() {
             const timezone = document.getElementById('recording-timezone').value;
+            if (timezone === (localStorage.getItem('recording-timezone') || 'UTC')) return;
             localStorage.setItem('recording-timezone', timezone);
-            loadRecordings(); // Reload with new timezone
+            reloadRecordingsForTimezone(); // Reload with new timezone
         }
         
         function loadDiskUsage() {
@@ -5888,33 +6811,23 @@ HTML_TEMPLATE = '''
         
         // === DASHBOARD FUNCTIONS ===
         
-        function drawGauge(canvasId, percent, color) {
-            const canvas = document.getElementById(canvasId);
-            if (!canvas) return;
-            
-            const ctx = canvas.getContext('2d');
-            const centerX = 100;
-            const centerY = 100;
-            const radius = 80;
-            
-            // Clear canvas
-            ctx.clearRect(0, 0, 200, 200);
-            
-            // Background circle
-            ctx.beginPath();
-            ctx.arc(centerX, centerY, radius, 0, 2 * Math.PI);
-            ctx.strokeStyle = '#2a2a2a';
-            ctx.lineWidth = 20;
-            ctx.stroke();
+        // Gauges are SVG rings - an update sets the fill circle's dash offset and colour from
+        // renderTick's animation frame and CSS transitions the rest; unchanged readings are skipped
+        const drawnGauges = {};
+        
+        function drawGauge(gaugeId, percent, color) {
+            let drawn = drawnGauges[gaugeId];
+            if (!drawn) {
+                const fill = document.querySelector('#' + gaugeId + ' .gauge-fill');
+                if (!fill) return;
+                drawn = drawnGauges[gaugeId] = {fill: fill, percent: null, color: null};
+            }
+            if (drawn.percent === percent && drawn.color === color) return;
+            drawn.percent = percent;
+            drawn.color = color;
             
-            // Progress arc
-            const angle = (percent / 100) * 2 * Math.PI;
-            ctx.beginPath();
-            ctx.arc(centerX, centerY, radius, -0.5 * Math.PI, -0.5 * Math.PI + angle);
-            ctx.strokeStyle = color;
-            ctx.lineWidth = 20;
-            ctx.lineCap = 'round';
-            ctx.stroke();
+            drawn.fill.style.strokeDashoffset = 100 - Math.min(Math.max(percent, 0), 100);
+            drawn.fill.style.stroke = color;
         }
         
         function formatBytes(bytes) {
@@ -5935,67 +6848,84 @@ HTML_TEMPLATE = '''
             return `${mins}m`;
         }
         
-        function loadDashboardMetrics() {
-            fetch('/api/dashboard/metrics')
-                .then(r => r.json())
-                .then(data => {
-                    // Update big stat cards
-                    document.getElementById('active-streams-count').textContent = data.active_streams || 0;
-                    document.getElementById('total-viewers-count').textContent = data.total_viewers || 0;
-                    document.getElementById('recordings-size').textContent = formatBytes(data.recordings_size || 0);
-                    document.getElementById('server-uptime').textContent = formatUptime(data.uptime || 0);
-                    
-                    // Update CPU gauge
-                    const cpuPercent = Math.round(data.cpu_percent || 0);
-                    document.getElementById('cpu-percent').textContent = cpuPercent + '%';
-                    const cpuColor = cpuPercent > 80 ? '#f44336' : cpuPercent > 60 ? '#FF9800' : '#4CAF50';
-                    drawGauge('cpu-gauge', cpuPercent, cpuColor);
-                    
-                    // Update RAM gauge
-                    const ramPercent = Math.round(data.ram_percent || 0);
-                    document.getElementById('ram-percent').textContent = ramPercent + '%';
-                    const ramColor = ramPercent > 80 ? '#f44336' : ramPercent > 60 ? '#FF9800' : '#4CAF50';
-                    drawGauge('ram-gauge', ramPercent, ramColor);
-                    
-                    // Update Disk usage
-                    const diskPercent = Math.round(data.disk_percent || 0);
-                    document.getElementById('disk-percent').textContent = diskPercent + '%';
-                    document.getElementById('disk-details').textContent = 
-                        `${formatBytes(data.disk_used || 0)} / ${formatBytes(data.disk_total || 0)}`;
-                    
-                    // Update Network (bandwidth rate)
-                    document.getElementById('network-rx').textContent = formatBytes(data.network_rx_rate || 0) + '/s';
-                    document.getElementById('network-tx').textContent = formatBytes(data.network_tx_rate || 0) + '/s';
-                })
-                .catch(err => console.error('Dashboard error:', err));
-        }
+        // Dashboard text fields, looked up on the first render rather than every tick
+        let dashboardEls = null;
         
-        // Auto-refresh dashboard every 5 seconds
-        let dashboardInterval;
+        function renderDashboardMetrics(data) {
+            if (!dashboardEls) {
+                dashboardEls = {};
+                ['active-streams-count', 'total-viewers-count', 'recordings-size', 'server-uptime',
+                 'cpu-percent', 'ram-percent', 'disk-percent', 'disk-details', 'network-rx', 'network-tx']
+                    .forEach(id => { dashboardEls[id] = document.getElementById(id); });
+            }
+            const el = dashboardEls;
+            
+            // Update big stat cards
+            el['active-streams-count'].textContent = data.active_streams || 0;
+            el['total-viewers-count'].textContent = data.total_viewers || 0;
+            el['recordings-size'].textContent = formatBytes(data.recordings_size || 0);
+            el['server-uptime'].textContent = formatUptime(data.uptime || 0);
+            
+            // Update CPU gauge
+            const cpuPercent = Math.round(data.cpu_percent || 0);
+            el['cpu-percent'].textContent = cpuPercent + '%';
+            const cpuColor = cpuPercent > 80 ? '#f44336' : cpuPercent > 60 ? '#FF9800' : '#4CAF50';
+            drawGauge('cpu-gauge', cpuPercent, cpuColor);
+            
+            // Update RAM gauge
+            const ramPercent = Math.round(data.ram_percent || 0);
+            el['ram-percent'].textContent = ramPercent + '%';
+            const ramColor = ramPercent > 80 ? '#f44336' : ramPercent > 60 ? '#FF9800' : '#4CAF50';
+            drawGauge('ram-gauge', ramPercent, ramColor);
+            
+            // Update Disk usage
+            const diskPercent = Math.round(data.disk_percent || 0);
+            el['disk-percent'].textContent = diskPercent + '%';
+            el['disk-details'].textContent = 
+                `${formatBytes(data.disk_used || 0)} / ${formatBytes(data.disk_total || 0)}`;
+            
+            // Update Network (bandwidth rate)
+            el['network-rx'].textContent = formatBytes(data.network_rx_rate || 0) + '/s';
+            el['network-tx'].textContent = formatBytes(data.network_tx_rate || 0) + '/s';
+        }
+        
+        // Dashboard stats ride along on the tick feed while this tab is open
         let updateCheckDone = false;
         
         function startDashboardRefresh() {
-            loadDashboardMetrics();
-            dashboardInterval = setInterval(loadDashboardMetrics, 5000);
+            refreshTicks();
             // Check for updates once per session when dashboard opens
             if (!updateCheckDone) {
                 updateCheckDone = true;
-                setTimeout(checkForUpdate, 1500);  // Slight delay so dashboard loads first
-                setTimeout(checkMediaMTXUpdate, 2000);  // Check MediaMTX version too
+                whenIdle(checkForUpdate, 1500);  // Slight delay so dashboard loads first
+                whenIdle(checkMediaMTXUpdate, 2000);  // Check MediaMTX version too
             }
         }
         
-        function stopDashboardRefresh() {
-            if (dashboardInterval) {
-                clearInterval(dashboardInterval);
-                dashboardInterval = null;
-            }
+        // Run a non-urgent task after a delay, once the browser has nothing better to do
+        function whenIdle(fn, delay) {
+            setTimeout(() => {
+                if (window.requestIdleCallback) {
+                    requestIdleCallback(fn, {timeout: 5000});
+                } else {
+                    fn();
+                }
+            }, delay);
+        }
+        
+        // Wrap fn so a burst of calls runs it once, wait ms after the last one
+        function debounce(fn, wait) {
+            let timer = null;
+            return (...args) => {
+                clearTimeout(timer);
+                timer = setTimeout(() => fn(...args), wait);
+            };
         }
         
         // === UPDATE CHECKER FUNCTIONS ===
         
         function checkForUpdate() {
-            fetch('/api/update/check')
+            fetch('/api/update/check', {priority: 'low'})
             .then(res => res.json())
             .then(data => {
                 if (data.success && data.update_available) {
@@ -6082,7 +7012,7 @@ HTML_TEMPLATE = '''
         }
         
         function checkMediaMTXUpdate() {
-            fetch('/api/mediamtx/version/check')
+            fetch('/api/mediamtx/version/check', {priority: 'low'})
             .then(res => res.json())
             .then(data => {
                 if (data.success && data.update_available) {
@@ -6464,6 +7394,8 @@ HTML_TEMPLATE = '''
                 .then(r => r.text())
                 .then(yaml => {
                     document.getElementById('yaml-textarea').value = yaml;
+                    document.getElementById('yaml-fieldset').disabled = false;
+                    yamlEditorLoaded = true;
                     alert('YAML refreshed!');
                 })
                 .catch(err => alert('Error refreshing YAML: ' + err));
@@ -6587,6 +7519,72 @@ HTML_TEMPLATE = '''
                 });
         }
 
+        // RTSP transport/encryption selects save on change without reloading the page.
+        // Every save restarts MediaMTX, so changes are debounced (arrowing through a
+        // select's options fires one change per option) and never overlap.
+        const PROTOCOL_SAVE_DELAY = 500;
+        let protocolSaveTimer = null;
+        let protocolSaveInFlight = false;
+        let protocolSaveAgain = false;
+        
+        function saveProtocolSelects(form) {
+            if (protocolSaveInFlight) {
+                protocolSaveAgain = true;
+                return;
+            }
+            protocolSaveInFlight = true;
+            const selects = form.querySelectorAll('select.protocol-autosave');
+            const statusMsg = document.createElement('div');
+            statusMsg.style.cssText = 'position: fixed; top: 20px; right: 20px; background: #2196F3; color: white; padding: 15px 20px; border-radius: 6px; z-index: 10000;';
+            statusMsg.textContent = 'Saving protocol settings... Restarting MediaMTX...';
+            document.body.appendChild(statusMsg);
+            
+            fetch('/save_protocols', {
+                method: 'POST',
+                body: new FormData(form),
+                headers: {'X-Requested-With': 'XMLHttpRequest'}
+            })
+                .then(r => r.json())
+                .then(data => {
+                    document.body.removeChild(statusMsg);
+                    if (!data.success) throw new Error(data.message);
+                    selects.forEach(select => {
+                        select.dataset.saved = select.value;
+                        if (select.name === 'rtspEncryption') {
+                            document.querySelectorAll('[data-rtsp-encryption]').forEach(el => {
+                                el.hidden = el.dataset.rtspEncryption !== select.value;
+                            });
+                        }
+                    });
+                    const msg = document.createElement('div');
+                    msg.textContent = '✓ ' + data.message;
+                    msg.style.cssText = 'position: fixed; top: 20px; right: 20px; background: #4CAF50; color: white; padding: 10px 20px; border-radius: 6px; z-index: 10000; font-weight: bold;';
+                    document.body.appendChild(msg);
+                    setTimeout(function() { document.body.removeChild(msg); }, 3000);
+                })
+                .catch(err => {
+                    if (statusMsg.parentNode) document.body.removeChild(statusMsg);
+                    selects.forEach(select => { select.value = select.dataset.saved; });
+                    protocolSaveAgain = false;
+                    alert('Error: ' + err.message);
+                })
+                .finally(() => {
+                    protocolSaveInFlight = false;
+                    if (protocolSaveAgain) {
+                        protocolSaveAgain = false;
+                        saveProtocolSelects(form);
+                    }
+                });
+        }
+        
+        document.querySelectorAll('select.protocol-autosave').forEach(select => {
+            select.dataset.saved = select.value;
+            select.addEventListener('change', () => {
+                clearTimeout(protocolSaveTimer);
+                protocolSaveTimer = setTimeout(() => saveProtocolSelects(select.form), PROTOCOL_SAVE_DELAY);
+            });
+        });
+        
         // Protocol Enable/Disable Toggles
         function loadProtocolStatuses() {
             fetch('/api/protocols/status')
@@ -6642,6 +7640,10 @@ HTML_TEMPLATE = '''
             if (dashboardTab && dashboardTab.classList.contains('active')) {
                 startDashboardRefresh();
             }
+            const advancedTab = document.getElementById('advanced');  // admin only
+            if (advancedTab && advancedTab.classList.contains('active')) {
+                loadYAMLEditor();
+            }
             
             // Stagger status checks to avoid overwhelming the backend
             setTimeout(loadPublicAccessStatus, 100);
@@ -6653,37 +7655,52 @@ HTML_TEMPLATE = '''
         
         // === THEME / STYLING FUNCTIONS ===
         
+        const THEME_PREVIEW_DELAY = 75;
+        
         function updatePreview() {
+            updatePreviewImmediate();
+            applyPreviewColors();
+        }
+        
+        // Cheap part - keep the hex fields in step with the pickers on every change
+        function updatePreviewImmediate() {
+            document.getElementById('theme-headerColor-text').value = document.getElementById('theme-headerColor').value;
+            document.getElementById('theme-headerColorEnd-text').value = document.getElementById('theme-headerColorEnd').value;
+            document.getElementById('theme-accentColor-text').value = document.getElementById('theme-accentColor').value;
+        }
+        
+        // Expensive part - restyling the whole page; a picker drag collapses into one write
+        let appliedPreviewColors = '';
+        const applyPreviewColors = debounce(() => {
             const headerColor = document.getElementById('theme-headerColor').value;
             const headerColorEnd = document.getElementById('theme-headerColorEnd').value;
             const accentColor = document.getElementById('theme-accentColor').value;
             
-            // Sync text inputs with color pickers
-            document.getElementById('theme-headerColor-text').value = headerColor;
-            document.getElementById('theme-headerColorEnd-text').value = headerColorEnd;
-            document.getElementById('theme-accentColor-text').value = accentColor;
-            
-            // Update preview box
-            document.getElementById('preview-header').style.background = 
-                `linear-gradient(135deg, ${headerColor} 0%, ${headerColorEnd} 100%)`;
-            document.getElementById('preview-active-tab').style.color = accentColor;
-            document.getElementById('preview-active-tab').style.borderBottom = `3px solid ${accentColor}`;
-            document.getElementById('preview-section-title').style.color = accentColor;
-            
-            // Live-update the actual page header and accent elements
-            document.querySelector('.header').style.background = 
-                `linear-gradient(135deg, ${headerColor} 0%, ${headerColorEnd} 100%)`;
-            
-            // Update active tab color
-            const activeTab = document.querySelector('.tab.active');
-            if (activeTab) {
-                activeTab.style.color = accentColor;
-                activeTab.style.borderBottomColor = accentColor;
-            }
-            
-            // Update section titles
-            document.querySelectorAll('.section-title').forEach(el => {
-                el.style.color = accentColor;
+            // Re-applying the colors already on the page (same preset clicked again,
+            // Reset on the default theme) would restyle everything for nothing
+            const key = headerColor + '|' + headerColorEnd + '|' + accentColor;
+            if (key === appliedPreviewColors) return;
+            appliedPreviewColors = key;
+            
+            // The preview box and the page itself both paint from these custom properties
+            const root = document.documentElement.style;
+            root.setProperty('--header-color', headerColor);
+            root.setProperty('--header-color-end', headerColorEnd);
+            root.setProperty('--accent-color', accentColor);
+        }, THEME_PREVIEW_DELAY);
+        
+        // Custom Colors: one pair of listeners for all the pickers and their hex fields.
+        // Pickers preview live while dragging; a hex field (data-sync="<picker id>")
+        // is copied to its picker once the edit is committed
+        const colorGrid = document.getElementById('color-grid');
+        if (colorGrid) {
+            colorGrid.addEventListener('input', (e) => {
+                if (e.target.type === 'color') updatePreview();
+            });
+            colorGrid.addEventListener('change', (e) => {
+                const sync = e.target.dataset.sync;
+                if (sync) document.getElementById(sync).value = e.target.value;
+                updatePreview();
             });
         }
         
@@ -6702,6 +7719,9 @@ HTML_TEMPLATE = '''
             if (headerP) headerP.textContent = subtitle;
         }
         
+        // Title/subtitle typing - repaint once the value settles, not per keystroke
+        const scheduleTextPreview = debounce(updateTextPreview, 150);
+        
         function applyPreset(headerColor, headerColorEnd, accentColor) {
             document.getElementById('theme-headerColor').value = headerColor;
             document.getElementById('theme-headerColorEnd').value = headerColorEnd;
@@ -6709,6 +7729,19 @@ HTML_TEMPLATE = '''
             updatePreview();
         }
         
+        // Quick preset buttons (class="preset-btn" data-preset="<index into EDITOR_PAGE.themePresets>")
+        document.addEventListener('click', (e) => {
+            const btn = e.target.closest('.preset-btn[data-preset]');
+            if (btn) applyPreset(...EDITOR_PAGE.themePresets[+btn.dataset.preset]);
+        });
+        
+        function resetTheme() {
+            applyPreset(...EDITOR_PAGE.themePresets[0]);
+            document.getElementById('theme-headerTitle').value = 'MediaMTX Configuration Editor';
+            document.getElementById('theme-subtitle').value = 'Brought to you by TAKWERX';
+            updateTextPreview();
+        }
+        
         function saveTheme() {
             const theme = {
                 headerColor: document.getElementById('theme-headerColor').value,
@@ -6820,7 +7853,7 @@ HTML_TEMPLATE = '''
         
         // Load logo into styling tab preview if it exists
         (function loadLogoPreview() {
-            {% if logo_exists %}
+            if (!EDITOR_PAGE.logoExists) return;
             const previewImg = document.getElementById('logo-preview-img');
             if (previewImg) {
                 previewImg.src = '/api/theme/logo';
@@ -6828,7 +7861,6 @@ HTML_TEMPLATE = '''
                 const placeholder = document.getElementById('logo-preview-placeholder');
                 if (placeholder) placeholder.style.display = 'none';
             }
-            {% endif %}
         })();
         
         // === END LOGO FUNCTIONS ===
@@ -6872,29 +7904,9 @@ HTML_TEMPLATE = '''
                     if (btn) { btn.disabled = false; btn.textContent = 'Generate Link'; alert('Request failed'); }
                 });
         }
-    </script>
-    <div id="share-link-modal-bg" style="display:none;position:fixed;inset:0;background:rgba(0,0,0,.7);z-index:9999;align-items:center;justify-content:center;">
-        <div style="background:#1e1e1e;border:1px solid #333;border-radius:12px;padding:24px;width:420px;max-width:90vw;">
-            <h3 style="font-size:16px;font-weight:600;margin-bottom:8px;display:flex;align-items:center;gap:8px;"><span style="font-size:20px;">&#128279;</span> Generate Share Link</h3>
-            <p style="font-size:13px;color:#888;margin-bottom:16px;"><span id="share-link-modal-stream-name"></span> – Private Stream</p>
-            <input type="hidden" id="share-link-modal-stream" value="">
-            <label style="display:block;font-size:12px;font-weight:600;color:#888;margin-bottom:6px;text-transform:uppercase;">Link expires in</label>
-            <select id="share-link-modal-ttl" style="width:100%;background:#0e0e0e;border:1px solid #333;border-radius:6px;padding:10px 12px;color:#e0e0e0;font-size:13px;margin-bottom:20px;">
-                <option value="3600">1 hour</option>
-                <option value="14400" selected>4 hours</option>
-                <option value="86400">24 hours</option>
-                <option value="0">Until revoked</option>
-            </select>
-            <div style="display:flex;gap:10px;justify-content:flex-end;">
-                <button type="button" onclick="closeShareLinkModal()" style="padding:8px 18px;border-radius:6px;font-size:13px;background:#2a2a2a;color:#888;border:none;cursor:pointer;">Close</button>
-                <button type="button" id="share-link-modal-generate-btn" onclick="generateShareLinkFromModal()" style="padding:8px 18px;border-radius:6px;font-size:13px;background:#2196F3;color:#fff;border:none;cursor:pointer;">Generate Link</button>
-            </div>
-        </div>
-    </div>
-</body>
-</html>
 '''
 
+
 def load_config():
     """Load MediaMTX configuration - preserves comments"""
     import time
@@ -6942,23 +7954,23 @@ def read_yaml_field(field_name, default=None):
     """Read a single top-level field from mediamtx.yml without ruamel.yaml.
     Handles simple values like strings, yes/no, numbers, and bracket lists."""
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            for line in f:
-                if line.startswith(field_name + ':'):
-                    value = line.split(':', 1)[1].strip()
-                    if not value or value == '':
-                        return default
-                    # Strip quotes
-                    if (value.startswith('"') and value.endswith('"')) or \
-                       (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]
-                    # Parse bracket list like [tcp] or [udp, tcp]
-                    if value.startswith('[') and value.endswith(']'):
-                        inner = value[1:-1].strip()
-                        if not inner:
-                            return []
-                        return [item.strip().strip("'\"") for item in inner.split(',')]
-                    return value
+        lines, _ = _load_config_cached()
+        for line in lines:
+            if line.startswith(field_name + ':'):
+                value = line.split(':', 1)[1].strip()
+                if not value or value == '':
+                    return default
+                # Strip quotes
+                if (value.startswith('"') and value.endswith('"')) or \
+                   (value.startswith("'") and value.endswith("'")):
+                    value = value[1:-1]
+                # Parse bracket list like [tcp] or [udp, tcp]
+                if value.startswith('[') and value.endswith(']'):
+                    inner = value[1:-1].strip()
+                    if not inner:
+                        return []
+                    return [item.strip().strip("'\"") for item in inner.split(',')]
+                return value
     except Exception as e:
         print(f"ERROR reading field {field_name}: {e}", flush=True)
     return default
@@ -6967,9 +7979,8 @@ def read_yaml_users():
     """Read authInternalUsers directly from YAML file without ruamel.yaml.
     Returns a list of user dicts with user, pass, ips, permissions."""
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            lines = f.readlines()
-        
+        lines, _ = _load_config_cached()
+
         users = []
         in_auth_users = False
         current_user = None
@@ -7218,21 +8229,43 @@ def add_group_comments_to_yaml():
         pass
 
 
+# Status polling and page renders share one `systemctl is-active` per second
+SERVICE_STATE_TTL = 1.0
+_service_state_cache = {}
+
+def get_service_state():
+    """Return `systemctl is-active` output for MediaMTX (briefly cached)"""
+    cached = _service_state_cache.get('entry')
+    now = time.monotonic()
+    if cached and now - cached[0] < SERVICE_STATE_TTL:
+        return cached[1]
+    result = subprocess.run(['systemctl', 'is-active', SERVICE_NAME],
+                            capture_output=True, text=True, timeout=3)
+    state = result.stdout.strip()
+    _service_state_cache['entry'] = (now, state)
+    return state
+
+def invalidate_service_state():
+    """Drop the cached service state after starting/stopping MediaMTX"""
+    _service_state_cache.pop('entry', None)
+
 def get_service_status():
     """Get MediaMTX service status"""
     try:
-        result = subprocess.run(['systemctl', 'is-active', SERVICE_NAME], 
-                              capture_output=True, text=True)
-        return {'active': result.stdout.strip() == 'active'}
+        return {'active': get_service_state() == 'active'}
     except:
         return {'active': False}
 
+# Adding or removing a backup bumps the directory's mtime, which invalidates this
+@_mtime_cached(BACKUP_DIR)
 def get_backups():
     """Get list of backup files"""
+    import heapq
     try:
-        files = sorted([f for f in os.listdir(BACKUP_DIR) if f.startswith('mediamtx.yml.')], reverse=True)
-        return files[:10]  # Last 10 backups
-    except:
+        # Last 10 backups (timestamped names sort chronologically) without sorting them all
+        with os.scandir(BACKUP_DIR) as entries:
+            return heapq.nlargest(10, (e.name for e in entries if e.name.startswith('mediamtx.yml.')))
+    except OSError:
         return []
 
 @app.route('/login', methods=['GET', 'POST'])
@@ -7258,13 +8291,22 @@ def login():
             session['role'] = role
             return redirect(url_for('index'))
         else:
-            return render_template_string(LOGIN_TEMPLATE, error='Invalid username or password', first_time=False, theme=theme, logo_exists=logo_exists, registration_enabled=reg_enabled, message=None)
+            return render_template(compiled_template(LOGIN_TEMPLATE), error='Invalid username or password', first_time=False, theme=theme, logo_exists=logo_exists, registration_enabled=reg_enabled, message=None)
     
     # Check if this is first time (default credentials still in use)
-    users = load_users()
-    first_time = any(u['username'] == 'admin' and u['password'] == 'admin' for u in users)
+    first_time = default_admin_active()
     
-    return render_template_string(LOGIN_TEMPLATE, first_time=first_time, error=None, theme=theme, logo_exists=logo_exists, registration_enabled=reg_enabled, message=message)
+    # Same inputs as the copy the browser already has - skip the render and the body
+    etag = page_etag(CURRENT_VERSION, template_digest(LOGIN_TEMPLATE), sorted(theme.items()),
+                     logo_exists, reg_enabled, first_time, message)
+    if request.if_none_match.contains_weak(etag):
+        response = not_modified(etag, weak=True)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+    response = make_response(render_template(compiled_template(LOGIN_TEMPLATE), first_time=first_time, error=None, theme=theme, logo_exists=logo_exists, registration_enabled=reg_enabled, message=message))
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
 
 @app.route('/logout')
 def logout():
@@ -7320,7 +8362,7 @@ def register():
                 error = 'Registration already pending for this username'
         
         if error:
-            return render_template_string(REGISTER_TEMPLATE, error=error, theme=theme, logo_exists=logo_exists,
+            return render_template(compiled_template(REGISTER_TEMPLATE), error=error, theme=theme, logo_exists=logo_exists,
                 full_name=full_name, email=email, agency=agency, username=username, reason=reason)
         
         # Save pending registration
@@ -7367,7 +8409,7 @@ def register():
         
         return redirect('/login?message=Registration submitted! An administrator will review your request.')
     
-    return render_template_string(REGISTER_TEMPLATE, error=None, theme=theme, logo_exists=logo_exists,
+    return render_template(compiled_template(REGISTER_TEMPLATE), error=None, theme=theme, logo_exists=logo_exists,
         full_name='', email='', agency='', username='', reason='')
 
 RESET_TOKENS_FILE = '/opt/mediamtx-webeditor/reset_tokens.json'
@@ -7375,17 +8417,14 @@ RESET_TOKENS_FILE = '/opt/mediamtx-webeditor/reset_tokens.json'
 def load_reset_tokens():
     if os.path.exists(RESET_TOKENS_FILE):
         try:
-            with open(RESET_TOKENS_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            pass
+            return read_json_file(RESET_TOKENS_FILE)
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not read {RESET_TOKENS_FILE}: {e}", flush=True)
     return {}
 
 def save_reset_tokens(tokens):
     os.makedirs(os.path.dirname(RESET_TOKENS_FILE), exist_ok=True)
-    with open(RESET_TOKENS_FILE, 'w') as f:
-        json.dump(tokens, f, indent=2)
-    os.chmod(RESET_TOKENS_FILE, 0o600)
+    write_json_file(RESET_TOKENS_FILE, tokens, mode=0o600)
 
 @app.route('/forgot-password', methods=['GET', 'POST'])
 def forgot_password():
@@ -7592,7 +8631,7 @@ def change_password():
         return redirect(f'/?message=User not found&message_type=danger&tab={tab}')
     
     # Verify current password
-    if current_password != current_user['password']:
+    if not verify_password(current_user['password'], current_password):
         return redirect(f'/?message=Current password is incorrect&message_type=danger&tab={tab}')
     
     # Verify new passwords match
@@ -7609,13 +8648,10 @@ def change_password():
     
     return redirect(f'/?message=Password changed successfully&message_type=success&tab={tab}')
 
-@app.route('/api/status')
-@login_required
-def api_status():
-    """Get MediaMTX service status"""
+def get_service_badge():
+    """MediaMTX service state for the header badge: {'status': ..., 'color': ...}"""
     try:
-        result = subprocess.run(['systemctl', 'is-active', SERVICE_NAME], capture_output=True, text=True)
-        status = result.stdout.strip()
+        status = get_service_state()
         
         if status == 'active':
             state = 'running'
@@ -7627,9 +8663,15 @@ def api_status():
             state = 'stopped'
             color = 'danger'
         
-        return jsonify({'status': state, 'color': color})
+        return {'status': state, 'color': color}
     except:
-        return jsonify({'status': 'unknown', 'color': 'secondary'})
+        return {'status': 'unknown', 'color': 'secondary'}
+
+@app.route('/api/status')
+@login_required
+def api_status():
+    """Get MediaMTX service status"""
+    return jsonify(get_service_badge())
 
 @app.route('/api/streams')
 @login_required
@@ -7647,19 +8689,9 @@ def api_streams():
             group_metadata = load_group_metadata()
             
             # Get HLS domain from MediaMTX config (read from certificate path)
-            hls_domain = None
-            hls_encryption_on = False
-            try:
-                hls_cert = read_yaml_field('hlsServerCert', '')
-                hls_encryption_val = read_yaml_field('hlsEncryption', 'no')
-                hls_encryption_on = hls_encryption_val in ['yes', 'true', True]
-                if hls_cert and isinstance(hls_cert, str):
-                    import re
-                    match = re.search(r'/([a-z0-9.-]+\.[a-z]{2,})/\1\.crt', hls_cert)
-                    if match:
-                        hls_domain = match.group(1)
-            except:
-                pass
+            streaming = get_streaming_domain()
+            hls_domain = streaming['domain']
+            hls_protocol = streaming['protocol']
             
             # Fallback to server IP if domain not found
             if not hls_domain:
@@ -7790,7 +8822,6 @@ def api_streams():
                     if is_hls_localhost_bound():
                         stream_info['hls_url'] = f"/hls-proxy/{path_name}/index.m3u8"
                     else:
-                        hls_protocol = 'https' if hls_encryption_on else 'http'
                         stream_info['hls_url'] = f"{hls_protocol}://{hls_domain}:8888/{path_name}/index.m3u8"
                     # Share mode: public = static /watch/ link, private = token link (only affects link sharing)
                     stream_info['share_mode'] = load_share_mode().get(path_name, 'private')
@@ -8341,16 +9372,47 @@ def api_revoke_mediamtx_user():
     else:
         return jsonify({'success': False, 'error': 'Failed to save config'}), 500
 
-@app.route('/')
+@app.route('/js/editor.<digest>.js')
 @login_required
-def index():
+def editor_script(digest):
+    """Main page JavaScript; the URL changes with the content, so it never needs revalidating"""
+    if digest != template_digest(EDITOR_SCRIPT):
+        return "Not found", 404
+    response = Response(EDITOR_SCRIPT, mimetype='application/javascript')
+    response.set_etag(digest)
+    response.headers['Cache-Control'] = 'private, max-age=31536000, immutable'
+    return response
+
+# Rendered main pages, keyed by the page ETag (which covers every render input)
+PAGE_CACHE_SIZE = 4
+_page_cache = OrderedDict()
+_page_cache_lock = threading.Lock()
+
+# Parsed config used by page renders. Rendering the template itself is cheap;
+# the round-trip YAML parse is not, and it's the same for every tab/message
+# variant of the page until mediamtx.yml changes.
+_page_config_cache = {}
+
+def load_page_config():
+    """load_config() for page renders, reused until mediamtx.yml changes - read-only"""
+    stamp = file_stamp(CONFIG_FILE)
+    cached = _page_config_cache.get('config')
+    if cached and stamp is not None and cached[0] == stamp:
+        return cached[1]
+    config = load_config()
+    if config is not None:
+        _page_config_cache['config'] = (stamp, config)
+    return config
+
+def render_index_page(theme, logo_exists, service_status, backups):
+    """Render the main page HTML, or None if the config can't be loaded"""
     import time
     
     # Retry loading config - can fail briefly after MediaMTX restart
     config = None
     for attempt in range(5):
         try:
-            config = load_config()
+            config = load_page_config()
             if config is not None:
                 break
         except Exception:
@@ -8358,16 +9420,7 @@ def index():
         time.sleep(0.5)
     
     if config is None:
-        return "Error loading configuration file", 500
-    
-    # Get YAML content for advanced editor
-    with open(CONFIG_FILE, 'r') as f:
-        yaml_content = f.read()
-    
-    # Check if agency logo exists
-    import glob
-    logo_matches = glob.glob(LOGO_FILE + '.*')
-    logo_exists = len(logo_matches) > 0
+        return None
     
     # Determine RTSP transport mode for template dropdown
     transports = config.get('rtspTransports', ['tcp'])
@@ -8391,22 +9444,68 @@ def index():
         except:
             pass
     
-    return render_template_string(
-        HTML_TEMPLATE,
+    return render_template(
+        compiled_template(HTML_TEMPLATE),
         config=config,
-        yaml_content=yaml_content,
-        service_status=get_service_status(),
-        backups=get_backups(),
+        service_status=service_status,
+        backups=backups,
         message=request.args.get('message'),
         message_type=request.args.get('message_type', 'info'),
         username=session.get('username', 'admin'),
         tab=request.args.get('tab', 'dashboard'),
         role=session.get('role', 'admin'),
-        theme=load_theme(),
+        theme=theme,
+        page_css=render_page_css(),
+        editor_script_digest=template_digest(EDITOR_SCRIPT),
         logo_exists=logo_exists,
         rtsp_transport_mode=rtsp_transport_mode,
-        pending_count=pending_count
+        pending_count=pending_count,
+        theme_presets=THEME_PRESETS
+    )
+
+@app.route('/')
+@login_required
+def index():
+    import glob
+    
+    # Everything the page is rendered from - if none of it changed, the
+    # browser's copy is still good and we can skip loading/rendering entirely
+    theme = load_theme()
+    logo_exists = len(glob.glob(LOGO_FILE + '.*')) > 0
+    service_status = get_service_status()
+    backups = get_backups()
+    etag = page_etag(
+        CURRENT_VERSION, template_digest(HTML_TEMPLATE), template_digest(HTML_STYLE_TEMPLATE),
+        template_digest(EDITOR_SCRIPT),
+        file_stamp(CONFIG_FILE), file_stamp(PENDING_REG_FILE), request.query_string,
+        session.get('username'), session.get('role'), sorted(theme.items()), logo_exists,
+        service_status['active'], backups,
     )
+    if request.if_none_match.contains_weak(etag):
+        response = not_modified(etag, weak=True)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+    
+    # Same inputs as a page rendered for someone else (or before a browser cache clear) -
+    # hand back that HTML instead of rendering the template again
+    with _page_cache_lock:
+        html = _page_cache.get(etag)
+        if html is not None:
+            _page_cache.move_to_end(etag)
+    if html is None:
+        html = render_index_page(theme, logo_exists, service_status, backups)
+        if html is None:
+            return "Error loading configuration file", 500
+        html = html.encode('utf-8')  # cached encoded, so hits don't re-encode the page
+        with _page_cache_lock:
+            _page_cache[etag] = html
+            while len(_page_cache) > PAGE_CACHE_SIZE:
+                _page_cache.popitem(last=False)
+    
+    response = make_response(html)
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
 
 @app.route('/save_basic', methods=['POST'])
 @admin_required
@@ -8438,6 +9537,14 @@ def save_basic():
 def save_protocols():
     tab = request.form.get('current_tab', 'protocols')
     
+    # The RTSP transport/encryption selects save through fetch() and only need the outcome
+    wants_json = request.headers.get('X-Requested-With') == 'XMLHttpRequest'
+    
+    def finish(message, message_type):
+        if wants_json:
+            return jsonify({'success': message_type == 'success', 'message': message})
+        return redirect(f'/?message={message}&message_type={message_type}&tab={tab}')
+    
     try:
         # Create backup first
         backup_file = os.path.join(BACKUP_DIR, f'mediamtx.yml.{datetime.now().strftime("%Y%m%d_%H%M%S")}')
@@ -8464,17 +9571,17 @@ def save_protocols():
             cert_file = config.get('rtspServerCert', '').strip()
             
             if not cert_key or not cert_file:
-                return redirect(f'/?message=Cannot enable RTSP encryption: Certificate paths not configured!&message_type=danger&tab={tab}')
+                return finish('Cannot enable RTSP encryption: Certificate paths not configured!', 'danger')
             
             if not os.path.exists(cert_key) or not os.path.exists(cert_file):
-                return redirect(f'/?message=Cannot enable RTSP encryption: Certificate files not found!&message_type=danger&tab={tab}')
+                return finish('Cannot enable RTSP encryption: Certificate files not found!', 'danger')
         
         # Validate SRT passphrases
         if srt_publish and (len(srt_publish) < 10 or len(srt_publish) > 79):
-            return redirect(f'/?message=SRT Publish Passphrase must be 10-79 characters&message_type=danger&tab={tab}')
+            return finish('SRT Publish Passphrase must be 10-79 characters', 'danger')
         
         if srt_read and (len(srt_read) < 10 or len(srt_read) > 79):
-            return redirect(f'/?message=SRT Read Passphrase must be 10-79 characters&message_type=danger&tab={tab}')
+            return finish('SRT Read Passphrase must be 10-79 characters', 'danger')
         
         # Use sed to update protocol settings directly - only write values that exist in the form
         if rtsp_port:
@@ -8552,11 +9659,11 @@ def save_protocols():
         # Restart MediaMTX
         subprocess.run(['sudo', 'systemctl', 'restart', SERVICE_NAME], check=True)
         time.sleep(3)
-        return redirect(f'/?message=Protocol settings saved and MediaMTX restarted successfully!&message_type=success&tab={tab}')
+        return finish('Protocol settings saved and MediaMTX restarted successfully!', 'success')
         
     except Exception as e:
         print(f"ERROR saving protocols: {e}", flush=True)
-        return redirect(f'/?message=Failed to save settings: {str(e)}&message_type=danger&tab={tab}')
+        return finish(f'Failed to save settings: {str(e)}', 'danger')
 
 @app.route('/save_hls', methods=['POST'])
 @admin_required
@@ -8665,7 +9772,10 @@ def service_control(action):
     tab = request.form.get('current_tab', 'service')
     try:
         if action in ['start', 'stop', 'restart']:
-            subprocess.run(['systemctl', action, SERVICE_NAME], check=True)
+            try:
+                subprocess.run(['systemctl', action, SERVICE_NAME], check=True)
+            finally:
+                invalidate_service_state()
             action_past = 'stopped' if action == 'stop' else (action + 'ed')
             return redirect(f'/?message=Service {action_past} successfully&message_type=success&tab={tab}')
         else:
@@ -8707,30 +9817,63 @@ def restore_backup(backup_name):
     except Exception as e:
         return redirect(f'/?message=Failed to restore backup: {str(e)}&message_type=danger')
 
+# A log stream ends after this long (the browser's EventSource reconnects), and
+# sends a keepalive comment when journalctl is quiet so a closed tab is noticed
+# and its journalctl process cleaned up instead of waiting for the next log line.
+LOG_STREAM_MAX_SECONDS = 3600
+LOG_STREAM_KEEPALIVE_SECONDS = 15
+LOG_STREAM_RETRY_MS = 1000  # browser reconnect delay, sent as the stream's retry: field
+
 @app.route('/stream_logs')
 @login_required
 def stream_logs():
     """Stream MediaMTX logs in real-time using Server-Sent Events"""
+    import select
+    
+    # The browser only sends Last-Event-ID when it reconnects by itself - the
+    # page already shows the backlog then, so just carry on from now
+    backlog = '0' if request.headers.get('Last-Event-ID') else '50'
+    
     def generate():
+        # Tell the browser how soon to reconnect, and give it an event ID so a
+        # reconnect can be told apart from a fresh open
+        yield f"retry: {LOG_STREAM_RETRY_MS}\nid: journal\n\n"
+        
         # Start journalctl process
         process = subprocess.Popen(
-            ['journalctl', '-u', SERVICE_NAME, '-f', '-n', '50'],
+            ['journalctl', '-u', SERVICE_NAME, '-f', '-n', backlog],
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True,
-            bufsize=1
+            stderr=subprocess.DEVNULL
         )
+        deadline = time.monotonic() + LOG_STREAM_MAX_SECONDS
+        pending = b''
         
         try:
-            for line in iter(process.stdout.readline, ''):
-                if line:
-                    # Send log line as Server-Sent Event
-                    yield f"data: {line.strip()}\n\n"
+            while time.monotonic() < deadline:
+                ready, _, _ = select.select([process.stdout], [], [], LOG_STREAM_KEEPALIVE_SECONDS)
+                if not ready:
+                    yield ": keepalive\n\n"
+                    continue
+                chunk = os.read(process.stdout.fileno(), 65536)
+                if not chunk:
+                    break
+                # Send complete log lines as Server-Sent Events, one write per chunk
+                *lines, pending = (pending + chunk).split(b'\n')
+                events = ''.join(f"data: {line.decode('utf-8', 'replace').strip()}\n\n" for line in lines if line.strip())
+                if events:
+                    yield events
         finally:
             process.terminate()
-            process.wait()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
     
-    return app.response_class(generate(), mimetype='text/event-stream')
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # don't let a reverse proxy buffer the stream
+    return response
 
 
 @app.route('/api/yaml/content')
@@ -8744,9 +9887,7 @@ def api_yaml_content():
         return str(e), 500
 
 # Test video directory
-TEST_VIDEO_DIR = '/opt/mediamtx-webeditor/test_videos'
-if not os.path.exists(TEST_VIDEO_DIR):
-    os.makedirs(TEST_VIDEO_DIR)
+TEST_VIDEO_DIR = '/opt/mediamtx-webeditor/test_videos'  # created by ensure_runtime_dirs()
 
 @app.route('/api/test/upload', methods=['POST'])
 @login_required
@@ -10238,6 +11379,19 @@ def remove_firewall_rule():
 MEDIAMTX_GITHUB_API = 'https://api.github.com/repos/bluenviron/mediamtx/releases/latest'
 MEDIAMTX_BINARY = '/usr/local/bin/mediamtx'
 
+_mediamtx_version_cache = {}
+
+def get_mediamtx_version_output():
+    """Run `mediamtx --version` once per binary (re-run when the file is replaced)"""
+    st = os.stat(MEDIAMTX_BINARY)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _mediamtx_version_cache.get('entry')
+    if cached and cached[0] == key:
+        return cached[1]
+    result = subprocess.run([MEDIAMTX_BINARY, '--version'], capture_output=True, text=True, timeout=5)
+    _mediamtx_version_cache['entry'] = (key, result)
+    return result
+
 @app.route('/api/mediamtx/version/check')
 @admin_required
 def check_mediamtx_version():
@@ -10249,12 +11403,11 @@ def check_mediamtx_version():
         # Get installed version
         installed_version = 'unknown'
         try:
-            result = subprocess.run([MEDIAMTX_BINARY, '--version'], capture_output=True, text=True, timeout=5)
+            result = get_mediamtx_version_output()
             # Output is typically just the version like "v1.16.1" or "1.16.1"
             version_output = result.stdout.strip() or result.stderr.strip()
             # Extract version - look for pattern like v1.16.1 or 1.16.1
-            import re
-            match = re.search(r'v?(\d+\.\d+\.\d+)', version_output)
+            match = _VERSION_RE.search(version_output)
             if match:
                 installed_version = 'v' + match.group(1)
         except Exception as e:
@@ -10340,7 +11493,7 @@ def upgrade_mediamtx():
         # Get current version before stopping
         previous_version = ''
         try:
-            ver_result = subprocess.run([MEDIAMTX_BINARY, '--version'], capture_output=True, text=True, timeout=5)
+            ver_result = get_mediamtx_version_output()
             previous_version = ver_result.stdout.strip() if ver_result.returncode == 0 else ''
         except:
             pass
@@ -10673,8 +11826,7 @@ def rollback_mediamtx():
             )
             
             # Look for "json: unknown field "fieldName""
-            import re
-            match = re.search(r'unknown field "([^"]+)"', log_result.stdout)
+            match = _UNKNOWN_FIELD_RE.search(log_result.stdout)
             if match:
                 bad_field = match.group(1)
                 print(f"ROLLBACK: Removing incompatible field '{bad_field}' from YAML (attempt {attempt+1})", flush=True)
@@ -10774,7 +11926,7 @@ def rollback_status():
 @login_required
 def get_theme_settings():
     """Get current theme settings"""
-    return jsonify(load_theme())
+    return jsonify(dict(load_theme()))
 
 @app.route('/api/theme/settings', methods=['POST'])
 @admin_required
@@ -10794,10 +11946,8 @@ def save_theme_settings():
         }
         
         # Basic hex color validation
-        import re
-        hex_pattern = re.compile(r'^#[0-9a-fA-F]{6}$')
         for key in ['headerColor', 'headerColorEnd', 'accentColor']:
-            if not hex_pattern.match(theme[key]):
+            if not _HEX_COLOR_RE.match(theme[key]):
                 return jsonify({'success': False, 'error': f'Invalid color format for {key}: {theme[key]}'}), 400
         
         save_theme(theme)
@@ -10809,13 +11959,37 @@ def save_theme_settings():
 
 # === LOGO ENDPOINTS ===
 
+_logo_etags = {}
+
+def _logo_etag(path, st):
+    """Strong ETag for the logo file, recomputed only when mtime/size change"""
+    import hashlib
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _logo_etags.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    etag = hashlib.blake2b(f"{path}-{st.st_mtime_ns}-{st.st_size}".encode(), digest_size=12).hexdigest()
+    _logo_etags[path] = (key, etag)
+    return etag
+
 @app.route('/api/theme/logo')
 def get_logo():
     """Serve the uploaded agency logo (no auth required so login page can show it)"""
     import glob
     matches = glob.glob(LOGO_FILE + '.*')
-    if matches and os.path.exists(matches[0]):
-        return send_file(matches[0])
+    if matches:
+        try:
+            st = os.stat(matches[0])
+        except OSError:
+            return '', 404
+        etag = _logo_etag(matches[0], st)
+        # The <img> URLs carry no version, so let browsers keep the file but revalidate each load
+        if etag in request.if_none_match:
+            response = not_modified(etag)
+        else:
+            response = send_file(matches[0], etag=etag)
+        response.cache_control.no_cache = True
+        return response
     return '', 404
 
 @app.route('/api/theme/logo', methods=['POST'])
@@ -10878,18 +12052,15 @@ def load_external_sources_metadata():
     """Load external sources metadata (tracks which paths are external sources)"""
     if os.path.exists(EXTERNAL_SOURCES_FILE):
         try:
-            with open(EXTERNAL_SOURCES_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            pass
+            return read_json_file(EXTERNAL_SOURCES_FILE)
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not read {EXTERNAL_SOURCES_FILE}: {e}", flush=True)
     return {}
 
 def save_external_sources_metadata(metadata):
     """Save external sources metadata"""
     os.makedirs(os.path.dirname(EXTERNAL_SOURCES_FILE), exist_ok=True)
-    with open(EXTERNAL_SOURCES_FILE, 'w') as f:
-        json.dump(metadata, f, indent=2)
-    os.chmod(EXTERNAL_SOURCES_FILE, 0o600)
+    write_json_file(EXTERNAL_SOURCES_FILE, metadata, mode=0o600)
 
 @app.route('/api/external-sources')
 @login_required
@@ -10961,8 +12132,7 @@ def api_add_external_source():
             return jsonify({'success': False, 'error': f'Unsupported URL scheme. Supported: SRT, RTSP, UDP MPEG-TS, RTMP, HLS'}), 400
         
         # Validate name: lowercase, numbers, underscores
-        import re
-        if not re.match(r'^[a-z0-9_]+$', name):
+        if not _SOURCE_NAME_RE.match(name):
             return jsonify({'success': False, 'error': 'Name must be lowercase letters, numbers, and underscores only'}), 400
         
         # Check reserved names
@@ -11036,8 +12206,7 @@ def api_add_external_source():
         # Auto-create UFW rule for UDP sources
         if source_url.startswith('udp+mpegts://'):
             try:
-                import re
-                port_match = re.search(r':(\d+)', source_url.replace('udp+mpegts://', ''))
+                port_match = _PORT_RE.search(source_url.replace('udp+mpegts://', ''))
                 if port_match:
                     udp_port = port_match.group(1)
                     subprocess.run(['sudo', 'ufw', 'allow', f'{udp_port}/udp'], 
@@ -11083,6 +12252,7 @@ def api_delete_external_source():
         new_lines = []
         skip_block = False
         in_paths = False
+        path_re = _path_entry_re(name)
         
         for i, line in enumerate(lines):
             # Track if we're in paths section
@@ -11112,8 +12282,7 @@ def api_delete_external_source():
             # Check if this line starts the path block we want to delete
             if in_paths and not skip_block:
                 # Match "  name:" with exactly 2-space indent
-                import re
-                if re.match(r'^  ' + re.escape(name) + r':\s*$', line):
+                if path_re.match(line):
                     skip_block = True
                     continue  # Skip the path name line
             
@@ -11126,8 +12295,7 @@ def api_delete_external_source():
         source_url = sources_metadata[name].get('source_url', '')
         if source_url.startswith('udp+mpegts://'):
             try:
-                import re
-                port_match = re.search(r':(\d+)', source_url.replace('udp+mpegts://', ''))
+                port_match = _PORT_RE.search(source_url.replace('udp+mpegts://', ''))
                 if port_match:
                     udp_port = port_match.group(1)
                     subprocess.run(['sudo', 'ufw', 'delete', 'allow', f'{udp_port}/udp'],
@@ -11178,6 +12346,7 @@ def api_toggle_external_source():
             new_lines = []
             skip_block = False
             in_paths = False
+            path_re = _path_entry_re(name)
             
             for i, line in enumerate(lines):
                 if line.strip() == 'paths:' or line.startswith('paths:'):
@@ -11198,8 +12367,7 @@ def api_toggle_external_source():
                         continue
                 
                 if in_paths and not skip_block:
-                    import re
-                    if re.match(r'^  ' + re.escape(name) + r':\s*$', line):
+                    if path_re.match(line):
                         skip_block = True
                         continue
                 
@@ -11346,11 +12514,11 @@ def api_edit_external_source():
             new_lines = []
             in_our_path = False
             on_demand_value = 'yes' if on_demand else 'no'
+            path_re = _path_entry_re(name)
             
             for i, line in enumerate(lines):
-                import re
                 # Detect our path entry
-                if re.match(r'^  ' + re.escape(name) + r':\s*$', line):
+                if path_re.match(line):
                     in_our_path = True
                     new_lines.append(line)
                     continue
@@ -11398,7 +12566,7 @@ def _get_default_network_interface():
             capture_output=True, text=True, timeout=5
         )
         if r.returncode == 0 and r.stdout:
-            m = re.search(r'\bdev\s+(\S+)', r.stdout)
+            m = _ROUTE_DEV_RE.search(r.stdout)
             if m:
                 return m.group(1).strip()
         r = subprocess.run(
@@ -11407,7 +12575,7 @@ def _get_default_network_interface():
         )
         if r.returncode == 0 and r.stdout:
             for line in r.stdout.splitlines():
-                m = re.match(r'^\d+:\s+(\S+):', line)
+                m = _LINK_NAME_RE.match(line)
                 if m and m.group(1) != 'lo' and not m.group(1).startswith('ifb'):
                     return m.group(1).strip()
     except (FileNotFoundError, subprocess.TimeoutExpired):
@@ -11456,8 +12624,8 @@ def api_ku_band_simulator_on_for_source():
         if not os.path.isfile(conf_path) and os.path.isfile(example_path):
             with open(example_path, 'r') as f:
                 conf_content = f.read()
-            conf_content = re.sub(r'^SOURCE_IP=.*', f'SOURCE_IP={source_ip}', conf_content, flags=re.MULTILINE)
-            conf_content = re.sub(r'^INTERFACE=.*', f'INTERFACE={interface}', conf_content, flags=re.MULTILINE)
+            conf_content = _SOURCE_IP_LINE_RE.sub(f'SOURCE_IP={source_ip}', conf_content)
+            conf_content = _INTERFACE_LINE_RE.sub(f'INTERFACE={interface}', conf_content)
             try:
                 with open(conf_path, 'w') as f:
                     f.write(conf_content)
@@ -11468,8 +12636,8 @@ def api_ku_band_simulator_on_for_source():
             if os.path.isfile(conf_path):
                 with open(conf_path, 'r') as f:
                     conf_content = f.read()
-                conf_content = re.sub(r'^SOURCE_IP=.*', f'SOURCE_IP={source_ip}', conf_content, flags=re.MULTILINE)
-                conf_content = re.sub(r'^INTERFACE=.*', f'INTERFACE={interface}', conf_content, flags=re.MULTILINE)
+                conf_content = _SOURCE_IP_LINE_RE.sub(f'SOURCE_IP={source_ip}', conf_content)
+                conf_content = _INTERFACE_LINE_RE.sub(f'INTERFACE={interface}', conf_content)
                 with open(conf_path, 'w') as f:
                     f.write(conf_content)
             else:
@@ -11840,150 +13008,314 @@ if not LDAP_OVERLAY_ACTIVE:
 
 # === DASHBOARD ENDPOINTS ===
 
-@app.route('/api/dashboard/metrics')
-@login_required
-def get_dashboard_metrics():
-    """Get all dashboard metrics in one call"""
+# System stats are sampled by one background thread and shared by every
+# dashboard client, so polling never blocks a request on psutil or a disk walk.
+# The recordings directory can hold thousands of files, so it's sized less often.
+METRICS_SAMPLE_INTERVAL = 2.0
+RECORDINGS_SIZE_INTERVAL = 10.0
+_metrics = {}
+_metrics_lock = threading.Lock()
+_metrics_ready = threading.Event()
+_metrics_sampled = threading.Condition(_metrics_lock)  # notified after every sample
+_metrics_generation = 0  # bumped with every sample
+_metrics_thread = None
+
+def _find_mediamtx_process():
+    """Return the running MediaMTX psutil.Process, or None"""
+    import psutil
+    for proc in psutil.process_iter(['name']):
+        if 'mediamtx' in (proc.info.get('name') or ''):
+            return proc
+    return None
+
+def _recordings_size(path=None):
+    """Total size in bytes of the files under RECORDINGS_DIR"""
+    total = 0
     try:
-        metrics = {}
-        
-        # Get MediaMTX API stats for active streams/viewers
+        with os.scandir(path or RECORDINGS_DIR) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        total += _recordings_size(entry.path)
+                    elif entry.is_file():
+                        total += entry.stat().st_size
+                except OSError:
+                    pass  # deleted mid-walk
+    except OSError:
+        pass
+    return total
+
+def _metrics_sampler():
+    """Background loop: refresh CPU/RAM/network/disk/uptime every METRICS_SAMPLE_INTERVAL"""
+    global _metrics_generation
+    import psutil  # loaded here so startup and non-dashboard requests skip it
+    cpu_interval = 0.1  # first reading needs a short window, later ones use the counters
+    prev_net = psutil.net_io_counters()
+    prev_time = time.time()
+    proc = None
+    recordings_size = 0
+    recordings_sized_at = 0
+    while True:
         try:
-            api_url = 'http://localhost:9997/v3/paths/list'
-            api_response = subprocess.run(
-                ['curl', '-s', api_url],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            
-            if api_response.returncode == 0:
-                paths_data = json.loads(api_response.stdout)
-                active_streams = 0
-                total_viewers = 0
-                streams_list = []
-                
-                if 'items' in paths_data:
-                    # Build a map of live/ paths (subtract 1 for internal FFmpeg)
-                    live_paths = {}
-                    for path in paths_data['items']:
-                        path_name = path.get('name', '')
-                        if path_name.startswith('live/'):
-                            stream_name = path_name[5:]  # Remove 'live/' prefix
+            cpu = psutil.cpu_percent(interval=cpu_interval)
+            cpu_interval = None
+            mem = psutil.virtual_memory()
+
+            net = psutil.net_io_counters()
+            now = time.time()
+            time_delta = now - prev_time
+            if time_delta > 0 and _metrics_ready.is_set():
+                rx_rate = (net.bytes_recv - prev_net.bytes_recv) / time_delta
+                tx_rate = (net.bytes_sent - prev_net.bytes_sent) / time_delta
+            else:
+                rx_rate = tx_rate = 0
+            prev_net, prev_time = net, now
+
+            if proc is None or not proc.is_running():
+                proc = _find_mediamtx_process()
+            uptime = 0
+            if proc is not None:
+                try:
+                    with proc.oneshot():
+                        uptime = now - proc.create_time()
+                except psutil.Error:
+                    proc = None
+
+            disk = psutil.disk_usage('/')
+            if now - recordings_sized_at >= RECORDINGS_SIZE_INTERVAL:
+                recordings_size = _recordings_size()
+                recordings_sized_at = now
+
+            with _metrics_lock:
+                _metrics.update({
+                    'cpu_percent': cpu,
+                    'ram_percent': mem.percent,
+                    'ram_used': mem.used,
+                    'ram_total': mem.total,
+                    'network_rx_rate': rx_rate,
+                    'network_tx_rate': tx_rate,
+                    'uptime': uptime,
+                    'disk_percent': disk.percent,
+                    'disk_used': disk.used,
+                    'disk_total': disk.total,
+                    'disk_free': disk.free,
+                    'recordings_size': recordings_size,
+                })
+                _metrics_generation += 1
+                _metrics_sampled.notify_all()
+            _metrics_ready.set()
+        except Exception as e:
+            print(f"Metrics sampler error: {e}", flush=True)
+        time.sleep(METRICS_SAMPLE_INTERVAL)
+
+def get_metrics_snapshot():
+    """Latest sampled system stats; starts the sampler thread on first use"""
+    global _metrics_thread
+    if _metrics_thread is None:
+        with _metrics_lock:
+            if _metrics_thread is None:
+                _metrics_thread = threading.Thread(target=_metrics_sampler, name='metrics-sampler', daemon=True)
+                _metrics_thread.start()
+    _metrics_ready.wait(1.0)
+    with _metrics_lock:
+        return dict(_metrics)
+
+def wait_for_metrics_sample(timeout):
+    """Block until the sampler publishes its next reading (or timeout)"""
+    with _metrics_sampled:
+        _metrics_sampled.wait(timeout)
+
+def collect_stream_stats():
+    """Active stream and viewer counts from the MediaMTX API (zeros when it's unreachable)"""
+    metrics = {}
+    
+    # Get MediaMTX API stats for active streams/viewers
+    try:
+        api_url = 'http://localhost:9997/v3/paths/list'
+        api_response = subprocess.run(
+            ['curl', '-s', api_url],
+            capture_output=True,
+            text=True,
+            timeout=2
+        )
+        
+        if api_response.returncode == 0:
+            paths_data = json.loads(api_response.stdout)
+            active_streams = 0
+            total_viewers = 0
+            streams_list = []
+            stream_count = 0
+            
+            if 'items' in paths_data:
+                ext_sources = load_external_sources_metadata()
+                # Build a map of live/ paths (subtract 1 for internal FFmpeg)
+                live_paths = {}
+                for path in paths_data['items']:
+                    path_name = path.get('name', '')
+                    if path_name.startswith('live/'):
+                        stream_name = path_name[5:]  # Remove 'live/' prefix
+                        readers_data = path.get('readers', [])
+                        if isinstance(readers_data, list):
+                            # Subtract 1 for internal FFmpeg reader
+                            live_readers = max(0, len(readers_data) - 1)
+                            live_paths[stream_name] = live_readers
+                        else:
+                            live_paths[stream_name] = max(0, (readers_data or 0) - 1)
+                
+                # Process main paths and add live/ viewers
+                for path in paths_data['items']:
+                    path_name = path.get('name', '')
+                    # Skip internal paths and live/ paths
+                    if path_name and path_name != 'all' and not path_name.startswith('live/'):
+                        # Header badge: same rule as /api/streams (pull sources only once video flows)
+                        if path.get('ready', False) or (path.get('source') and path_name not in ext_sources):
+                            stream_count += 1
+                        # Count streams that are ready (have active source)
+                        if path.get('ready', False):
+                            active_streams += 1
                             readers_data = path.get('readers', [])
+                            # readers can be a list (count length) or int (use directly)
                             if isinstance(readers_data, list):
-                                # Subtract 1 for internal FFmpeg reader
-                                live_readers = max(0, len(readers_data) - 1)
-                                live_paths[stream_name] = live_readers
+                                readers = len(readers_data)
                             else:
-                                live_paths[stream_name] = max(0, (readers_data or 0) - 1)
-                    
-                    # Process main paths and add live/ viewers
-                    for path in paths_data['items']:
-                        path_name = path.get('name', '')
-                        # Skip internal paths and live/ paths
-                        if path_name and path_name != 'all' and not path_name.startswith('live/'):
-                            # Count streams that are ready (have active source)
-                            if path.get('ready', False):
-                                active_streams += 1
-                                readers_data = path.get('readers', [])
-                                # readers can be a list (count length) or int (use directly)
-                                if isinstance(readers_data, list):
-                                    readers = len(readers_data)
-                                else:
-                                    readers = readers_data or 0
-                                
-                                # Add live/ viewers (minus FFmpeg)
-                                if path_name in live_paths:
-                                    readers += live_paths[path_name]
-                                
-                                total_viewers += readers
-                                
-                                streams_list.append({
-                                    'name': path_name,
-                                    'readers': readers,
-                                    'source': path.get('sourceType', 'Unknown')
-                                })
-                
-                metrics['active_streams'] = active_streams
-                metrics['total_viewers'] = total_viewers
-                metrics['streams'] = streams_list
-        except:
-            metrics['active_streams'] = 0
-            metrics['total_viewers'] = 0
-            metrics['streams'] = []
-        
-        # Get system CPU and RAM usage
-        metrics['cpu_percent'] = psutil.cpu_percent(interval=0.1)
-        mem = psutil.virtual_memory()
-        metrics['ram_percent'] = mem.percent
-        metrics['ram_used'] = mem.used
-        metrics['ram_total'] = mem.total
-        
-        # Get disk usage
-        disk = psutil.disk_usage('/')
-        metrics['disk_percent'] = disk.percent
-        metrics['disk_used'] = disk.used
-        metrics['disk_total'] = disk.total
-        metrics['disk_free'] = disk.free
-        
-        # Get network I/O rate (bandwidth)
-        # Store previous values to calculate rate
-        if not hasattr(get_dashboard_metrics, 'prev_net_io'):
-            get_dashboard_metrics.prev_net_io = psutil.net_io_counters()
-            get_dashboard_metrics.prev_time = time.time()
-            metrics['network_rx_rate'] = 0
-            metrics['network_tx_rate'] = 0
-        else:
-            current_net_io = psutil.net_io_counters()
-            current_time = time.time()
-            time_delta = current_time - get_dashboard_metrics.prev_time
-            
-            if time_delta > 0:
-                # Calculate bytes per second
-                rx_rate = (current_net_io.bytes_recv - get_dashboard_metrics.prev_net_io.bytes_recv) / time_delta
-                tx_rate = (current_net_io.bytes_sent - get_dashboard_metrics.prev_net_io.bytes_sent) / time_delta
-                
-                metrics['network_rx_rate'] = rx_rate
-                metrics['network_tx_rate'] = tx_rate
-                
-                # Update previous values
-                get_dashboard_metrics.prev_net_io = current_net_io
-                get_dashboard_metrics.prev_time = current_time
-            else:
-                metrics['network_rx_rate'] = 0
-                metrics['network_tx_rate'] = 0
-        
-        # Get recordings size
-        recordings_size = 0
-        if os.path.exists(RECORDINGS_DIR):
-            for root, dirs, files in os.walk(RECORDINGS_DIR):
-                for file in files:
-                    filepath = os.path.join(root, file)
-                    if os.path.isfile(filepath):
-                        recordings_size += os.path.getsize(filepath)
-        metrics['recordings_size'] = recordings_size
-        
-        # Get server uptime (MediaMTX process)
-        try:
-            mediamtx_pid = subprocess.run(
-                ['pgrep', 'mediamtx'],
-                capture_output=True,
-                text=True
-            )
-            if mediamtx_pid.returncode == 0:
-                pid = int(mediamtx_pid.stdout.strip().split()[0])
-                process = psutil.Process(pid)
-                metrics['uptime'] = time.time() - process.create_time()
-            else:
-                metrics['uptime'] = 0
-        except:
-            metrics['uptime'] = 0
-        
+                                readers = readers_data or 0
+                            
+                            # Add live/ viewers (minus FFmpeg)
+                            if path_name in live_paths:
+                                readers += live_paths[path_name]
+                            
+                            total_viewers += readers
+                            
+                            streams_list.append({
+                                'name': path_name,
+                                'readers': readers,
+                                'source': path.get('sourceType', 'Unknown')
+                            })
+            
+            metrics['stream_count'] = stream_count
+            metrics['active_streams'] = active_streams
+            metrics['total_viewers'] = total_viewers
+            metrics['streams'] = streams_list
+    except:
+        metrics['stream_count'] = 0
+        metrics['active_streams'] = 0
+        metrics['total_viewers'] = 0
+        metrics['streams'] = []
+    
+    return metrics
+
+def collect_system_stats():
+    """CPU/RAM/network/disk/uptime and recordings usage from the background sampler"""
+    snapshot = get_metrics_snapshot()
+    return {key: snapshot.get(key, 0) for key in (
+        'cpu_percent', 'ram_percent', 'ram_used', 'ram_total',
+        'network_rx_rate', 'network_tx_rate', 'uptime',
+        'disk_percent', 'disk_used', 'disk_total', 'disk_free', 'recordings_size')}
+
+@app.route('/api/dashboard/metrics')
+@login_required
+def get_dashboard_metrics():
+    """Get all dashboard metrics in one call"""
+    try:
+        metrics = collect_stream_stats()
+        metrics.update(collect_system_stats())
         return jsonify(metrics)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def build_dashboard_tick(with_system):
+    """Header badges, plus the dashboard stats when with_system is set"""
+    tick = {'service': get_service_badge()}
+    tick.update(collect_stream_stats())
+    tick.pop('streams', None)
+    if with_system:
+        tick.update(collect_system_stats())
+    return tick
+
+@app.route('/api/dashboard/tick')
+@login_required
+def get_dashboard_tick():
+    """Header badges, plus the dashboard stats with ?system=1, in one poll"""
+    try:
+        # Quiet servers mostly return the same tick - let the client skip the body and the repaint
+        import hashlib
+        response = jsonify(build_dashboard_tick(request.args.get('system') == '1'))
+        etag = hashlib.blake2b(response.get_data(), digest_size=8).hexdigest()
+        if etag in request.if_none_match:
+            return not_modified(etag)
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# The open dashboard gets its ticks pushed over Server-Sent Events instead of
+# polling: one event per sampler reading, and only when the tick changed.
+# Like the log stream it ends after a while (EventSource reconnects) and sends
+# keepalive comments so a closed tab is noticed. Every stream holds a waitress
+# thread, so only DASHBOARD_STREAM_MAX_CLIENTS are served at once - past that
+# the request is refused and the page polls /api/dashboard/tick instead.
+DASHBOARD_STREAM_MAX_SECONDS = 3600
+DASHBOARD_STREAM_KEEPALIVE_SECONDS = 15
+DASHBOARD_STREAM_MAX_CLIENTS = 4
+_dashboard_streams = 0
+_dashboard_streams_lock = threading.Lock()
+# The streamed tick is built once per sampler reading and shared by every stream,
+# so open dashboards don't each ask the MediaMTX API for stream counts
+_shared_tick = (None, None)  # (sample generation, tick JSON)
+_shared_tick_lock = threading.Lock()
+
+def shared_dashboard_tick():
+    """The full dashboard tick as JSON, rebuilt only when a new sample is in"""
+    global _shared_tick
+    with _shared_tick_lock:
+        with _metrics_lock:
+            generation = _metrics_generation
+        if _shared_tick[0] != generation:
+            _shared_tick = (generation, app.json.dumps(build_dashboard_tick(True)))
+        return _shared_tick[1]
+
+def _release_dashboard_stream():
+    """Give a closed dashboard stream's slot back"""
+    global _dashboard_streams
+    with _dashboard_streams_lock:
+        _dashboard_streams -= 1
+
+@app.route('/api/dashboard/stream')
+@login_required
+def stream_dashboard():
+    """Push dashboard ticks as Server-Sent Events whenever they change"""
+    global _dashboard_streams
+    with _dashboard_streams_lock:
+        if _dashboard_streams >= DASHBOARD_STREAM_MAX_CLIENTS:
+            return jsonify({'error': 'Too many live dashboards open - polling instead'}), 503
+        _dashboard_streams += 1
+    
+    def generate():
+        deadline = time.monotonic() + DASHBOARD_STREAM_MAX_SECONDS
+        last_data = None
+        last_sent = time.monotonic()
+        while time.monotonic() < deadline:
+            try:
+                data = shared_dashboard_tick()
+            except Exception as e:
+                print(f"Dashboard stream error: {e}", flush=True)
+                data = last_data
+            if data != last_data:
+                yield f"data: {data}\n\n"
+                last_data = data
+                last_sent = time.monotonic()
+            elif time.monotonic() - last_sent >= DASHBOARD_STREAM_KEEPALIVE_SECONDS:
+                yield ": keepalive\n\n"
+                last_sent = time.monotonic()
+            wait_for_metrics_sample(METRICS_SAMPLE_INTERVAL * 2)
+    
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # don't let a reverse proxy buffer the stream
+    response.call_on_close(_release_dashboard_stream)  # runs even if the client left before the first event
+    return response
+
 # === END DASHBOARD ENDPOINTS ===
 
 if __name__ == '__main__':
@@ -12088,4 +13420,24 @@ if __name__ == '__main__':
     print("Press Ctrl+C to stop")
     print("="*50)
     
-    app.run(host='0.0.0.0', port=5000, debug=False)
+    # Compile the page templates (or load them from the bytecode cache) in the
+    # background now, so the first login and page view don't wait for it
+    def warm_templates():
+        for source in (LOGIN_TEMPLATE, HTML_STYLE_TEMPLATE, HTML_TEMPLATE):
+            try:
+                compiled_template(source)
+            except Exception as e:
+                print(f"Warning: could not precompile template: {e}", flush=True)
+    threading.Thread(target=warm_templates, name='template-warmup', daemon=True).start()
+    
+    # Prefer a production WSGI server when one is installed; the Flask server
+    # is the fallback so a plain `python3 mediamtx_config_editor.py` always works
+    try:
+        from waitress import serve
+    except ImportError:
+        serve = None
+    if serve is not None:
+        print(f"Serving with waitress ({WEB_SERVER_THREADS} threads)", flush=True)
+        serve(app, host='0.0.0.0', port=5000, threads=WEB_SERVER_THREADS, ident='MediaMTX-WebEditor')
+    else:
+        app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)